@@ -0,0 +1,54 @@
+"""
+asyncio helpers for running blocking fabric_launcher calls concurrently in the examples.
+
+The fabric_launcher functions use blocking HTTP calls, so they are run in worker
+threads via asyncio.to_thread. A semaphore bounds how many run at once to stay
+clear of Fabric API throttling.
+"""
+
+import asyncio
+
+from fabric_launcher import create_accelerated_shortcut_in_kql_db
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+async def create_accelerated_shortcuts_async(
+    tables: list[str],
+    workspace_id: str,
+    eventhouse_name: str,
+    kql_db_name: str,
+    source_lakehouse_name: str,
+    client,
+    notebookutils,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> dict[str, bool]:
+    """
+    Run create_accelerated_shortcut_in_kql_db() for several tables concurrently.
+
+    Returns:
+        Dictionary mapping each table to True if its accelerated shortcut was created
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(shortcut_name: str, source_path: str) -> bool:
+        async with semaphore:
+            return await asyncio.to_thread(
+                create_accelerated_shortcut_in_kql_db,
+                target_workspace_id=workspace_id,
+                target_kql_db_name=kql_db_name,
+                target_shortcut_name=shortcut_name,
+                source_workspace_id=workspace_id,
+                source_path=source_path,
+                target_eventhouse_name=eventhouse_name,
+                source_lakehouse_name=source_lakehouse_name,
+                client=client,
+                notebookutils=notebookutils,
+            )
+
+    table_specs = [(table, table.capitalize(), f"Tables/{table}") for table in tables]
+    results = await asyncio.gather(
+        *(run_one(shortcut_name, source_path) for _, shortcut_name, source_path in table_specs),
+        return_exceptions=True,
+    )
+    return {table: result is True for table, result in zip(tables, results, strict=True)}
@@ -0,0 +1,32 @@
+"""
+Shared Fabric clients for the example scripts.
+
+Each example entry point used to create its own FabricRestClient and look up the
+workspace ID again. These helpers create them once per process so the underlying
+HTTP session and token are reused across examples.
+"""
+
+from functools import lru_cache
+
+from _http_tuning import tune_client
+from _ratelimit import TokenBucket
+
+# Shared by every request the example client makes, including those from thread pools
+RATE_LIMITER = TokenBucket()
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """Get the process-wide Fabric REST client, with a pooled, rate-limited HTTPS session."""
+    # Imported on first use: sempy pulls in pandas and pyarrow, which importing the examples doesn't need
+    import sempy.fabric as fabric
+
+    return tune_client(fabric.FabricRestClient(), rate_limiter=RATE_LIMITER)
+
+
+@lru_cache(maxsize=1)
+def get_workspace_id() -> str:
+    """Get the ID of the workspace the notebook is attached to."""
+    import sempy.fabric as fabric
+
+    return fabric.get_workspace_id()
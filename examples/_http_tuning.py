@@ -0,0 +1,57 @@
+"""
+Connection pool tuning for the Fabric REST client used by the example scripts.
+
+requests keeps at most 10 idle connections per host by default, so concurrent
+example code (thread pools, asyncio.to_thread) can end up opening and closing TLS
+connections repeatedly. tune_client() mounts a larger pool on the client's session.
+
+Trade-off: pooled connections stay open while idle. That is harmless for the Fabric
+REST API, but if you point the same session at serverless endpoints that pause when
+idle, keep-alive traffic may delay auto-pause; pass enabled=False to opt out.
+"""
+
+import requests
+from _ratelimit import RateLimitedAdapter, TokenBucket
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 32
+
+
+def _find_session(client) -> requests.Session | None:
+    """Return the requests.Session a REST client uses, if it exposes one."""
+    for attribute in ("http", "session", "_session"):
+        session = getattr(client, attribute, None)
+        if isinstance(session, requests.Session):
+            return session
+    return None
+
+
+def tune_client(
+    client, pool_size: int = DEFAULT_POOL_SIZE, enabled: bool = True, rate_limiter: TokenBucket | None = None
+):
+    """
+    Mount a larger HTTPS connection pool on a REST client's session.
+
+    The retry policy of the adapter already mounted by the client is kept.
+
+    Args:
+        client: REST client, e.g. sempy.fabric.FabricRestClient()
+        pool_size: Number of pooled connections per host
+        enabled: Set to False to leave the client unchanged
+        rate_limiter: Optional TokenBucket every request must take a token from
+
+    Returns:
+        The same client, for chaining
+    """
+    session = _find_session(client) if enabled else None
+    if session is None:
+        return client
+
+    current_adapter = session.get_adapter("https://")
+    max_retries = getattr(current_adapter, "max_retries", 0)
+    pool_options = {"pool_connections": pool_size, "pool_maxsize": pool_size, "max_retries": max_retries}
+    if rate_limiter is not None:
+        session.mount("https://", RateLimitedAdapter(rate_limiter, **pool_options))
+    else:
+        session.mount("https://", HTTPAdapter(**pool_options))
+    return client
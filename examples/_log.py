@@ -0,0 +1,44 @@
+"""
+Logger shared by the example scripts.
+
+Progress lines go through one logger instead of individual print() calls, and
+loops collect their per-item results into a single message. In Fabric notebooks
+every print() is flushed through the IPython display, which adds noticeable
+overhead inside loops over many items. Raise the level to WARNING to silence
+progress output entirely.
+"""
+
+import functools
+import logging
+import sys
+
+log = logging.getLogger("fabric_launcher.examples")
+
+SEPARATOR = "=" * 60
+
+if not log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(logging.INFO)
+    # Notebook kernels often configure the root logger too; avoid printing every line twice
+    log.propagate = False
+
+
+def log_results(header: str, results: list[tuple[str, str]]) -> None:
+    """Log a header and one "<status> <name>" line per result as a single message."""
+    log.info("\n".join([header, *(f"  {status} {name}" for status, name in results)]))
+
+
+def example_guard(fn):
+    """Run an example function, logging any exception instead of raising it (the function then returns None)."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            log.error("❌ %s: %s", fn.__name__, e)
+            return None
+
+    return wrapper
@@ -0,0 +1,97 @@
+"""
+Client-side rate limiting for the Fabric REST client used by the example scripts.
+
+Once example loops run in parallel they can exceed Fabric's request limits and get
+HTTP 429 responses. Retrying those only adds load, so the shared client instead
+passes every request through a token bucket: bursts up to `burst` requests are sent
+immediately, after which requests are spaced at `rate_per_sec`. When a 429 still
+gets through, the bucket halves its rate and waits for the Retry-After period; each
+successful response then adds `recovery_step` back to the rate, up to `rate_per_sec`.
+"""
+
+import threading
+import time
+
+from _log import log
+from requests.adapters import HTTPAdapter
+
+DEFAULT_RATE_PER_SEC = 10.0
+DEFAULT_BURST = 20
+DEFAULT_RECOVERY_STEP = 0.1
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a request may be sent."""
+
+    def __init__(
+        self,
+        rate_per_sec: float = DEFAULT_RATE_PER_SEC,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = 1.0,
+        recovery_step: float = DEFAULT_RECOVERY_STEP,
+    ):
+        self.rate_per_sec = rate_per_sec
+        self.max_rate = rate_per_sec
+        self.burst = burst
+        self.min_rate = min_rate
+        self.recovery_step = recovery_step
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate_per_sec)
+            time.sleep(wait)
+
+    def throttle(self, retry_after: float) -> None:
+        """Halve the rate (down to min_rate) and hold all requests for retry_after seconds."""
+        with self._lock:
+            self.rate_per_sec = max(self.min_rate, self.rate_per_sec / 2)
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._tokens = 0.0
+
+    def recover(self) -> None:
+        """Raise the rate by recovery_step after a successful request, up to the configured rate."""
+        with self._lock:
+            if self.rate_per_sec < self.max_rate:
+                self.rate_per_sec = min(self.max_rate, self.rate_per_sec + self.recovery_step)
+
+
+def _retry_after_seconds(response, default: float = 1.0) -> float:
+    """Parse a Retry-After header given in seconds; HTTP dates fall back to the default."""
+    try:
+        return float(response.headers.get("Retry-After", default))
+    except ValueError:
+        return default
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from a TokenBucket before each request."""
+
+    def __init__(self, bucket: TokenBucket, *args, **kwargs):
+        self.bucket = bucket
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):
+        self.bucket.acquire()
+        response = super().send(request, *args, **kwargs)
+        if response.status_code == 429:
+            retry_after = _retry_after_seconds(response)
+            self.bucket.throttle(retry_after)
+            log.warning(
+                f"⚠️ Throttled by Fabric (HTTP 429, Retry-After {retry_after:g}s); "
+                f"slowing to {self.bucket.rate_per_sec:g} requests/s"
+            )
+        else:
+            self.bucket.recover()
+        return response
@@ -0,0 +1,85 @@
+"""
+Time-limited caches for name -> ID/URI lookups used by the example scripts.
+
+Folder IDs, item IDs and service endpoints rarely change while a notebook runs, but
+each lookup is a Fabric REST call. The wrappers below remember results for
+DEFAULT_TTL_SECONDS, keyed by (workspace_id, name, type); the client is not part of
+the key. Pass force=True to refresh an entry.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fabric_launcher import get_folder_id_by_name, get_kusto_query_uri, get_sql_endpoint
+
+DEFAULT_TTL_SECONDS = 600
+MAX_ENTRIES = 256
+
+_cache: dict[tuple, tuple[float, Any]] = {}
+_lock = threading.Lock()
+
+
+def _cached(key: tuple, lookup: Callable[[], Any], force: bool) -> Any:
+    """Return the cached value for key if it is younger than the TTL, otherwise call lookup()."""
+    now = time.monotonic()
+    if not force:
+        with _lock:
+            entry = _cache.get(key)
+        if entry is not None and now - entry[0] < DEFAULT_TTL_SECONDS:
+            return entry[1]
+
+    value = lookup()
+
+    with _lock:
+        if len(_cache) >= MAX_ENTRIES:
+            # Entries are inserted in time order, so the first one is the oldest
+            _cache.pop(next(iter(_cache)))
+        _cache.pop(key, None)
+        _cache[key] = (now, value)
+    return value
+
+
+def clear_cache() -> None:
+    """Forget all cached lookups."""
+    with _lock:
+        _cache.clear()
+
+
+def cached_get_folder_id_by_name(folder_name: str, workspace_id: str, client, force: bool = False) -> str:
+    """Cached get_folder_id_by_name()."""
+    return _cached(
+        ("folder", workspace_id, folder_name, "Folder"),
+        lambda: get_folder_id_by_name(folder_name, workspace_id, client),
+        force,
+    )
+
+
+def cached_get_kusto_query_uri(workspace_id: str, eventhouse_name: str, client, force: bool = False) -> str:
+    """Cached get_kusto_query_uri()."""
+    return _cached(
+        ("kusto_uri", workspace_id, eventhouse_name, "Eventhouse"),
+        lambda: get_kusto_query_uri(workspace_id, eventhouse_name, client),
+        force,
+    )
+
+
+def cached_get_sql_endpoint(workspace_id: str, item_name: str, item_type: str, client, force: bool = False) -> str:
+    """Cached get_sql_endpoint()."""
+    return _cached(
+        ("sql_endpoint", workspace_id, item_name, item_type),
+        lambda: get_sql_endpoint(workspace_id, item_name, item_type, client),
+        force,
+    )
+
+
+def cached_resolve_item_id(workspace_id: str, item_name: str, item_type: str, force: bool = False) -> str:
+    """Cached sempy.fabric.resolve_item_id() for an item in the given workspace."""
+    import sempy.fabric as fabric
+
+    return _cached(
+        ("item_id", workspace_id, item_name, item_type),
+        lambda: fabric.resolve_item_id(item_name, item_type, workspace=workspace_id),
+        force,
+    )
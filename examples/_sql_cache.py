@@ -0,0 +1,70 @@
+"""
+Client-side result cache for read-only SQL queries in the example scripts.
+
+Identical queries against the same endpoint and database within the TTL are answered
+from memory instead of another round-trip to the SQL endpoint. Queries are keyed by
+a hash of their text with runs of whitespace collapsed; the text is not lowercased
+because that would also change string literals. Statements that are not SELECT/WITH
+queries, or that call non-deterministic functions, are never cached.
+"""
+
+import hashlib
+import re
+import threading
+import time
+
+from fabric_launcher import exec_sql_query
+
+DEFAULT_TTL_SECONDS = 300
+MAX_ENTRIES = 256
+
+_READ_ONLY = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+_NON_DETERMINISTIC = re.compile(
+    r"\b(now|getdate|getutcdate|sysdatetime|sysutcdatetime|current_timestamp|rand|newid)\b", re.IGNORECASE
+)
+
+_cache: dict[str, tuple[float, list]] = {}
+_lock = threading.Lock()
+
+
+def _cache_key(sql_endpoint: str, database_name: str, sql_query: str) -> str:
+    normalized = re.sub(r"\s+", " ", sql_query).strip()
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (sql_endpoint, database_name, normalized):
+        digest.update(part.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def exec_sql_query_cached(
+    sql_endpoint: str, database_name: str, sql_query: str, notebookutils, ttl: int = DEFAULT_TTL_SECONDS
+) -> list:
+    """
+    exec_sql_query() with results reused for ttl seconds.
+
+    Returns:
+        List of result rows as dictionaries (a fresh copy on every call)
+    """
+    if not _READ_ONLY.match(sql_query) or _NON_DETERMINISTIC.search(sql_query):
+        return exec_sql_query(sql_endpoint, database_name, sql_query, notebookutils)
+
+    key = _cache_key(sql_endpoint, database_name, sql_query)
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return [dict(row) for row in entry[1]]
+
+    rows = exec_sql_query(sql_endpoint, database_name, sql_query, notebookutils)
+
+    with _lock:
+        if len(_cache) >= MAX_ENTRIES:
+            _cache.pop(next(iter(_cache)))
+        _cache.pop(key, None)
+        _cache[key] = (now, rows)
+    return [dict(row) for row in rows]
+
+
+def clear_cache() -> None:
+    """Forget all cached query results."""
+    with _lock:
+        _cache.clear()
@@ -6,6 +6,9 @@ object for post-deployment activities like custom validation, data processing,
 or integration with other tools.
 """
 
+import os
+from pathlib import Path
+
 from fabric_launcher import FabricLauncher
 
 # Initialize the launcher (in Fabric, notebookutils would be available)
@@ -36,8 +39,6 @@ if launcher.repository_path:
     print(f"   Repository extracted to: {launcher.repository_path}")
 
     # Use this for custom file operations
-    from pathlib import Path
-
     repo_path = Path(launcher.repository_path)
 
     # Example: Check if a specific file exists
@@ -53,14 +54,15 @@ if launcher.workspace_directory:
     print(f"   Workspace artifacts in: {launcher.workspace_directory}")
 
     # Use this to access deployed artifact definitions
-    from pathlib import Path
-
     workspace_path = Path(launcher.workspace_directory)
 
-    # Example: List all notebook definitions
+    # Example: List all notebook definitions (each .Notebook item is a folder)
     notebooks_path = workspace_path / "Notebooks"
     if notebooks_path.exists():
-        notebook_files = list(notebooks_path.glob("*.Notebook"))
+        with os.scandir(notebooks_path) as it:
+            notebook_files = [
+                entry.path for entry in it if entry.name.endswith(".Notebook") and entry.is_dir(follow_symlinks=False)
+            ]
         print(f"   Found {len(notebook_files)} notebook definitions")
 else:
     print("   ⚠️  Workspace not yet deployed")
@@ -88,27 +90,22 @@ if data_folder:
     print(f"   Data folder: {data_folder}")
 
     # Use this for custom data processing
-    from pathlib import Path
-
-    data_path = Path(data_folder)
-
-    # Example: Count CSV files
-    csv_files = list(data_path.glob("**/*.csv"))
+    # Example: Count CSV files (searches subfolders too)
+    csv_files = list(launcher.iter_data_files("data", ".csv"))
     print(f"   Found {len(csv_files)} CSV files")
 else:
     print("   ⚠️  Data folder not found")
 
 # 5. List all folders in the repository
 print("\n📋 Repository Folders:")
-folders = launcher.list_data_folders()
+folders = launcher.list_data_folders_with_paths()
 if folders:
     print(f"   Available folders: {', '.join(folders)}")
 
     # Use this to discover available data or configuration directories
-    for folder in folders:
-        folder_path = launcher.get_data_folder_path(folder)
-        if folder_path:
-            print(f"   - {folder}: {folder_path}")
+    # (names and paths come from a single scan of the repository root)
+    for folder, folder_path in folders.items():
+        print(f"   - {folder}: {folder_path}")
 else:
     print("   ⚠️  No folders found")
 
@@ -14,6 +14,8 @@ For parameterization and value replacement guidance, see:
 https://microsoft.github.io/fabric-cicd/0.1.3/
 """
 
+from collections import Counter
+
 import notebookutils
 
 from fabric_launcher import FabricLauncher
@@ -54,6 +56,8 @@ def example_config_download_then_use():
         config_file_path="config/deployment.yaml",
         save_to="my_deployment_config.yaml",  # Optional: save to specific location
     )
+    # Re-runs send the stored ETag and keep the local file if GitHub reports it unchanged
+    # (without save_to the config is kept in a per-repository file in the temp directory)
 
     # Initialize launcher with downloaded config
     launcher = FabricLauncher(notebookutils, config_file=config_path, environment="DEV")
@@ -275,10 +279,7 @@ def example_report_analysis():
         print(f"Total Steps: {len(report.steps)}")
 
         # Count step statuses
-        status_counts = {}
-        for step in report.steps:
-            status = step["status"]
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = Counter(step["status"] for step in report.steps)
 
         print("\nStep Status Summary:")
         for status, count in status_counts.items():
@@ -14,18 +14,35 @@ Prerequisites:
 - sempy.fabric package installed (available in Fabric notebooks)
 """
 
-import sempy.fabric as fabric
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import requests
+from _async_helpers import create_accelerated_shortcuts_async
+from _clients import get_client, get_workspace_id
+from _log import SEPARATOR, example_guard, log, log_results
+from _resolver_cache import (
+    cached_get_folder_id_by_name,
+    cached_get_kusto_query_uri,
+    cached_get_sql_endpoint,
+    cached_resolve_item_id,
+)
+from _sql_cache import exec_sql_query_cached
 
 from fabric_launcher import (
-    create_accelerated_shortcut_in_kql_db,
+    compile_logical_id_replacer,
     create_or_update_fabric_item,
     create_shortcut,
     exec_kql_command,
-    exec_sql_query,
-    get_folder_id_by_name,
-    get_kusto_query_uri,
-    get_sql_endpoint,
     move_item_to_folder,
+    move_item_to_folder_by_id,
+    prefetch_workspace_index,
     scan_logical_ids,
 )
 
@@ -33,33 +50,92 @@ from fabric_launcher import (
 try:
     import notebookutils
 except ImportError:
-    print("⚠️ notebookutils not available - some functions require Fabric notebook environment")
+    log.info("⚠️ notebookutils not available - some functions require Fabric notebook environment")
     notebookutils = None
 
+# Eventhouse/SQL example resources (adjust these to match your environment)
+EVENTHOUSE_NAME = "PowerUtilitiesEH"
+KQL_DB_NAME = "PowerUtilitiesEH"
+SOURCE_LAKEHOUSE_NAME = "ReferenceDataLH"
+
+# Where scan_logical_ids_cached() keeps its results between runs
+LOGICAL_ID_CACHE_DIR = Path.home() / ".cache" / "fabric_launcher" / "logical_ids"
+
+
+def _source_lakehouse_id() -> str:
+    """Resolve SOURCE_LAKEHOUSE_NAME on first use (not at import), then reuse the cached ID."""
+    return cached_resolve_item_id(get_workspace_id(), SOURCE_LAKEHOUSE_NAME, "Lakehouse")
+
+
+def _platform_files_fingerprint(repository_directory: str, workspace_id: str) -> str:
+    """Hash the workspace ID and the path, mtime and size of every .platform file in the repository."""
+    entries = []
+    stack = [repository_directory]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name == ".platform":
+                    stat = entry.stat()
+                    entries.append(f"{entry.path}\0{stat.st_mtime_ns}\0{stat.st_size}")
+
+    digest = hashlib.sha256(workspace_id.encode("utf-8"))
+    for line in sorted(entries):
+        digest.update(b"\n" + line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def scan_logical_ids_cached(repository_directory: str, workspace_id: str, client, max_age_seconds: int = 3600):
+    """
+    scan_logical_ids() with results kept on disk between runs.
+
+    The cache is keyed by the workspace ID and the .platform files in the repository.
+    Mapped IDs come from the live workspace, so entries also expire after max_age_seconds
+    in case items were deleted and recreated in the meantime.
+    """
+    cache_file = LOGICAL_ID_CACHE_DIR / f"{_platform_files_fingerprint(repository_directory, workspace_id)}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < max_age_seconds:
+            with open(cache_file, encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    logical_id_map = scan_logical_ids(repository_directory, workspace_id, client)
+
+    try:
+        LOGICAL_ID_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=LOGICAL_ID_CACHE_DIR, delete=False, encoding="utf-8") as f:
+            json.dump(logical_id_map, f)
+        Path(f.name).replace(cache_file)
+    except OSError as e:
+        log.info(f"⚠️ Could not cache logical IDs: {e}")
+
+    return logical_id_map
+
 
 def main():
     """Main example workflow for post-deployment helpers."""
 
     # Initialize Fabric client and workspace
-    client = fabric.FabricRestClient()
-    workspace_id = fabric.get_workspace_id()
+    client = get_client()
+    workspace_id = get_workspace_id()
 
     # Configure repository directory (adjust to your environment)
     repository_directory = "/lakehouse/default/Files/src/workspace"
 
-    print("=" * 60)
-    print("Post-Deployment Helper Functions Example")
-    print("=" * 60)
+    log.info(f"{SEPARATOR}\nPost-Deployment Helper Functions Example\n{SEPARATOR}")
 
     # Step 1: Scan logical IDs
-    print("\n1. Scanning logical IDs in repository...")
-    logical_id_map = scan_logical_ids(
+    log.info("\n1. Scanning logical IDs in repository...")
+    logical_id_map = scan_logical_ids_cached(
         repository_directory=repository_directory, workspace_id=workspace_id, client=client
     )
-    print(f"   Found {len(logical_id_map)} logical ID mappings")
+    log.info(f"   Found {len(logical_id_map)} logical ID mappings")
 
     # Step 2: Create/update a custom item with logical ID replacement
-    print("\n2. Creating/updating custom Fabric item...")
+    log.info("\n2. Creating/updating custom Fabric item...")
     item_id = create_or_update_fabric_item(
         item_name="Custom Integration Notebook",
         item_type="Notebook",
@@ -71,10 +147,10 @@ def main():
         logical_id_map=logical_id_map,
         description="Custom integration with logical ID references",
     )
-    print(f"   Item ID: {item_id}")
+    log.info(f"   Item ID: {item_id}")
 
     # Step 3: Move item to appropriate folder
-    print("\n3. Moving item to target folder...")
+    log.info("\n3. Moving item to target folder...")
     success = move_item_to_folder(
         item_name="Custom Integration Notebook",
         item_type="Notebook",
@@ -84,33 +160,60 @@ def main():
     )
 
     if success:
-        print("   ✅ Item moved successfully")
+        log.info("   ✅ Item moved successfully")
     else:
-        print("   ⚠️ Failed to move item")
+        log.info("   ⚠️ Failed to move item")
 
     # Step 4: Lookup folder ID for reference
-    print("\n4. Looking up folder ID...")
-    folder_id = get_folder_id_by_name(folder_name="Integration", workspace_id=workspace_id, client=client)
+    log.info("\n4. Looking up folder ID...")
+    folder_id = cached_get_folder_id_by_name(folder_name="Integration", workspace_id=workspace_id, client=client)
 
     if folder_id:
-        print(f"   Folder ID: {folder_id}")
+        log.info(f"   Folder ID: {folder_id}")
     else:
-        print("   Folder not found")
+        log.info("   Folder not found")
+
+    log.info(f"\n{SEPARATOR}\n✅ Example completed successfully!\n{SEPARATOR}")
+
 
-    print("\n" + "=" * 60)
-    print("✅ Example completed successfully!")
-    print("=" * 60)
+def _deploy_one(item: dict, client, workspace_id: str, repository_directory: str, logical_id_replacer):
+    """Create/update one item and move it to its folder; returns (name, folder, error or None)."""
+    try:
+        create_or_update_fabric_item(
+            item_name=item["name"],
+            item_type=item["type"],
+            item_relative_path=item["path"],
+            repository_directory=repository_directory,
+            workspace_id=workspace_id,
+            client=client,
+            endpoint=item["endpoint"],
+            logical_id_replacer=logical_id_replacer,
+        )
+
+        move_item_to_folder(
+            item_name=item["name"],
+            item_type=item["type"],
+            folder_name=item["folder"],
+            workspace_id=workspace_id,
+            client=client,
+        )
+    except Exception as e:
+        return item["name"], item["folder"], e
+
+    return item["name"], item["folder"], None
 
 
 def batch_deployment_example():
     """Example: Batch deployment of multiple items."""
 
-    client = fabric.FabricRestClient()
-    workspace_id = fabric.get_workspace_id()
+    client = get_client()
+    workspace_id = get_workspace_id()
     repository_directory = "/lakehouse/default/Files/src/workspace"
 
-    # Scan logical IDs once
-    logical_id_map = scan_logical_ids(repository_directory, workspace_id, client)
+    # Scan logical IDs once (reused from disk on later runs while the repository is unchanged)
+    logical_id_map = scan_logical_ids_cached(repository_directory, workspace_id, client)
+    # Compile the map into one replacement pattern shared by every item, instead of once per item
+    logical_id_replacer = compile_logical_id_replacer(logical_id_map)
 
     # Define items to deploy with their endpoints
     items = [
@@ -130,44 +233,30 @@ def batch_deployment_example():
         },
     ]
 
-    print("Deploying multiple items...")
+    log.info("Deploying multiple items...")
 
-    for item in items:
-        try:
-            # Create/update item
-            create_or_update_fabric_item(
-                item_name=item["name"],
-                item_type=item["type"],
-                item_relative_path=item["path"],
-                repository_directory=repository_directory,
-                workspace_id=workspace_id,
-                client=client,
-                endpoint=item["endpoint"],
-                logical_id_map=logical_id_map,
-            )
+    # Items are independent, so overlap their API round-trips; the client is shared across threads
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+        futures = [
+            executor.submit(_deploy_one, item, client, workspace_id, repository_directory, logical_id_replacer)
+            for item in items
+        ]
+        outcomes = []
+        for future in as_completed(futures):
+            name, folder, error = future.result()
+            if error is None:
+                outcomes.append(("✅", f"{name}: Deployed and moved to {folder}"))
+            else:
+                outcomes.append(("❌", f"{name}: Failed - {error}"))
 
-            # Move to folder
-            move_item_to_folder(
-                item_name=item["name"],
-                item_type=item["type"],
-                folder_name=item["folder"],
-                workspace_id=workspace_id,
-                client=client,
-            )
-
-            print(f"✅ {item['name']}: Deployed and moved to {item['folder']}")
-
-        except Exception as e:
-            print(f"❌ {item['name']}: Failed - {e}")
-
-    print("Batch deployment completed!")
+    log_results("Batch deployment completed!", outcomes)
 
 
 def folder_organization_example():
     """Example: Organize existing items into folders."""
 
-    client = fabric.FabricRestClient()
-    workspace_id = fabric.get_workspace_id()
+    client = get_client()
+    workspace_id = get_workspace_id()
 
     # Define organization structure
     organization = {
@@ -176,145 +265,338 @@ def folder_organization_example():
         "Operations": ["Monitoring Dashboard"],
     }
 
-    print("Organizing items into folders...")
+    log.info("Organizing items into folders...")
 
-    for folder_name, item_names in organization.items():
-        print(f"\nFolder: {folder_name}")
+    # List folders and items once instead of twice per moved item
+    folders_by_name, items_by_name_type = prefetch_workspace_index(workspace_id, client)
 
+    for folder_name, item_names in organization.items():
+        # Collect per-item results and log each folder as one message
+        outcomes = []
         for item_name in item_names:
             # Assuming all items are Notebooks (adjust type as needed)
-            success = move_item_to_folder(
-                item_name=item_name,
-                item_type="Notebook",
-                folder_name=folder_name,
-                workspace_id=workspace_id,
-                client=client,
-            )
+            try:
+                success = move_item_to_folder_by_id(
+                    item_id=items_by_name_type[(item_name, "Notebook")],
+                    folder_id=folders_by_name[folder_name],
+                    workspace_id=workspace_id,
+                    client=client,
+                )
+            except KeyError:
+                # Not in the prefetched listing (e.g. created since); fall back to name lookups
+                success = move_item_to_folder(
+                    item_name=item_name,
+                    item_type="Notebook",
+                    folder_name=folder_name,
+                    workspace_id=workspace_id,
+                    client=client,
+                )
 
-            status = "✅" if success else "❌"
-            print(f"  {status} {item_name}")
+            outcomes.append(("✅" if success else "❌", item_name))
+
+        log_results(f"\nFolder: {folder_name}", outcomes)
+
+    log.info("\nOrganization completed!")
+
+
+def create_accelerated_shortcuts_bulk(
+    tables: list[str],
+    workspace_id: str,
+    eventhouse_name: str,
+    kql_db_name: str,
+    source_lakehouse_name: str,
+    client,
+    notebookutils,
+) -> dict[str, bool]:
+    """
+    Bulk variant of create_accelerated_shortcut_in_kql_db() for several Lakehouse tables.
+
+    Shortcuts are created in parallel, then all external tables and query acceleration
+    policies are created with a single `.execute database script` command. If the script
+    cannot be submitted, the commands are run one by one so partial progress is kept.
+
+    Returns:
+        Dictionary mapping each table to True if its accelerated external table was created
+
+    Raises:
+        ValueError: If the source Lakehouse or the KQL Database is not in the workspace
+    """
+    # Resolve the source Lakehouse and target KQL Database with one (paginated) item listing
+    _, item_ids = prefetch_workspace_index(workspace_id, client)
+    missing = [
+        f"{item_type} '{name}'"
+        for name, item_type in ((source_lakehouse_name, "Lakehouse"), (kql_db_name, "KQLDatabase"))
+        if (name, item_type) not in item_ids
+    ]
+    if missing:
+        raise ValueError(f"Item not found in workspace {workspace_id}: {', '.join(missing)}")
+    source_lakehouse_id = item_ids[(source_lakehouse_name, "Lakehouse")]
+    kql_db_id = item_ids[(kql_db_name, "KQLDatabase")]
+
+    # (table, shortcut name, source path) computed once per table and shared by both phases
+    table_specs = [(table, table.capitalize(), f"Tables/{table}") for table in tables]
+
+    def _create_table_shortcut(shortcut_name: str, source_path: str) -> None:
+        create_shortcut(
+            target_workspace_id=workspace_id,
+            target_item_name=kql_db_name,
+            target_item_type="KQLDatabase",
+            target_path="Shortcut",
+            target_shortcut_name=shortcut_name,
+            source_workspace_id=workspace_id,
+            source_item_id=source_lakehouse_id,
+            source_path=source_path,
+            client=client,
+            notebookutils=notebookutils,
+        )
+
+    results = dict.fromkeys(tables, False)
+    with ThreadPoolExecutor(max_workers=min(8, len(tables))) as executor:
+        futures = {executor.submit(_create_table_shortcut, name, path): table for table, name, path in table_specs}
+        for future in as_completed(futures):
+            table = futures[future]
+            try:
+                future.result()
+                results[table] = True
+            except Exception as e:
+                log.info(f"❌ Shortcut for '{table}' failed: {e}")
+
+    # Build the external table and acceleration commands for every shortcut that exists
+    lakehouse_tables_path = notebookutils.lakehouse.getWithProperties(source_lakehouse_name).properties[
+        "oneLakeTablesPath"
+    ]
+    base_path = "/".join(lakehouse_tables_path.rstrip("/").split("/")[:-2])
+    # (table, command, required): a failed acceleration policy leaves a usable external table
+    commands = []
+    for table, name, _ in table_specs:
+        if not results[table]:
+            continue
+        table_path = f"{base_path}/{kql_db_id}/Shortcut/{name}"
+        acceleration_policy = '{"IsEnabled": true, "Hot": "365.00:00:00", "MaxAge": "01:00:00"}'
+        commands.append(
+            (table, f".create-or-alter external table {name} kind=delta (h@'{table_path};impersonate')", True)
+        )
+        commands.append(
+            (table, f".alter external table {name} policy query_acceleration '{acceleration_policy}'", False)
+        )
+    if not commands:
+        return results
+
+    kusto_uri = cached_get_kusto_query_uri(workspace_id, eventhouse_name, client)
+    script = ".execute database script with (ContinueOnErrors=true) <|\n" + "\n".join(cmd for _, cmd, _ in commands)
+    try:
+        response = exec_kql_command(kusto_uri, kql_db_name, script, notebookutils)
+        # One result row per command, in submission order
+        table_result = response["Tables"][0]
+        columns = [column["ColumnName"] for column in table_result["Columns"]]
+        for (table, _, required), row in zip(commands, table_result["Rows"], strict=False):
+            if required and dict(zip(columns, row, strict=False)).get("Result") != "Completed":
+                results[table] = False
+    except RuntimeError as e:
+        log.info(f"⚠️ Database script failed ({e}); running commands one by one")
+        for table, command, required in commands:
+            if not results[table]:
+                continue
+            try:
+                exec_kql_command(kusto_uri, kql_db_name, command, notebookutils)
+            except RuntimeError:
+                results[table] = not required
+
+    return results
+
+
+def round_time_bucket(dt: datetime, bucket: timedelta = timedelta(minutes=5)) -> datetime:
+    """Round a timezone-aware datetime down to the start of its time bucket."""
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return dt - (dt - epoch) % bucket
+
+
+def exec_kql_query_cached(
+    kusto_query_uri: str,
+    kql_db_name: str,
+    kql_query: str,
+    notebookutils,
+    cache_max_age: timedelta | None = timedelta(minutes=10),
+) -> dict:
+    """
+    Run a KQL query, allowing Kusto to answer it from its query results cache.
+
+    exec_kql_command() targets the management endpoint (.show, .create, ...), where the
+    results cache does not apply; queries go to /v1/rest/query instead.
+    """
+    if cache_max_age is not None:
+        kql_query = f"set query_results_cache_max_age = time({int(cache_max_age.total_seconds())}s);\n{kql_query}"
+
+    token = notebookutils.credentials.getToken(kusto_query_uri)
+    response = requests.post(
+        f"{kusto_query_uri}/v1/rest/query",
+        json={"csl": kql_query, "db": kql_db_name},
+        headers={"Content-Type": "application/json", "Authorization": f"Bearer {token}"},
+        timeout=60,
+    )
+    if not response.ok:
+        raise RuntimeError(f"KQL query failed: HTTP {response.status_code}: {response.text[:200]}")
+    return response.json()
+
+
+@example_guard
+def example_get_kusto_uri(workspace_id: str, client) -> str:
+    """Example 1: Get the Kusto query URI of the Eventhouse."""
+    kusto_uri = cached_get_kusto_query_uri(workspace_id, EVENTHOUSE_NAME, client)
+    log.info(f"✅ Kusto Query URI: {kusto_uri}")
+    return kusto_uri
+
+
+@example_guard
+def example_exec_kql_command(kusto_uri: str) -> None:
+    """Example 2: Run a KQL management command and a cacheable KQL query."""
+    kql_command = ".show tables"
+    log.info(f"Executing: {kql_command}")
+    if exec_kql_command(kusto_uri, KQL_DB_NAME, kql_command, notebookutils):
+        log.info("✅ Command executed successfully")
+
+    # Queries (unlike management commands) can be answered from Kusto's results cache.
+    # Rounding the time window keeps the query text identical for 5 minutes so repeats hit it.
+    since = round_time_bucket(datetime.now(timezone.utc) - timedelta(hours=1))
+    kql_query = f"meter_readings | where Timestamp > datetime({since.isoformat()}) | count"
+    log.info(f"Querying: {kql_query}")
+    exec_kql_query_cached(kusto_uri, KQL_DB_NAME, kql_query, notebookutils)
+    log.info("✅ Query executed successfully")
+
+
+@example_guard
+def example_create_shortcut(workspace_id: str, client) -> None:
+    """Example 3: Create a OneLake shortcut from a Lakehouse table into the KQL Database."""
+    result = create_shortcut(
+        target_workspace_id=workspace_id,
+        target_item_name=KQL_DB_NAME,
+        target_item_type="KQLDatabase",
+        target_path="Shortcut",
+        target_shortcut_name="SourceData",
+        source_workspace_id=workspace_id,
+        source_item_id=_source_lakehouse_id(),
+        source_path="Tables/substations",
+        client=client,
+        notebookutils=notebookutils,
+    )
+    if result:
+        log.info("✅ Shortcut created successfully")
 
-    print("\nOrganization completed!")
+
+@example_guard
+def example_create_accelerated_shortcut(workspace_id: str, client) -> None:
+    """Example 4: Create accelerated shortcuts for several tables in the KQL Database."""
+    # For a single table, create_accelerated_shortcut_in_kql_db() does the same in one call
+    results = create_accelerated_shortcuts_bulk(
+        tables=["substations", "feeders"],
+        workspace_id=workspace_id,
+        eventhouse_name=EVENTHOUSE_NAME,
+        kql_db_name=KQL_DB_NAME,
+        source_lakehouse_name=SOURCE_LAKEHOUSE_NAME,
+        client=client,
+        notebookutils=notebookutils,
+    )
+    log_results("Accelerated shortcuts:", [("✅" if success else "⚠️", table) for table, success in results.items()])
+
+
+@example_guard
+def example_get_sql_endpoint(workspace_id: str, client) -> str | None:
+    """Example 5: Get the SQL analytics endpoint of the source Lakehouse."""
+    sql_endpoint = cached_get_sql_endpoint(workspace_id, SOURCE_LAKEHOUSE_NAME, "Lakehouse", client)
+    if sql_endpoint:
+        log.info(f"✅ SQL Endpoint: {sql_endpoint}")
+    else:
+        log.info("⚠️ SQL endpoint not found")
+    return sql_endpoint
+
+
+@example_guard
+def example_exec_sql_query(sql_endpoint: str) -> None:
+    """Example 6: Run read-only SQL queries against the SQL endpoint."""
+    # exec_sql_query() returns one result set, so independent summaries are fused with
+    # UNION ALL and a discriminator column: one round trip instead of one per query
+    sql_query = (
+        "SELECT 'total_meters' AS metric, NULL AS meter_type, COUNT(*) AS value FROM meters "
+        "UNION ALL "
+        "SELECT 'meters_by_type', meter_type, COUNT(*) FROM meters GROUP BY meter_type"
+    )
+    log.info(f"Executing: {sql_query}")
+    results = exec_sql_query_cached(sql_endpoint, SOURCE_LAKEHOUSE_NAME, sql_query, notebookutils)
+    if results:
+        sections: dict[str, list[dict]] = {}
+        for row in results:
+            sections.setdefault(row["metric"], []).append(row)
+        log.info(f"✅ Total meters: {sections.get('total_meters', [{}])[0].get('value')}")
+        log_results(
+            "Meters by type:", [(str(row["value"]), row["meter_type"]) for row in sections.get("meters_by_type", [])]
+        )
 
 
 def eventhouse_sql_examples():
     """Examples: Eventhouse, KQL Database, and SQL Operations."""
 
     # Initialize Fabric client
-    client = fabric.FabricRestClient()
-    workspace_id = fabric.resolve_workspace_id()
-
-    # Define your resources (adjust these to match your environment)
-    eventhouse_name = "PowerUtilitiesEH"
-    kql_db_name = "PowerUtilitiesEH"
-    source_lakehouse_name = "ReferenceDataLH"
+    client = get_client()
+    workspace_id = get_workspace_id()
+    skip_message = "⚠️ Skipping - requires notebookutils (Fabric notebook environment)"
 
-    print("\n" + "=" * 60)
-    print("Eventhouse and SQL Operations Examples")
-    print("=" * 60)
+    log.info(f"\n{SEPARATOR}\nEventhouse and SQL Operations Examples\n{SEPARATOR}")
 
-    # Example 1: Get Kusto Query URI
-    print("\n--- Example 1: Get Kusto Query URI ---")
-    try:
-        kusto_uri = get_kusto_query_uri(workspace_id, eventhouse_name, client)
-        print(f"✅ Kusto Query URI: {kusto_uri}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        kusto_uri = None
+    log.info("\n--- Example 1: Get Kusto Query URI ---")
+    kusto_uri = example_get_kusto_uri(workspace_id, client)
 
-    # Example 2: Execute KQL Management Commands
-    print("\n--- Example 2: Execute KQL Management Commands ---")
+    log.info("\n--- Example 2: Execute KQL Management Commands ---")
     if not notebookutils:
-        print("⚠️ Skipping - requires notebookutils (Fabric notebook environment)")
+        log.info(skip_message)
     elif kusto_uri:
-        try:
-            # Show tables
-            kql_command = ".show tables"
-            print(f"Executing: {kql_command}")
-            result = exec_kql_command(kusto_uri, kql_db_name, kql_command, notebookutils)
-            if result:
-                print("✅ Command executed successfully")
-        except Exception as e:
-            print(f"❌ Error: {e}")
-
-    # Example 3: Create Shortcut
-    print("\n--- Example 3: Create OneLake Shortcut ---")
+        example_exec_kql_command(kusto_uri)
+
+    log.info("\n--- Example 3: Create OneLake Shortcut ---")
     if not notebookutils:
-        print("⚠️ Skipping - requires notebookutils (Fabric notebook environment)")
+        log.info(skip_message)
     else:
-        try:
-            source_lakehouse_id = fabric.resolve_item_id(source_lakehouse_name, "Lakehouse")
-            result = create_shortcut(
-                target_workspace_id=workspace_id,
-                target_item_name=kql_db_name,
-                target_item_type="KQLDatabase",
-                target_path="Shortcut",
-                target_shortcut_name="SourceData",
-                source_workspace_id=workspace_id,
-                source_item_id=source_lakehouse_id,
-                source_path="Tables/substations",
-                client=client,
-                notebookutils=notebookutils,
-            )
-            if result:
-                print("✅ Shortcut created successfully")
-        except Exception as e:
-            print(f"❌ Error: {e}")
-
-    # Example 4: Create Accelerated Shortcuts
-    print("\n--- Example 4: Create Accelerated Shortcuts in KQL Database ---")
+        example_create_shortcut(workspace_id, client)
+
+    log.info("\n--- Example 4: Create Accelerated Shortcuts in KQL Database ---")
     if not notebookutils:
-        print("⚠️ Skipping - requires notebookutils (Fabric notebook environment)")
+        log.info(skip_message)
     else:
-        try:
-            tables = ["substations", "feeders"]
-
-            for table in tables:
-                print(f"\nProcessing table: {table}")
-                success = create_accelerated_shortcut_in_kql_db(
-                    target_workspace_id=workspace_id,
-                    target_kql_db_name=kql_db_name,
-                    target_shortcut_name=table.capitalize(),
-                    source_workspace_id=workspace_id,
-                    source_path=f"Tables/{table}",
-                    target_eventhouse_name=eventhouse_name,
-                    source_lakehouse_name=source_lakehouse_name,
-                    client=client,
-                    notebookutils=notebookutils,
-                )
-                print(f"{'✅' if success else '⚠️'} Table '{table}'")
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        example_create_accelerated_shortcut(workspace_id, client)
 
-    # Example 5: Get SQL Endpoint
-    print("\n--- Example 5: Get SQL Endpoint ---")
-    try:
-        sql_endpoint = get_sql_endpoint(workspace_id, source_lakehouse_name, "Lakehouse", client)
-        if sql_endpoint:
-            print(f"✅ SQL Endpoint: {sql_endpoint}")
-        else:
-            print("⚠️ SQL endpoint not found")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sql_endpoint = None
+    log.info("\n--- Example 5: Get SQL Endpoint ---")
+    sql_endpoint = example_get_sql_endpoint(workspace_id, client)
 
-    # Example 6: Execute SQL Queries
-    print("\n--- Example 6: Execute SQL Queries ---")
+    log.info("\n--- Example 6: Execute SQL Queries ---")
     if not notebookutils:
-        print("⚠️ Skipping - requires notebookutils (Fabric notebook environment)")
+        log.info(skip_message)
     elif sql_endpoint:
-        try:
-            sql_query = "SELECT COUNT(*) as total_meters FROM meters"
-            print(f"Executing: {sql_query}")
-            results = exec_sql_query(sql_endpoint, source_lakehouse_name, sql_query, notebookutils)
-            if results:
-                print(f"✅ Results: {results}")
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        example_exec_sql_query(sql_endpoint)
+
+    log.info(f"\n{SEPARATOR}\nEventhouse/SQL Examples Completed\n{SEPARATOR}")
+
 
-    print("\n" + "=" * 60)
-    print("Eventhouse/SQL Examples Completed")
-    print("=" * 60)
+async def eventhouse_async_shortcuts_example():
+    """
+    Example: Create accelerated shortcuts for several tables concurrently with asyncio.
+
+    In a Fabric notebook an event loop is already running, so call it with
+    `await eventhouse_async_shortcuts_example()`; in a script use asyncio.run().
+    """
+    if not notebookutils:
+        log.info("⚠️ Skipping - requires notebookutils (Fabric notebook environment)")
+        return
+
+    tables = ["substations", "feeders", "transformers", "meters"]
+    results = await create_accelerated_shortcuts_async(
+        tables=tables,
+        workspace_id=get_workspace_id(),
+        eventhouse_name=EVENTHOUSE_NAME,
+        kql_db_name=KQL_DB_NAME,
+        source_lakehouse_name=SOURCE_LAKEHOUSE_NAME,
+        client=get_client(),
+        notebookutils=notebookutils,
+    )
+    log_results("Accelerated shortcuts:", [("✅" if success else "⚠️", table) for table, success in results.items()])
 
 
 if __name__ == "__main__":
@@ -325,3 +607,4 @@ if __name__ == "__main__":
     # batch_deployment_example()
     # folder_organization_example()
     # eventhouse_sql_examples()
+    # asyncio.run(eventhouse_async_shortcuts_example())
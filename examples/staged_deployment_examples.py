@@ -8,7 +8,7 @@ before dependent items.
 
 import notebookutils
 
-from fabric_launcher import FabricLauncher
+from fabric_launcher import FabricLauncher, compute_item_type_stages
 
 # ============================================================================
 # Example 1: Basic Three-Stage Deployment
@@ -115,11 +115,14 @@ def example_staged_with_data():
         data_folders={"data": "reference-data"},  # Upload data files
         lakehouse_name="ReferenceDataLH",
         data_file_patterns=["*.json", "*.csv"],
+        reuse_if_unchanged=True,  # Remember the downloaded commit for stage 2
     )
 
     print("✅ Stage 1 completed: Data stores deployed and data uploaded")
 
-    # Stage 2: Deploy compute and analytics (now that data is ready)
+    # Stage 2: Deploy compute and analytics (now that data is ready).
+    # reuse_if_unchanged=True skips downloading the repository again while the
+    # branch still points to the commit extracted in stage 1.
     launcher.download_and_deploy(
         repo_owner="myorg",
         repo_name="my-solution",
@@ -128,6 +131,7 @@ def example_staged_with_data():
             ["Notebook", "Eventstream"],  # Compute
             ["SemanticModel", "Report"],  # Analytics
         ],
+        reuse_if_unchanged=True,
     )
 
     print("✅ Stage 2 completed: Compute and analytics deployed")
@@ -268,6 +272,77 @@ def example_event_driven_staging():
     print("✅ Event-driven solution deployed in optimized stages")
 
 
+# ============================================================================
+# Example 8: Parallel Deployment Within Stages
+# ============================================================================
+
+
+def example_parallel_within_stage():
+    """
+    Deploy the item types of each stage concurrently, with stages as barriers.
+
+    Dependency model: a stage may depend on any earlier stage, but item types in
+    the same stage must not depend on each other. With parallel_within_stage > 1
+    each item type in a stage gets its own deployer and they publish side by side,
+    so a stage takes roughly as long as its slowest item type. The next stage only
+    starts once every item type in the current one has finished.
+
+    Note that KQLDatabase depends on its Eventhouse, and Notebooks, Eventstreams,
+    SemanticModels and KQLDashboards can reference a KQLDatabase, so each of these
+    gets a later stage here (sequential stages can keep them together, as in Example 1).
+    The stages match compute_item_type_stages() with DEFAULT_ITEM_DEPS (see Example 9).
+    """
+
+    launcher = FabricLauncher(notebookutils)
+
+    launcher.download_and_deploy(
+        repo_owner="myorg",
+        repo_name="my-solution",
+        workspace_folder="workspace",
+        item_type_stages=[
+            ["Lakehouse", "Eventhouse"],  # Stage 1: Independent data stores
+            ["KQLDatabase"],  # Stage 2: Depends on its Eventhouse
+            ["Notebook", "Eventstream", "SemanticModel", "KQLDashboard"],  # Stage 3: Depend on stages 1-2 only
+            ["Report"],  # Stage 4: Depends on SemanticModel
+        ],
+        parallel_within_stage=4,
+    )
+
+    print("✅ Stage-parallel deployment completed!")
+
+
+# ============================================================================
+# Example 9: Stages Derived from Item Type Dependencies
+# ============================================================================
+
+
+def example_auto_staged_deployment():
+    """
+    Let the launcher compute the stages instead of listing them by hand.
+
+    auto_stage=True groups item_types into the fewest stages allowed by the item
+    type dependencies in DEFAULT_ITEM_DEPS (e.g. KQLDatabase after Eventhouse,
+    Report after SemanticModel). Combined with parallel_within_stage, every
+    independent item type in a stage is deployed at the same time.
+    """
+
+    item_types = ["Lakehouse", "Eventhouse", "KQLDatabase", "Notebook", "Eventstream", "SemanticModel", "Report"]
+    print(f"📋 Planned stages: {compute_item_type_stages(item_types)}")
+
+    launcher = FabricLauncher(notebookutils)
+
+    launcher.download_and_deploy(
+        repo_owner="myorg",
+        repo_name="my-solution",
+        workspace_folder="workspace",
+        item_types=item_types,
+        auto_stage=True,
+        parallel_within_stage=4,
+    )
+
+    print("✅ Auto-staged deployment completed!")
+
+
 # ============================================================================
 # Run Examples
 # ============================================================================
@@ -285,3 +360,5 @@ if __name__ == "__main__":
     # example_environment_based_staging()
     # example_staged_with_validation()
     # example_event_driven_staging()
+    # example_parallel_within_stage()
+    # example_auto_staged_deployment()
@@ -13,28 +13,92 @@ Designed to be used within Fabric Python notebooks with notebookutils available.
 
 __version__ = "0.4.1"
 
-from .config_manager import DeploymentConfig
-from .deployment_report import DeploymentReport
-from .deployment_validator import DeploymentValidator
-from .fabric_deployer import FabricDeployer, FabricNotebookTokenCredential
-from .file_operations import LakehouseFileManager
-from .github_downloader import GitHubDownloader
-from .launcher import FabricLauncher
-from .notebook_executor import NotebookExecutor
-from .post_deployment_utils import (
-    create_accelerated_shortcut_in_kql_db,
-    create_or_update_fabric_item,
-    create_shortcut,
-    exec_kql_command,
-    exec_sql_query,
-    get_folder_id_by_name,
-    get_item_definition_from_repo,
-    get_kusto_query_uri,
-    get_sql_endpoint,
-    move_item_to_folder,
-    replace_logical_ids,
-    scan_logical_ids,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config_manager import DeploymentConfig
+    from .dependency_dag import DEFAULT_ITEM_DEPS, compute_item_type_stages
+    from .deployment_report import DeploymentReport
+    from .deployment_validator import DeploymentValidator
+    from .fabric_deployer import FabricDeployer, FabricNotebookTokenCredential
+    from .file_operations import LakehouseFileManager
+    from .github_downloader import GitHubDownloader
+    from .launcher import FabricLauncher
+    from .notebook_executor import NotebookExecutor
+    from .post_deployment_utils import (
+        compile_logical_id_replacer,
+        create_accelerated_shortcut_in_kql_db,
+        create_or_update_fabric_item,
+        create_shortcut,
+        exec_kql_command,
+        exec_sql_query,
+        get_folder_id_by_name,
+        get_item_definition_from_repo,
+        get_kusto_query_uri,
+        get_sql_endpoint,
+        move_item_to_folder,
+        move_item_to_folder_by_id,
+        prefetch_workspace_index,
+        replace_logical_ids,
+        scan_logical_ids,
+        scan_logical_ids_iter,
+    )
+
+# Public name -> submodule defining it. Submodules (and their yaml, requests and
+# fabric-cicd imports) are only loaded when one of their names is first used.
+_LAZY_EXPORTS = {
+    "DeploymentConfig": "config_manager",
+    "DEFAULT_ITEM_DEPS": "dependency_dag",
+    "compute_item_type_stages": "dependency_dag",
+    "DeploymentReport": "deployment_report",
+    "DeploymentValidator": "deployment_validator",
+    "FabricDeployer": "fabric_deployer",
+    "FabricNotebookTokenCredential": "fabric_deployer",
+    "LakehouseFileManager": "file_operations",
+    "GitHubDownloader": "github_downloader",
+    "FabricLauncher": "launcher",
+    "NotebookExecutor": "notebook_executor",
+    "compile_logical_id_replacer": "post_deployment_utils",
+    "create_accelerated_shortcut_in_kql_db": "post_deployment_utils",
+    "create_or_update_fabric_item": "post_deployment_utils",
+    "create_shortcut": "post_deployment_utils",
+    "exec_kql_command": "post_deployment_utils",
+    "exec_sql_query": "post_deployment_utils",
+    "get_folder_id_by_name": "post_deployment_utils",
+    "get_item_definition_from_repo": "post_deployment_utils",
+    "get_kusto_query_uri": "post_deployment_utils",
+    "get_sql_endpoint": "post_deployment_utils",
+    "move_item_to_folder": "post_deployment_utils",
+    "move_item_to_folder_by_id": "post_deployment_utils",
+    "prefetch_workspace_index": "post_deployment_utils",
+    "replace_logical_ids": "post_deployment_utils",
+    "scan_logical_ids": "post_deployment_utils",
+    "scan_logical_ids_iter": "post_deployment_utils",
+}
+
+
+# Submodules reachable as package attributes (fabric_launcher.post_deployment_utils, ...),
+# as they were when the package imported them eagerly
+_SUBMODULES = frozenset(_LAZY_EXPORTS.values()) | {"platform_file_fixer"}
+
+
+def __getattr__(name: str):
+    """Import public names and submodules on first access (PEP 562)."""
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        module_name = _LAZY_EXPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "FabricLauncher",
@@ -46,13 +110,20 @@ __all__ = [
     "DeploymentConfig",
     "DeploymentValidator",
     "DeploymentReport",
+    # Deployment staging
+    "DEFAULT_ITEM_DEPS",
+    "compute_item_type_stages",
     # Post-deployment utilities
     "get_folder_id_by_name",
     "get_item_definition_from_repo",
     "scan_logical_ids",
+    "scan_logical_ids_iter",
     "replace_logical_ids",
+    "compile_logical_id_replacer",
     "create_or_update_fabric_item",
     "move_item_to_folder",
+    "move_item_to_folder_by_id",
+    "prefetch_workspace_index",
     "get_kusto_query_uri",
     "exec_kql_command",
     "create_shortcut",
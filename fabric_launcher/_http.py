@@ -0,0 +1,54 @@
+"""Shared HTTP Session Module
+
+This module provides the requests session used for GitHub downloads. Reusing one
+session keeps connections to GitHub alive between requests (no new TCP and TLS
+handshake per file) and retries transient failures with backoff.
+"""
+
+__all__ = ["github_get"]
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry transient GitHub errors; the final response is returned so callers can raise_for_status()
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    raise_on_status=False,
+)
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+                _SESSION = session
+    return _SESSION
+
+
+def github_get(url: str, headers: dict[str, str] | None = None, timeout: float = 30, **kwargs) -> requests.Response:
+    """
+    Send a GET request to GitHub through the shared session.
+
+    Args:
+        url: URL to request
+        headers: Optional request headers
+        timeout: Seconds to wait for the server to send data (default: 30)
+        **kwargs: Additional arguments passed to requests.Session.get (e.g. stream=True)
+
+    Returns:
+        The response (not checked; call raise_for_status() as needed)
+    """
+    return _get_session().get(url, headers=headers, timeout=timeout, **kwargs)
@@ -6,14 +6,277 @@ from YAML or JSON files. Supports downloading config files from GitHub repositor
 
 __all__ = ["DeploymentConfig"]
 
+import contextlib
+import copy
+import hashlib
 import json
+import os
+import stat
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import requests
 import yaml
 
+from ._http import github_get
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+except ImportError:  # optional: pip install fabric-launcher[speedups]
+    orjson = None
+
+# Parsed configuration files shared by every DeploymentConfig instance in the process.
+# Keyed by absolute path; entries are only reused while (st_mtime_ns, st_size) match.
+_CONFIG_CACHE: OrderedDict[str, tuple[int, int, dict[str, Any]]] = OrderedDict()
+_CONFIG_CACHE_MAXSIZE = 100
+
+# Suffix of the JSON cache file written next to local YAML configs
+CACHE_FILE_SUFFIX = ".cache.json"
+
+# Configs downloaded from GitHub without save_to are kept here, one file per repo/branch/path.
+# The directory is per user: the temp directory is shared on POSIX systems.
+_UID = os.getuid() if hasattr(os, "getuid") else None
+GITHUB_CONFIG_CACHE_DIR = Path(tempfile.gettempdir()) / (
+    f"fabric_launcher_cfgcache_{_UID}" if _UID is not None else "fabric_launcher_cfgcache"
+)
+
+# Process umask, read once at import because os.umask() can only be read by setting it
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+# Suffix of the file holding a download's validators (ETag, Last-Modified)
+DOWNLOAD_META_SUFFIX = ".meta"
+
+
+def _github_config_cache_path(repo_owner: str, repo_name: str, branch: str, file_path: str) -> Path:
+    """Return the cache location for a GitHub config, keyed by repository, branch and path."""
+    key = hashlib.blake2b(f"{repo_owner}/{repo_name}/{branch}/{file_path}".encode(), digest_size=16).hexdigest()
+    return GITHUB_CONFIG_CACHE_DIR / f"{key}{Path(file_path).suffix}"
+
+
+def _is_private_dir(path: Path) -> bool:
+    """Return True if path is a real directory owned by the current user and closed to group and others."""
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if _UID is None:
+        return True
+    return st.st_uid == _UID and not st.st_mode & 0o077
+
+
+def _loads_json(data: bytes | str) -> Any:
+    """
+    Parse JSON written by this module (cache files), using orjson when it is installed.
+
+    Not used for user configs: orjson reads integers beyond 64 bits as floats and rejects
+    NaN and out-of-range numbers, which the standard library accepts.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(data: Any, indent: bool = False) -> str:
+    """Serialize data as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-string keys or integers beyond 64 bits; the standard library handles those
+    return json.dumps(data, indent=2 if indent else None)
+
+
+def _read_download_meta(meta_path: Path) -> dict[str, str]:
+    """Read the validators stored for a downloaded file; empty if missing or unreadable."""
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _read_cache_file(cache_file: Path, source_stat) -> dict[str, Any] | None:
+    """
+    Read a JSON cache file written by _write_cache_file.
+
+    Args:
+        cache_file: Path to the ``.cache.json`` file next to the YAML config
+        source_stat: ``os.stat_result`` of the YAML config the cache must match
+
+    Returns:
+        Cached configuration dictionary, or None if missing, unreadable or stale
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            payload = _loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("source_mtime_ns") != source_stat.st_mtime_ns
+        or payload.get("source_size") != source_stat.st_size
+    ):
+        return None
+    return payload.get("config")
+
+
+def _write_cache_file(cache_file: Path, source_stat, data: dict[str, Any]) -> None:
+    """
+    Atomically write a JSON cache of a parsed YAML config (best effort).
+
+    Nothing is written if the config does not survive a JSON round-trip unchanged
+    (e.g. YAML dates or non-string keys), or if the directory is not writable.
+
+    Args:
+        cache_file: Path to the ``.cache.json`` file next to the YAML config
+        source_stat: ``os.stat_result`` of the YAML config that was parsed
+        data: Parsed configuration dictionary
+    """
+    try:
+        serialized = _dumps_json(data)
+        if _loads_json(serialized) != data:
+            return
+    except (TypeError, ValueError):
+        return
+
+    payload = (
+        f'{{"source_mtime_ns": {source_stat.st_mtime_ns}, "source_size": {source_stat.st_size}, '
+        f'"config": {serialized}}}'
+    )
+    with contextlib.suppress(OSError):
+        _write_file_atomically(cache_file, payload)
+
+
+def _write_file_atomically(path: Path, contents: str | bytes) -> None:
+    """
+    Write a file via a temporary file in the same directory and an atomic rename.
+
+    The file keeps the permissions of the file it replaces; a new file gets the default
+    permissions for the process umask (the temporary file itself is created owner-only).
+
+    Args:
+        path: Destination file
+        contents: File contents (text is written as UTF-8)
+
+    Raises:
+        OSError: If the file cannot be written (the temporary file is removed)
+    """
+    if isinstance(contents, str):
+        contents = contents.encode("utf-8")
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        mode = 0o666 & ~_UMASK
+    with tempfile.NamedTemporaryFile(mode="wb", dir=path.parent, prefix=f".{path.name}.", delete=False) as temp_file:
+        temp_path = Path(temp_file.name)
+        try:
+            temp_file.write(contents)
+        except BaseException:
+            temp_file.close()
+            temp_path.unlink(missing_ok=True)
+            raise
+    try:
+        temp_path.chmod(mode)
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _load_config_file(config_path: Path, file_ext: str, use_cache_file: bool = False) -> dict[str, Any]:
+    """
+    Parse a configuration file, reusing a previous parse if the file is unchanged.
+
+    Args:
+        config_path: Path to configuration file
+        file_ext: Lower-cased file extension (".yaml", ".yml" or ".json")
+        use_cache_file: For YAML files, read and maintain a ``<config>.cache.json``
+                        file next to the config so later processes can skip YAML parsing
+
+    Returns:
+        Deep copy of the parsed configuration dictionary
+    """
+    resolved_path = config_path.resolve()
+    cache_key = str(resolved_path)
+    source_stat = resolved_path.stat()
+
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == source_stat.st_mtime_ns and cached[1] == source_stat.st_size:
+        _CONFIG_CACHE.move_to_end(cache_key)
+        return copy.deepcopy(cached[2])
+
+    is_yaml = file_ext in [".yaml", ".yml"]
+    cache_file = Path(f"{cache_key}{CACHE_FILE_SUFFIX}")
+    data = _read_cache_file(cache_file, source_stat) if is_yaml and use_cache_file else None
+
+    if data is None:
+        if file_ext not in (".yaml", ".yml", ".json"):
+            raise ValueError(f"Unsupported file format: {file_ext}. Use .yaml, .yml, or .json")
+        with open(config_path, "rb") as f:
+            data = _parse_config(f.read(), file_ext)
+
+        if is_yaml and use_cache_file:
+            _write_cache_file(cache_file, source_stat, data)
+
+    _remember_parsed_config(cache_key, source_stat, data)
+    return copy.deepcopy(data)
+
+
+def _parse_config(content: str | bytes, file_ext: str) -> dict[str, Any]:
+    """
+    Parse YAML or JSON configuration content.
+
+    Args:
+        content: File contents
+        file_ext: Lower-cased file extension (".yaml", ".yml" or ".json")
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    if file_ext in (".yaml", ".yml"):
+        return yaml.load(content, Loader=_SafeLoader) or {}
+    if file_ext == ".json":
+        # The standard library, so a config parses the same with or without orjson installed
+        return json.loads(content)
+    raise ValueError(f"Unsupported file format: {file_ext}. Use .yaml, .yml, or .json")
+
+
+def _remember_parsed_config(cache_key: str, source_stat, data: dict[str, Any]) -> None:
+    """Store a parsed config in the process-wide cache, evicting the least recently used entry."""
+    _CONFIG_CACHE[cache_key] = (source_stat.st_mtime_ns, source_stat.st_size, data)
+    _CONFIG_CACHE.move_to_end(cache_key)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAXSIZE:
+        _CONFIG_CACHE.popitem(last=False)
+
+
+def _prime_config_cache(config_path: Path, content: bytes) -> None:
+    """
+    Parse a config that was just written to disk from memory and cache it for that file (best effort).
+
+    load_config() then finds the parse in the process-wide cache instead of re-reading the file.
+    Invalid content is left for load_config() to report.
+    """
+    try:
+        data = _parse_config(content, config_path.suffix.lower())
+        resolved_path = config_path.resolve()
+        _remember_parsed_config(str(resolved_path), resolved_path.stat(), data)
+    except (OSError, ValueError, yaml.YAMLError):
+        pass
+
 
 class DeploymentConfig:
     """
@@ -31,6 +294,8 @@ class DeploymentConfig:
         config_file_path: str | None = None,
         branch: str = "main",
         github_token: str | None = None,
+        use_cache_file: bool = False,
+        save_to: str | None = None,
     ):
         """
         Initialize the configuration manager.
@@ -44,6 +309,14 @@ class DeploymentConfig:
             config_file_path: Path to config file within the GitHub repository
             branch: Git branch to download from (default: "main")
             github_token: GitHub personal access token (optional, for private repos)
+            use_cache_file: Keep a ``<config>.cache.json`` file next to local YAML configs so
+                            later notebook sessions can skip YAML parsing. Off by default because
+                            the file is written beside the config, e.g. in the user's repository
+                            (default: False)
+            save_to: Local path to keep a config downloaded from GitHub at (optional, defaults to
+                     a per-repository file in GITHUB_CONFIG_CACHE_DIR). The response ETag and
+                     Last-Modified are stored in ``<save_to>.meta`` and later downloads send them as
+                     ``If-None-Match``/``If-Modified-Since``; on HTTP 304 the file is left untouched.
 
         Example (local file):
             config = DeploymentConfig(config_path="deployment_config.yaml")
@@ -58,6 +331,7 @@ class DeploymentConfig:
         """
         self.config_path = config_path
         self.config: dict[str, Any] = {}
+        self.use_cache_file = use_cache_file
 
         # If GitHub parameters provided, download config from GitHub
         if repo_owner and repo_name and config_file_path:
@@ -68,15 +342,26 @@ class DeploymentConfig:
                 file_path=config_file_path,
                 branch=branch,
                 github_token=github_token,
+                save_to=save_to,
             )
             print("✅ Configuration downloaded successfully")
+            if not save_to and Path(self.config_path).parent != GITHUB_CONFIG_CACHE_DIR:
+                # Fell back to a fresh temp file; a cache file next to it would never be reused
+                self.use_cache_file = False
 
         # Load config from local path
-        if self.config_path and Path(self.config_path).exists():
-            self.load_config(self.config_path)
+        if self.config_path:
+            with contextlib.suppress(FileNotFoundError):
+                self.load_config(self.config_path)
 
     def _download_config_from_github(
-        self, repo_owner: str, repo_name: str, file_path: str, branch: str = "main", github_token: str | None = None
+        self,
+        repo_owner: str,
+        repo_name: str,
+        file_path: str,
+        branch: str = "main",
+        github_token: str | None = None,
+        save_to: str | None = None,
     ) -> str:
         """
         Download a configuration file from a GitHub repository.
@@ -87,9 +372,11 @@ class DeploymentConfig:
             file_path: Path to config file within the repository
             branch: Git branch (default: "main")
             github_token: GitHub personal access token (optional)
+            save_to: Local path to save the file to (optional, defaults to a file in
+                     GITHUB_CONFIG_CACHE_DIR keyed by repository, branch and file path)
 
         Returns:
-            Path to downloaded configuration file (in temp directory)
+            Path to downloaded configuration file
 
         Raises:
             Exception: If download fails
@@ -102,18 +389,54 @@ class DeploymentConfig:
         if github_token:
             headers["Authorization"] = f"token {github_token}"
 
+        # Without save_to, keep the download in a per-repository cache so repeated loads can revalidate
+        if not save_to:
+            cache_path = _github_config_cache_path(repo_owner, repo_name, branch, file_path)
+            with contextlib.suppress(OSError):
+                cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Never trust (or write into) a cache directory another user could have planted or can modify
+            if _is_private_dir(cache_path.parent):
+                save_to = str(cache_path)
+            else:
+                print(f"⚠️ Config cache directory {cache_path.parent} is not private, downloading without cache")
+
+        # Revalidate a previously saved copy instead of downloading it again
+        meta_path = Path(f"{save_to}{DOWNLOAD_META_SUFFIX}") if save_to else None
+        if meta_path and Path(save_to).exists():
+            meta = _read_download_meta(meta_path)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
         try:
             # Download the file
-            response = requests.get(url, headers=headers, timeout=30)
+            response = github_get(url, headers=headers, timeout=30)
+            if meta_path and response.status_code == 304:
+                print(f"♻️ Configuration unchanged on GitHub, reusing {save_to}")
+                return save_to
             response.raise_for_status()
 
+            if save_to:
+                _write_file_atomically(Path(save_to), response.content)
+                _prime_config_cache(Path(save_to), response.content)
+                meta = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                meta = {key: value for key, value in meta.items() if value}
+                if meta:
+                    _write_file_atomically(meta_path, json.dumps(meta))
+                else:
+                    meta_path.unlink(missing_ok=True)
+                return save_to
+
             # Save to temporary file
             file_extension = Path(file_path).suffix
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=file_extension, delete=False, encoding="utf-8"
-            ) as temp_file:
-                temp_file.write(response.text)
-                return temp_file.name
+            with tempfile.NamedTemporaryFile(mode="wb", suffix=file_extension, delete=False) as temp_file:
+                temp_file.write(response.content)
+            _prime_config_cache(Path(temp_file.name), response.content)
+            return temp_file.name
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -142,6 +465,11 @@ class DeploymentConfig:
         """
         Load configuration from a YAML or JSON file.
 
+        Parsed files are cached per process and reused while the file's modification
+        time and size are unchanged, so repeated loads of the same file skip parsing.
+        When ``use_cache_file`` is enabled, YAML files also get a ``.cache.json`` file
+        alongside them that is reused across processes while the YAML is unchanged.
+
         Args:
             config_path: Path to configuration file
 
@@ -152,23 +480,17 @@ class DeploymentConfig:
             FileNotFoundError: If config file doesn't exist
             ValueError: If file format is not supported
         """
-        if not Path(config_path).exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        file_ext = Path(config_path).suffix.lower()
+        path = Path(config_path)
 
         try:
-            with open(config_path, encoding="utf-8") as f:
-                if file_ext in [".yaml", ".yml"]:
-                    self.config = yaml.safe_load(f) or {}
-                elif file_ext == ".json":
-                    self.config = json.load(f)
-                else:
-                    raise ValueError(f"Unsupported file format: {file_ext}. Use .yaml, .yml, or .json")
+            # No separate exists() check: a missing file surfaces from the stat/open in _load_config_file
+            self.config = _load_config_file(path, path.suffix.lower(), use_cache_file=self.use_cache_file)
 
             print(f"✅ Configuration loaded from {config_path}")
             return self.config
 
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format: {e}") from e
         except json.JSONDecodeError as e:
@@ -190,8 +512,7 @@ class DeploymentConfig:
         """
         # Check environment-specific override first
         if environment:
-            env_key = f"environments.{environment}.{key}"
-            value = self._get_nested(self.config, env_key)
+            value = self._get_nested(self.config, f"environments.{environment}.{key}")
             if value is not None:
                 return value
 
@@ -199,19 +520,15 @@ class DeploymentConfig:
         value = self._get_nested(self.config, key)
         return value if value is not None else default
 
-    def _get_nested(self, data: dict, key: str) -> Any:
+    def _get_nested(self, data: Any, key: str) -> Any:
         """Get nested dictionary value using dot notation."""
-        keys = key.split(".")
         value = data
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return None
-            else:
+        for k in key.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(k)
+            if value is None:
                 return None
-
         return value
 
     def get_github_config(self, environment: str | None = None) -> dict[str, Any]:
@@ -262,11 +579,7 @@ class DeploymentConfig:
         Returns:
             List of missing fields
         """
-        missing = []
-        for field in required_fields:
-            if self.get(field, environment=environment) is None:
-                missing.append(field)
-        return missing
+        return [field for field in required_fields if self.get(field, environment=environment) is None]
 
     def save_config(self, output_path: str, format: str = "yaml") -> None:
         """
@@ -279,9 +592,9 @@ class DeploymentConfig:
         try:
             with open(output_path, "w", encoding="utf-8") as f:
                 if format.lower() == "yaml":
-                    yaml.safe_dump(self.config, f, default_flow_style=False, sort_keys=False)
+                    yaml.dump(self.config, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
                 elif format.lower() == "json":
-                    json.dump(self.config, f, indent=2)
+                    f.write(_dumps_json(self.config, indent=True))
                 else:
                     raise ValueError(f"Unsupported format: {format}")
 
@@ -334,9 +647,9 @@ class DeploymentConfig:
         try:
             with open(output_path, "w", encoding="utf-8") as f:
                 if format.lower() == "yaml":
-                    yaml.safe_dump(template, f, default_flow_style=False, sort_keys=False)
+                    yaml.dump(template, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
                 elif format.lower() == "json":
-                    json.dump(template, f, indent=2)
+                    f.write(_dumps_json(template, indent=True))
                 else:
                     raise ValueError(f"Unsupported format: {format}")
 
@@ -0,0 +1,71 @@
+"""Item Type Dependency Module
+
+This module derives deployment stages from dependencies between Fabric item types,
+so callers can list the item types to deploy instead of hand-writing item_type_stages.
+"""
+
+__all__ = ["DEFAULT_ITEM_DEPS", "compute_item_type_stages"]
+
+import graphlib
+
+# Item type -> item types it references and that must be deployed before it
+DEFAULT_ITEM_DEPS: dict[str, set[str]] = {
+    "KQLDatabase": {"Eventhouse"},
+    "KQLQueryset": {"KQLDatabase"},
+    "KQLDashboard": {"KQLDatabase"},
+    "Notebook": {"Lakehouse", "KQLDatabase", "Environment"},
+    "SemanticModel": {"Lakehouse", "Warehouse", "KQLDatabase"},
+    "Report": {"SemanticModel"},
+    "Eventstream": {"Eventhouse", "KQLDatabase", "Lakehouse"},
+    "DataPipeline": {"Notebook", "Lakehouse", "Warehouse"},
+}
+
+
+def compute_item_type_stages(item_types: list[str], dependencies: dict[str, set[str]] | None = None) -> list[list[str]]:
+    """
+    Group item types into deployment stages with graphlib's topological sorter.
+
+    Each stage holds every item type whose dependencies were deployed in earlier
+    stages, which gives the fewest stages possible. Dependencies on item types that
+    are not in item_types are ignored. Within a stage, item types keep their order
+    in item_types.
+
+    Args:
+        item_types: Item types to deploy
+        dependencies: Item type -> item types it depends on (default: DEFAULT_ITEM_DEPS)
+
+    Returns:
+        List of stages, each a list of item types, suitable for item_type_stages
+
+    Raises:
+        ValueError: If the dependencies between the given item types contain a cycle
+
+    Example:
+        >>> compute_item_type_stages(["Report", "Lakehouse", "SemanticModel", "Eventhouse"])
+        [['Lakehouse', 'Eventhouse'], ['SemanticModel'], ['Report']]
+    """
+    if dependencies is None:
+        dependencies = DEFAULT_ITEM_DEPS
+
+    # Position in item_types orders each stage, so stages are reproducible and follow the caller's order
+    order = {item_type: index for index, item_type in enumerate(dict.fromkeys(item_types))}
+
+    sorter = graphlib.TopologicalSorter(
+        {
+            item_type: [dependency for dependency in dependencies.get(item_type, ()) if dependency in order]
+            for item_type in order
+        }
+    )
+    try:
+        sorter.prepare()
+    except graphlib.CycleError as e:
+        raise ValueError(f"❌ Circular dependency between item types: {' -> '.join(e.args[1])}") from e
+
+    # Every item type returned by get_ready() has all of its dependencies in earlier stages
+    stages: list[list[str]] = []
+    while sorter.is_active():
+        stage = sorted(sorter.get_ready(), key=order.__getitem__)
+        stages.append(stage)
+        sorter.done(*stage)
+
+    return stages
@@ -6,10 +6,61 @@ This module provides functionality to generate comprehensive deployment reports.
 __all__ = ["DeploymentReport"]
 
 import json
+import re
+import sys
+import time
+from collections import Counter
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: pip install fabric-launcher[speedups]
+    orjson = None
+
+# Icon shown for each step status in print_report(); any other status counts as a failure
+_STEP_STATUS_ICONS = {"success": "✅", "warning": "⚠️"}
+_REPORT_SEPARATOR = "=" * 60
+
+# ASCII replacements for the icons in printed reports, used when stdout cannot encode emoji
+_PLAIN_TEXT_ICONS = {
+    "✅": "[OK]",
+    "❌": "[FAILED]",
+    "⚠️": "[WARNING]",
+    "•": "-",
+    "📊 ": "",
+    "⏱️ ": "",
+    "📦 ": "",
+    "📁 ": "",
+    "▶️ ": "",
+    "📋 ": "",
+}
+_PLAIN_TEXT_PATTERN = re.compile("|".join(re.escape(icon) for icon in sorted(_PLAIN_TEXT_ICONS, key=len, reverse=True)))
+
+
+def _stdout_supports_emoji() -> bool:
+    """Check whether stdout uses a UTF encoding (as Fabric notebooks do)."""
+    encoding = getattr(sys.stdout, "encoding", None) or ""
+    return encoding.lower().replace("-", "").startswith("utf")
+
+
+def _to_plain_text(text: str) -> str:
+    """Replace the emoji in printed output with their ASCII markers."""
+    return _PLAIN_TEXT_PATTERN.sub(lambda match: _PLAIN_TEXT_ICONS[match.group()], text)
+
+
+def _dumps_report(data: dict[str, Any]) -> bytes:
+    """Serialize report data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the standard library handles those
+    return json.dumps(data, indent=2).encode("utf-8")
+
 
 class DeploymentReport:
     """
@@ -18,8 +69,15 @@ class DeploymentReport:
     Tracks deployment activities and generates summary reports.
     """
 
-    def __init__(self):
-        """Initialize the deployment report."""
+    def __init__(self, plain_text: bool | None = None):
+        """
+        Initialize the deployment report.
+
+        Args:
+            plain_text: Print the report with ASCII markers instead of emoji
+                        (default: None, only when stdout is not UTF-encoded)
+        """
+        self.plain_text = not _stdout_supports_emoji() if plain_text is None else plain_text
         now = datetime.now()
         self.session_id = now.strftime("%Y%m%d_%H%M%S")
         self.timestamp = now.isoformat()
@@ -27,12 +85,20 @@ class DeploymentReport:
         self.steps: list[dict[str, Any]] = []
         self.deployed_items: list[dict[str, Any]] = []
 
+        # Running totals for get_summary(), updated by add_deployed_item() and add_uploaded_files()
+        self._items_by_type: Counter[str] = Counter()
+        self._total_files = 0
+
+        # (monotonic millisecond, ISO timestamp) of the last event, see _now_iso()
+        self._now_cache: tuple[int, str] = (time.monotonic_ns() // 1_000_000, self.timestamp)
+
         self.report_data: dict[str, Any] = {
             "session_id": self.session_id,
             "timestamp": self.timestamp,
             "deployment_start": self.timestamp,
             "deployment_end": None,
             "deployment_duration_seconds": 0,
+            # Same list objects as self.steps / self.deployed_items, so appends show up in both
             "steps": self.steps,
             "items_deployed": self.deployed_items,
             "files_uploaded": [],
@@ -42,6 +108,15 @@ class DeploymentReport:
             "success": False,
         }
 
+    def _now_iso(self) -> str:
+        """Get the current time as an ISO 8601 string, formatted at most once per millisecond."""
+        tick = time.monotonic_ns() // 1_000_000
+        cached_tick, timestamp = self._now_cache
+        if tick != cached_tick:
+            timestamp = datetime.now().isoformat()
+            self._now_cache = (tick, timestamp)
+        return timestamp
+
     def start_deployment(self, **kwargs) -> None:
         """Mark the start of deployment."""
         self.start_time = datetime.now()
@@ -64,10 +139,9 @@ class DeploymentReport:
 
     @property
     def duration_seconds(self) -> float:
-        """Get deployment duration in seconds."""
+        """Get deployment duration in seconds (elapsed so far if the deployment hasn't ended)."""
         if self.report_data["deployment_end"]:
             return self.report_data["deployment_duration_seconds"]
-        # Calculate current duration if deployment hasn't ended
         return round((datetime.now() - self.start_time).total_seconds(), 2)
 
     def add_step(self, step_name: str, status: str, details: str | None = None) -> None:
@@ -84,10 +158,9 @@ class DeploymentReport:
             "name": step_name,  # Keep both for compatibility
             "status": status,
             "details": details,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso(),
         }
         self.steps.append(step)
-        self.report_data["steps"] = self.steps
 
     def add_deployed_item(self, item_name: str, item_type: str, **kwargs) -> None:
         """
@@ -98,9 +171,9 @@ class DeploymentReport:
             item_type: Type of the item
             **kwargs: Additional item details
         """
-        item = {"name": item_name, "type": item_type, "timestamp": datetime.now().isoformat(), **kwargs}
+        item = {"name": item_name, "type": item_type, "timestamp": self._now_iso(), **kwargs}
         self.deployed_items.append(item)
-        self.report_data["items_deployed"] = self.deployed_items
+        self._items_by_type[item_type] += 1
 
     def add_uploaded_files(self, lakehouse: str, folder: str, file_count: int) -> None:
         """
@@ -116,9 +189,10 @@ class DeploymentReport:
                 "lakehouse": lakehouse,
                 "folder": folder,
                 "file_count": file_count,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._now_iso(),
             }
         )
+        self._total_files += file_count
 
     def add_notebook_execution(self, notebook_name: str, job_id: str, status: str = "triggered") -> None:
         """
@@ -130,7 +204,7 @@ class DeploymentReport:
             status: Execution status
         """
         self.report_data["notebooks_executed"].append(
-            {"notebook": notebook_name, "job_id": job_id, "status": status, "timestamp": datetime.now().isoformat()}
+            {"notebook": notebook_name, "job_id": job_id, "status": status, "timestamp": self._now_iso()}
         )
 
     def add_error(self, error: str, step: str | None = None) -> None:
@@ -141,7 +215,7 @@ class DeploymentReport:
             error: Error message
             step: Optional step where error occurred
         """
-        self.report_data["errors"].append({"message": error, "step": step, "timestamp": datetime.now().isoformat()})
+        self.report_data["errors"].append({"message": error, "step": step, "timestamp": self._now_iso()})
 
     def add_warning(self, warning: str, step: str | None = None) -> None:
         """
@@ -151,7 +225,7 @@ class DeploymentReport:
             warning: Warning message
             step: Optional step where warning occurred
         """
-        self.report_data["warnings"].append({"message": warning, "step": step, "timestamp": datetime.now().isoformat()})
+        self.report_data["warnings"].append({"message": warning, "step": step, "timestamp": self._now_iso()})
 
     def get_summary(self) -> dict[str, Any]:
         """
@@ -160,19 +234,12 @@ class DeploymentReport:
         Returns:
             Dictionary with summary statistics
         """
-        items_by_type = {}
-        for item in self.report_data["items_deployed"]:
-            item_type = item["type"]
-            items_by_type[item_type] = items_by_type.get(item_type, 0) + 1
-
-        total_files = sum(f["file_count"] for f in self.report_data["files_uploaded"])
-
         return {
             "success": self.report_data["success"],
-            "duration_seconds": self.report_data["deployment_duration_seconds"],
+            "duration_seconds": self.duration_seconds,
             "total_items_deployed": len(self.report_data["items_deployed"]),
-            "items_by_type": items_by_type,
-            "total_files_uploaded": total_files,
+            "items_by_type": dict(self._items_by_type),
+            "total_files_uploaded": self._total_files,
             "notebooks_executed": len(self.report_data["notebooks_executed"]),
             "errors": len(self.report_data["errors"]),
             "warnings": len(self.report_data["warnings"]),
@@ -181,75 +248,115 @@ class DeploymentReport:
     def print_report(self) -> None:
         """Print a formatted deployment report."""
         summary = self.get_summary()
+        # Collected and printed at once, so large reports don't pay for one stdout write per line
+        lines: list[str] = []
 
-        print("\n" + "=" * 60)
-        print("📊 DEPLOYMENT REPORT")
-        print("=" * 60)
+        lines.append("\n" + _REPORT_SEPARATOR)
+        lines.append("📊 DEPLOYMENT REPORT")
+        lines.append(_REPORT_SEPARATOR)
 
         # Status
         status_icon = "✅" if summary["success"] else "❌"
         status_text = "SUCCESS" if summary["success"] else "FAILED"
-        print(f"\n{status_icon} Status: {status_text}")
+        lines.append(f"\n{status_icon} Status: {status_text}")
 
         # Duration
         duration = summary["duration_seconds"]
         if duration >= 60:
             mins = int(duration // 60)
             secs = int(duration % 60)
-            print(f"⏱️ Duration: {mins}m {secs}s")
+            lines.append(f"⏱️ Duration: {mins}m {secs}s")
         else:
-            print(f"⏱️ Duration: {duration}s")
+            lines.append(f"⏱️ Duration: {duration}s")
 
         # Items deployed
         if summary["total_items_deployed"] > 0:
-            print(f"\n📦 Items Deployed: {summary['total_items_deployed']}")
+            lines.append(f"\n📦 Items Deployed: {summary['total_items_deployed']}")
             for item_type, count in summary["items_by_type"].items():
-                print(f"  • {item_type}: {count}")
+                lines.append(f"  • {item_type}: {count}")
 
         # Files uploaded
         if summary["total_files_uploaded"] > 0:
-            print(f"\n📁 Files Uploaded: {summary['total_files_uploaded']}")
+            lines.append(f"\n📁 Files Uploaded: {summary['total_files_uploaded']}")
             for file_info in self.report_data["files_uploaded"]:
-                print(f"  • {file_info['lakehouse']}/Files/{file_info['folder']}: {file_info['file_count']} file(s)")
+                lines.append(
+                    f"  • {file_info['lakehouse']}/Files/{file_info['folder']}: {file_info['file_count']} file(s)"
+                )
 
         # Notebooks executed
         if summary["notebooks_executed"] > 0:
-            print(f"\n▶️ Notebooks Executed: {summary['notebooks_executed']}")
+            lines.append(f"\n▶️ Notebooks Executed: {summary['notebooks_executed']}")
             for nb in self.report_data["notebooks_executed"]:
-                print(f"  • {nb['notebook']} (Job ID: {nb['job_id']})")
+                lines.append(f"  • {nb['notebook']} (Job ID: {nb['job_id']})")
 
         # Errors
         if summary["errors"] > 0:
-            print(f"\n❌ Errors: {summary['errors']}")
+            lines.append(f"\n❌ Errors: {summary['errors']}")
             for error in self.report_data["errors"]:
                 step_info = f" [{error['step']}]" if error["step"] else ""
-                print(f"  • {error['message']}{step_info}")
+                lines.append(f"  • {error['message']}{step_info}")
 
         # Warnings
         if summary["warnings"] > 0:
-            print(f"\n⚠️ Warnings: {summary['warnings']}")
+            lines.append(f"\n⚠️ Warnings: {summary['warnings']}")
             for warning in self.report_data["warnings"]:
                 step_info = f" [{warning['step']}]" if warning["step"] else ""
-                print(f"  • {warning['message']}{step_info}")
+                lines.append(f"  • {warning['message']}{step_info}")
 
         # Steps
         if self.report_data["steps"]:
-            print("\n📋 Deployment Steps:")
+            lines.append("\n📋 Deployment Steps:")
             for step in self.report_data["steps"]:
-                icon = "✅" if step["status"] == "success" else "⚠️" if step["status"] == "warning" else "❌"
-                print(f"  {icon} {step['name']}")
+                lines.append(f"  {_STEP_STATUS_ICONS.get(step['status'], '❌')} {step['name']}")
                 if step["details"]:
-                    print(f"      {step['details']}")
+                    lines.append(f"      {step['details']}")
+
+        lines.append("\n" + _REPORT_SEPARATOR)
 
-        print("\n" + "=" * 60)
+        text = "\n".join(lines)
+        if self.plain_text:
+            text = _to_plain_text(text)
+        print(text)
 
-    def to_dict(self) -> dict[str, Any]:
+    def _format_text_report(self) -> str:
+        """Build the plain text report written by save_report(format="text")."""
+        summary = self.get_summary()
+        status_text = "SUCCESS" if summary["success"] else "FAILED"
+
+        lines = [
+            _REPORT_SEPARATOR,
+            "DEPLOYMENT REPORT",
+            _REPORT_SEPARATOR,
+            "",
+            f"Status: {status_text}",
+            f"Duration: {summary['duration_seconds']}s",
+            f"Items Deployed: {summary['total_items_deployed']}",
+            f"Files Uploaded: {summary['total_files_uploaded']}",
+            f"Notebooks Executed: {summary['notebooks_executed']}",
+            f"Errors: {summary['errors']}",
+            f"Warnings: {summary['warnings']}",
+            "",
+        ]
+        if summary["items_by_type"]:
+            lines.append("Items by Type:")
+            lines.extend(f"  {item_type}: {count}" for item_type, count in summary["items_by_type"].items())
+        lines += ["", _REPORT_SEPARATOR, ""]
+
+        return "\n".join(lines)
+
+    def to_dict(self, view: bool = False) -> Mapping[str, Any]:
         """
         Convert report to dictionary.
 
+        Args:
+            view: Return a live read-only view of the top-level report data instead of a dict copy.
+                Only the top level is read-only; the event lists inside it are the report's own lists.
+
         Returns:
-            Dictionary representation of the report
+            Dictionary copy of the report, or a read-only view if view is True
         """
+        if view:
+            return MappingProxyType(self.report_data)
         return self.report_data.copy()
 
     def save_report(self, output_path: str | None = None, format: str = "json") -> str:
@@ -269,38 +376,19 @@ class DeploymentReport:
 
         try:
             # Create directory if it doesn't exist
-            output_path_obj = Path(output_path)
-            if output_path_obj.parent != Path():
-                output_path_obj.parent.mkdir(parents=True, exist_ok=True)
+            output_dir = Path(output_path).parent
+            if output_dir != Path():
+                output_dir.mkdir(parents=True, exist_ok=True)
 
             if format == "json":
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(self.report_data, f, indent=2)
+                with open(output_path, "wb") as f:
+                    f.write(_dumps_report(self.report_data))
                 print(f"✅ Deployment report saved to {output_path}")
 
             elif format == "text":
+                text = self._format_text_report()
                 with open(output_path, "w", encoding="utf-8") as f:
-                    summary = self.get_summary()
-
-                    f.write("=" * 60 + "\n")
-                    f.write("DEPLOYMENT REPORT\n")
-                    f.write("=" * 60 + "\n\n")
-
-                    status_text = "SUCCESS" if summary["success"] else "FAILED"
-                    f.write(f"Status: {status_text}\n")
-                    f.write(f"Duration: {summary['duration_seconds']}s\n")
-                    f.write(f"Items Deployed: {summary['total_items_deployed']}\n")
-                    f.write(f"Files Uploaded: {summary['total_files_uploaded']}\n")
-                    f.write(f"Notebooks Executed: {summary['notebooks_executed']}\n")
-                    f.write(f"Errors: {summary['errors']}\n")
-                    f.write(f"Warnings: {summary['warnings']}\n\n")
-
-                    if summary["items_by_type"]:
-                        f.write("Items by Type:\n")
-                        for item_type, count in summary["items_by_type"].items():
-                            f.write(f"  {item_type}: {count}\n")
-
-                    f.write("\n" + "=" * 60 + "\n")
+                    f.write(text)
 
                 print(f"✅ Deployment report saved to {output_path}")
 
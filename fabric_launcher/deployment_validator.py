@@ -6,10 +6,29 @@ and all items are accessible.
 
 __all__ = ["DeploymentValidator"]
 
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
+from .deployment_report import _stdout_supports_emoji, _to_plain_text
+
+try:
+    import orjson
+except ImportError:  # optional: pip install fabric-launcher[speedups]
+    orjson = None
+
+
+def _dumps_results(data: dict[str, Any]) -> bytes:
+    """Serialize validation results as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the standard library handles those
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
 
 class DeploymentValidator:
     """
@@ -18,20 +37,41 @@ class DeploymentValidator:
     Verifies that deployed items exist and are accessible.
     """
 
-    def __init__(self, workspace_id: str, notebookutils):
+    def __init__(self, workspace_id: str, notebookutils, cache_ttl_seconds: float = 0, plain_text: bool | None = None):
         """
         Initialize the deployment validator.
 
         Args:
             workspace_id: Target workspace ID
             notebookutils: The notebookutils module from Fabric notebook environment
+            cache_ttl_seconds: Reuse the results of an identical validate_deployment() call made
+                               within this many seconds instead of querying the workspace again
+                               (default: 0, always validate)
+            plain_text: Print item accessibility with ASCII markers instead of emoji
+                        (default: None, only when stdout is not UTF-encoded)
         """
         self.workspace_id = workspace_id
         self.notebookutils = notebookutils
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.plain_text = not _stdout_supports_emoji() if plain_text is None else plain_text
         self.validation_results: dict[str, Any] = {}
 
+        # Workspace items DataFrame from the last validation, see get_item_details()
+        self._items_frame = None
+
+        # (time.monotonic() of the validation, call arguments, results) of the last completed validation
+        self._results_cache: tuple[float, tuple, dict[str, Any]] | None = None
+
+    def invalidate(self) -> None:
+        """Discard cached validation results so the next validation queries the workspace."""
+        self._results_cache = None
+
     def validate_deployment(
-        self, expected_items: list[dict[str, str]] | None = None, check_accessibility: bool = True
+        self,
+        expected_items: list[dict[str, str]] | None = None,
+        check_accessibility: bool = True,
+        include_item_details: bool = True,
+        max_workers: int = 1,
     ) -> dict[str, Any]:
         """
         Validate that deployment was successful.
@@ -39,12 +79,31 @@ class DeploymentValidator:
         Args:
             expected_items: List of expected items with 'name' and 'type' keys
             check_accessibility: Whether to test item accessibility
+            include_item_details: Store every workspace item under results["items"] (default: True).
+                                  When False, only counts are stored; use get_item_details() to
+                                  build the item list later.
+            max_workers: Number of accessibility probes to run at the same time
+                         (default: 1, probe items one after another)
 
         Returns:
             Dictionary with validation results
         """
         import sempy.fabric as fabric
 
+        cache_key = (
+            self.workspace_id,
+            check_accessibility,
+            include_item_details,
+            tuple((expected["name"], expected["type"]) for expected in expected_items or ()),
+        )
+        if self.cache_ttl_seconds > 0 and self._results_cache is not None:
+            validated_at, cached_key, cached_results = self._results_cache
+            age = time.monotonic() - validated_at
+            if cached_key == cache_key and age < self.cache_ttl_seconds:
+                print(f"♻️ Reusing post-deployment validation results from {age:.0f}s ago")
+                self.validation_results = cached_results
+                return cached_results
+
         print("=" * 60)
         print("🔍 Starting Post-Deployment Validation")
         print("=" * 60)
@@ -63,6 +122,7 @@ class DeploymentValidator:
             # Get all items in workspace
             print("\n📋 Retrieving workspace items...")
             all_items = fabric.list_items(workspace=self.workspace_id)
+            self._items_frame = all_items
 
             if all_items.empty:
                 results["checks"]["items_exist"] = False
@@ -75,30 +135,27 @@ class DeploymentValidator:
                 print(f"✅ Found {item_count} item(s) in workspace")
 
                 # Group by type
-                items_by_type = all_items.groupby("Type").size().to_dict()
+                # Plain ints, so the saved report is the same with or without orjson
+                items_by_type = {
+                    item_type: int(count) for item_type, count in all_items.groupby("Type").size().to_dict().items()
+                }
                 results["items_by_type"] = items_by_type
 
                 print("\n📊 Items by type:")
                 for item_type, count in items_by_type.items():
                     print(f"  • {item_type}: {count}")
 
-                # Store all items
-                results["items"] = []
-                for _idx, item in all_items.iterrows():
-                    results["items"].append({"name": item["Display Name"], "type": item["Type"], "id": item["Id"]})
+                if include_item_details:
+                    results["items"] = self.get_item_details()
 
             # Validate expected items if provided
             if expected_items:
                 print("\n🎯 Validating expected items...")
                 missing_items = []
+                present = set(zip(all_items["Display Name"], all_items["Type"], strict=True))
 
                 for expected in expected_items:
-                    found = any(
-                        item["name"] == expected["name"] and item["type"] == expected["type"]
-                        for item in results["items"]
-                    )
-
-                    if not found:
+                    if (expected["name"], expected["type"]) not in present:
                         missing_items.append(f"{expected['name']} ({expected['type']})")
                         print(f"  ❌ Missing: {expected['name']} ({expected['type']})")
                     else:
@@ -115,7 +172,7 @@ class DeploymentValidator:
             # Test accessibility if requested
             if check_accessibility:
                 print("\n🔌 Testing item accessibility...")
-                accessibility_results = self._test_accessibility(all_items)
+                accessibility_results = self._test_accessibility(all_items, max_workers=max_workers)
                 results["checks"]["accessibility"] = accessibility_results
 
                 # Add compatibility keys for launcher.py
@@ -155,6 +212,8 @@ class DeploymentValidator:
             print(f"\n⏱️ Validation completed in {results['validation_duration_seconds']}s")
             print("=" * 60)
 
+            self._results_cache = (time.monotonic(), cache_key, results)
+
         except Exception as e:
             results["validation_passed"] = False
             results["errors"].append(f"Validation error: {str(e)}")
@@ -163,7 +222,23 @@ class DeploymentValidator:
         self.validation_results = results
         return results
 
-    def _test_accessibility(self, items) -> dict[str, Any]:
+    def get_item_details(self) -> list[dict[str, Any]]:
+        """
+        Get the workspace items listed by the last validate_deployment() call.
+
+        Returns:
+            List of items with 'name', 'type' and 'id' keys (empty before the first validation)
+        """
+        items = self._items_frame
+        if items is None or items.empty:
+            return []
+        # Read whole columns instead of materializing a row per item
+        return [
+            {"name": name, "type": item_type, "id": item_id}
+            for name, item_type, item_id in zip(items["Display Name"], items["Type"], items["Id"], strict=True)
+        ]
+
+    def _test_accessibility(self, items, max_workers: int = 1) -> dict[str, Any]:
         """
         Test if items exist and are accessible.
 
@@ -173,85 +248,74 @@ class DeploymentValidator:
 
         Args:
             items: DataFrame of items to test
+            max_workers: Number of probes to run at the same time (default: 1, sequential)
 
         Returns:
             Dictionary with accessibility results
         """
-        import sempy.fabric as fabric
-
         results = {
             "tested": 0,
             "accessible": 0,
             "failures": [],
             "items": [],  # Detailed item status
         }
+        # Per-item status lines, printed at once after all items are tested
+        lines: list[str] = []
+
+        # Older notebookutils versions have no getWithProperties; look it up once instead of failing per item
+        get_lakehouse = getattr(getattr(self.notebookutils, "lakehouse", None), "getWithProperties", None)
+
+        probes = list(zip(items["Display Name"], items["Type"], strict=True))
+        if not probes:
+            return results
 
-        for _idx, item in items.iterrows():
-            item_name = item["Display Name"]
-            item_type = item["Type"]
+        def probe_item(probe):
+            return self._probe_item(get_lakehouse, *probe)
 
+        # Both map() variants return outcomes in listing order, so results and output stay deterministic
+        if max_workers > 1 and len(probes) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(probes))) as executor:
+                outcomes = list(executor.map(probe_item, probes))
+        else:
+            outcomes = map(probe_item, probes)
+
+        for (item_name, item_type), (probed, error) in zip(probes, outcomes, strict=True):
             results["tested"] += 1
-            item_status = {"name": item_name, "type": item_type, "accessible": False, "error": None}
-
-            try:
-                # Test based on item type
-                if item_type == "Lakehouse":
-                    try:
-                        # Try to get lakehouse properties
-                        props = self.notebookutils.lakehouse.getWithProperties(item_name)
-                        if props:
-                            print(f"  ✅ Lakehouse '{item_name}' is accessible")
-                            results["accessible"] += 1
-                            item_status["accessible"] = True
-                        else:
-                            # No properties but exists - consider it accessible
-                            print(f"  ✅ Lakehouse '{item_name}' exists (properties not available)")
-                            results["accessible"] += 1
-                            item_status["accessible"] = True
-                    except Exception:
-                        # If we can't get properties, item still exists so count as accessible
-                        print(f"  ✅ Lakehouse '{item_name}' exists")
-                        results["accessible"] += 1
-                        item_status["accessible"] = True
-
-                elif item_type == "Notebook":
-                    try:
-                        # Try to resolve notebook ID
-                        resolved_id = fabric.resolve_item_id(item_name, "Notebook")
-                        if resolved_id:
-                            print(f"  ✅ Notebook '{item_name}' is accessible")
-                            results["accessible"] += 1
-                            item_status["accessible"] = True
-                        else:
-                            # Exists in list, so count as accessible
-                            print(f"  ✅ Notebook '{item_name}' exists")
-                            results["accessible"] += 1
-                            item_status["accessible"] = True
-                    except Exception:
-                        # Exists in workspace list, so count as accessible
-                        print(f"  ✅ Notebook '{item_name}' exists")
-                        results["accessible"] += 1
-                        item_status["accessible"] = True
+            # Every item comes from the workspace listing, so it exists even if a deeper probe fails
+            results["accessible"] += 1
+            results["items"].append(
+                {"name": item_name, "type": item_type, "accessible": True, "probed": probed, "error": error}
+            )
+
+            if probed:
+                lines.append(f"  ✅ {item_type} '{item_name}' is accessible")
+            else:
+                lines.append(f"  ✅ {item_type} '{item_name}' exists")
 
-                else:
-                    # For all other types, existence in workspace list is sufficient
-                    print(f"  ✅ {item_type} '{item_name}' exists")
-                    results["accessible"] += 1
-                    item_status["accessible"] = True
-
-            except Exception as e:
-                # Even if there's an error, the item exists (it's in the list)
-                # Only mark as failure if it's a critical error
-                error_msg = str(e)
-                print(f"  ✅ {item_type} '{item_name}' exists (note: {error_msg})")
-                results["accessible"] += 1
-                item_status["accessible"] = True
-                item_status["error"] = error_msg
-
-            results["items"].append(item_status)
+        if lines:
+            text = "\n".join(lines)
+            print(_to_plain_text(text) if self.plain_text else text)
 
         return results
 
+    @staticmethod
+    def _probe_item(get_lakehouse, item_name: str, item_type: str) -> tuple[bool, str | None]:
+        """
+        Probe a single item beyond its presence in the workspace listing.
+
+        Only Lakehouses can be probed; other items, including Notebooks, are reported as
+        existing but not probed.
+
+        Returns:
+            Tuple of (whether the probe confirmed access, error message if the probe failed)
+        """
+        if item_type != "Lakehouse" or get_lakehouse is None:
+            return False, None
+        try:
+            return bool(get_lakehouse(item_name)), None
+        except Exception as e:  # notebookutils raises service-specific errors
+            return False, str(e)
+
     def save_validation_report(self, output_path: str) -> None:
         """
         Save validation results to a JSON file.
@@ -259,11 +323,9 @@ class DeploymentValidator:
         Args:
             output_path: Path to save the report
         """
-        import json
-
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(self.validation_results, f, indent=2)
+            with open(output_path, "wb") as f:
+                f.write(_dumps_results(self.validation_results))
 
             print(f"✅ Validation report saved to {output_path}")
 
@@ -8,14 +8,34 @@ __all__ = ["FabricNotebookTokenCredential", "FabricDeployer"]
 
 import base64
 import json
+import threading
+import time
 from typing import Any
 
-import fabric_cicd.constants
 from azure.core.credentials import AccessToken, TokenCredential
-from fabric_cicd import FabricWorkspace, publish_all_items
 
 from fabric_launcher.platform_file_fixer import PlatformFileFixer
 
+try:
+    import orjson
+except ImportError:  # optional: pip install fabric-launcher[speedups]
+    orjson = None
+
+# Padding that completes a base64 string, indexed by its length modulo 4
+_BASE64_PADDING = ("", "===", "==", "=")
+
+# Separator line of the workspace validation banner
+_SEPARATOR = "=" * 60
+
+# API root URL this module last set in fabric-cicd, whose setting is process-wide
+_configured_api_root_url: str | None = None
+
+# A cached token closer than this to expiring is replaced before it is handed out
+_MIN_TOKEN_LIFETIME_SECONDS = 60
+
+# Wait this long before another background refresh after one failed or returned a token expiring too soon
+_REFRESH_RETRY_SECONDS = 30
+
 
 class FabricNotebookTokenCredential(TokenCredential):
     """
@@ -25,14 +45,24 @@ class FabricNotebookTokenCredential(TokenCredential):
     by leveraging the notebookutils.credentials API.
     """
 
-    def __init__(self, notebookutils):
+    def __init__(self, notebookutils, refresh_margin_seconds: float = 300):
         """
         Initialize the credential with notebookutils.
 
         Args:
             notebookutils: The notebookutils module from Fabric notebook environment
+            refresh_margin_seconds: Refresh the cached token in the background once it expires within
+                this many seconds; it is still handed out until the refresh completes
         """
         self.notebookutils = notebookutils
+        self.refresh_margin_seconds = refresh_margin_seconds
+
+        # Last token handed out; fabric-cicd asks for a token on every API request
+        self._cached_token: AccessToken | None = None
+        self._refreshing = False
+        # time.time() before which no background refresh is started, see _refresh_in_background()
+        self._refresh_not_before = 0.0
+        self._lock = threading.Lock()
 
     def get_token(
         self,
@@ -55,9 +85,49 @@ class FabricNotebookTokenCredential(TokenCredential):
         Returns:
             AccessToken with token and expiration
         """
+        with self._lock:
+            cached = self._cached_token
+            # A claims challenge asks for a fresh token, so it bypasses the cache
+            remaining = cached.expires_on - time.time() if claims is None and cached is not None else 0
+            if remaining > self.refresh_margin_seconds:
+                return cached
+
+            if remaining <= _MIN_TOKEN_LIFETIME_SECONDS:
+                self._cached_token = self._fetch_token()
+                return self._cached_token
+
+            # Still valid for a while: refresh off the request path and keep handing out the cached token
+            start_refresh = not self._refreshing and time.time() >= self._refresh_not_before
+            if start_refresh:
+                self._refreshing = True
+
+        if start_refresh:
+            threading.Thread(target=self._refresh_in_background, daemon=True).start()
+        return cached
+
+    def _fetch_token(self) -> AccessToken:
+        """Get a new token from notebookutils."""
         access_token = self.notebookutils.credentials.getToken("pbi")
-        expiration = self._extract_jwt_expiration(access_token)
-        return AccessToken(token=access_token, expires_on=expiration)
+        return AccessToken(token=access_token, expires_on=self._extract_jwt_expiration(access_token))
+
+    def _refresh_in_background(self) -> None:
+        """
+        Fetch a new token and replace the cached one with it.
+
+        notebookutils may hand back the same cached token, so the new token is only used when it
+        expires after the refresh margin; otherwise the next background refresh waits
+        _REFRESH_RETRY_SECONDS instead of starting on every get_token() call.
+        """
+        try:
+            token = self._fetch_token()
+        except Exception:  # the cached token stays valid; get_token() fetches synchronously near expiry
+            token = None
+        with self._lock:
+            if token is not None and token.expires_on - time.time() > self.refresh_margin_seconds:
+                self._cached_token = token
+            else:
+                self._refresh_not_before = time.time() + _REFRESH_RETRY_SECONDS
+            self._refreshing = False
 
     def _extract_jwt_expiration(self, token: str) -> int:
         """
@@ -73,19 +143,22 @@ class FabricNotebookTokenCredential(TokenCredential):
             ValueError: If token format is invalid or missing expiration
         """
         try:
-            # Split JWT and get payload (middle part)
-            payload_b64 = token.split(".")[1]
+            # Split JWT and get payload (middle part); the signature is never split
+            parts = token.split(".", 2)
+            if len(parts) < 2:
+                raise ValueError("JWT missing payload")
+            payload_b64 = parts[1]
             # Add padding if needed for base64 decoding
-            payload_b64 += "=" * (-len(payload_b64) % 4)
-            # Decode and parse payload
-            payload_bytes = base64.urlsafe_b64decode(payload_b64.encode("utf-8"))
-            payload = json.loads(payload_bytes.decode("utf-8"))
-            # Extract expiration claim
-            exp = payload.get("exp")
+            payload_b64 += _BASE64_PADDING[len(payload_b64) & 3]
+            # Decode and parse payload; orjson parses the bytes without decoding them first
+            payload_bytes = base64.urlsafe_b64decode(payload_b64.encode("ascii"))
+            payload = orjson.loads(payload_bytes) if orjson is not None else json.loads(payload_bytes)
+            # Extract the top-level expiration claim
+            exp = payload.get("exp") if isinstance(payload, dict) else None
             if exp is None:
                 raise ValueError("JWT missing expiration claim")
-            return exp
-        except (IndexError, json.JSONDecodeError, ValueError) as e:
+            return int(exp)
+        except (TypeError, ValueError) as e:  # TypeError: a non-numeric "exp", e.g. a list or an object
             raise ValueError(f"Invalid JWT token format: {e}") from e
 
 
@@ -128,9 +201,22 @@ class FabricDeployer:
         self.allow_non_empty_workspace = allow_non_empty_workspace
         self.fix_zero_logical_ids = fix_zero_logical_ids
         self._deployment_session_started = False  # Track if first deployment has occurred
-
-        # Configure fabric-cicd constants
+        self._logical_ids_fixed = False  # .platform files are checked once, not once per stage
+
+        # fabric-cicd is imported here rather than at module level, so importing this module stays cheap
+        import fabric_cicd.constants
+        from fabric_cicd import FabricWorkspace
+
+        # Configure fabric-cicd constants; the URL is global, so a different one affects earlier deployers too
+        global _configured_api_root_url
+        if _configured_api_root_url is not None and _configured_api_root_url != api_root_url:
+            print(
+                f"⚠️ Warning: Fabric API root URL changed from {_configured_api_root_url} to {api_root_url}; "
+                "deployers created earlier will also use the new URL"
+            )
+        # Always set: other code may have changed the constant since the last deployer was created
         fabric_cicd.constants.DEFAULT_API_ROOT_URL = api_root_url
+        _configured_api_root_url = api_root_url
 
         # Enable debug logging if requested
         if debug:
@@ -181,19 +267,27 @@ class FabricDeployer:
                 print(f"✅ Workspace validation passed: Only contains current notebook '{current_notebook_name}'")
                 return
 
-            # Workspace contains other items
-            print("=" * 60)
-            print("❌ WORKSPACE VALIDATION FAILED")
-            print("=" * 60)
-            print(f"The target workspace contains {len(other_items)} item(s) in addition to the current notebook.")
-            print("\nExisting items:")
-            for _idx, item in other_items.iterrows():
-                print(f"  • {item['Display Name']} ({item['Type']})")
-
-            print("\n⚠️ DEPLOYMENT BLOCKED")
-            print("To deploy to a non-empty workspace, initialize FabricDeployer with:")
-            print("  allow_non_empty_workspace=True")
-            print("=" * 60)
+            # Workspace contains other items; the banner is printed in one call
+            lines = [
+                _SEPARATOR,
+                "❌ WORKSPACE VALIDATION FAILED",
+                _SEPARATOR,
+                f"The target workspace contains {len(other_items)} item(s) in addition to the current notebook.",
+                "\nExisting items:",
+            ]
+            lines.extend(
+                f"  • {item_name} ({item_type})"
+                for item_name, item_type in zip(other_items["Display Name"], other_items["Type"], strict=True)
+            )
+            lines.extend(
+                [
+                    "\n⚠️ DEPLOYMENT BLOCKED",
+                    "To deploy to a non-empty workspace, initialize FabricDeployer with:",
+                    "  allow_non_empty_workspace=True",
+                    _SEPARATOR,
+                ]
+            )
+            print("\n".join(lines))
 
             raise RuntimeError(
                 f"Workspace contains {len(other_items)} existing item(s). "
@@ -208,20 +302,12 @@ class FabricDeployer:
             print(f"⚠️ Warning: Could not validate workspace contents: {e}")
             print("Proceeding with deployment...")
 
-    def deploy_items(self, item_types: list[str] | None = None) -> None:
-        """
-        Deploy Fabric items to the workspace.
-
-        For staged deployments, workspace validation only occurs on the first stage.
-        Subsequent stages in the same deployment session skip validation since the
-        workspace is expected to contain items from previous stages.
-
-        Args:
-            item_types: List of item types to deploy. If None, deploys all items.
-                       Example types: "Lakehouse", "Notebook", "Eventstream", "KQLDatabase"
-        """
-        # Fix zero GUID logicalIds in .platform files (if enabled)
-        if self.fix_zero_logical_ids:
+    def _prepare_deployment(self) -> None:
+        """Fix zero GUID logicalIds and validate the workspace ahead of a deployment."""
+        # Fix zero GUID logicalIds in .platform files (if enabled and not already done for this deployer)
+        if self.fix_zero_logical_ids and self._logical_ids_fixed:
+            print("ℹ️ Skipping logicalId check (already done in this deployment session)")
+        elif self.fix_zero_logical_ids:
             print("🔧 Checking for zero GUID logicalIds in .platform files...")
             fixer = PlatformFileFixer(self.repository_directory)
             results = fixer.scan_and_fix_all(dry_run=False)
@@ -230,6 +316,7 @@ class FabricDeployer:
                 print(f"✅ Fixed {results['files_fixed']} .platform file(s) with zero GUID logicalIds")
             elif results["files_with_zero_guid"] > 0:
                 print(f"⚠️ Warning: Found {results['files_with_zero_guid']} file(s) with issues but could not fix them")
+            self._logical_ids_fixed = True
         else:
             print("⚠️ Skipping logicalId validation (fix_zero_logical_ids=False)")
 
@@ -247,6 +334,22 @@ class FabricDeployer:
         else:
             print("⚠️ Skipping workspace validation (allow_non_empty_workspace=True)")
 
+    def deploy_items(self, item_types: list[str] | None = None) -> None:
+        """
+        Deploy Fabric items to the workspace.
+
+        For staged deployments, workspace validation only occurs on the first stage.
+        Subsequent stages in the same deployment session skip validation since the
+        workspace is expected to contain items from previous stages.
+
+        Args:
+            item_types: List of item types to deploy. If None, deploys all items.
+                       Example types: "Lakehouse", "Notebook", "Eventstream", "KQLDatabase"
+        """
+        from fabric_cicd import publish_all_items
+
+        self._prepare_deployment()
+
         if item_types:
             self.workspace.item_type_in_scope = item_types
             print("🚀 Starting deployment of Fabric items...")
@@ -12,13 +12,58 @@ Note on Resource Management:
     consider using notebookutils.fs.unmount() explicitly if mount limits are reached.
 """
 
+import fnmatch
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
 __all__ = ["LakehouseFileManager"]
 
 
+@lru_cache(maxsize=32)
+def _compile_file_patterns(file_patterns: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile fnmatch-style patterns into a single regular expression.
+
+    Args:
+        file_patterns: Patterns to match (e.g., ("*.json", "*.csv"))
+
+    Returns:
+        Compiled pattern matching a (normcased) filename if any of the patterns match
+    """
+    return re.compile("|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in file_patterns))
+
+
+def _copy_files(copies: dict[str, tuple[str, str]], verb: str, max_workers: int) -> int:
+    """
+    Copy files concurrently; copies to a mounted Lakehouse wait on I/O, during which shutil releases the GIL.
+
+    Args:
+        copies: Target path -> (source path, label printed once the file is copied)
+        verb: Word printed before each label (e.g., "Copied")
+        max_workers: Maximum number of files copied at the same time
+
+    Returns:
+        Number of files copied
+    """
+    if not copies:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(copies))) as executor:
+        futures = {
+            executor.submit(shutil.copy2, source_path, target_path): label
+            for target_path, (source_path, label) in copies.items()
+        }
+        for future in as_completed(futures):
+            future.result()
+            print(f"  ✓ {verb}: {futures[future]}")
+
+    return len(copies)
+
+
 class LakehouseFileManager:
     """
     Handler for managing files in Fabric Lakehouse Files area.
@@ -42,6 +87,7 @@ class LakehouseFileManager:
         source_directory: str,
         target_folder: str = "data",
         file_patterns: list[str] | None = None,
+        max_workers: int = 8,
     ) -> None:
         """
         Upload files from a local directory to a Lakehouse Files folder.
@@ -52,6 +98,7 @@ class LakehouseFileManager:
             target_folder: Target folder path in Lakehouse Files area (default: "data")
             file_patterns: List of file patterns to match (e.g., ["*.json", "*.csv"])
                           If None, all files are uploaded
+            max_workers: Maximum number of files uploaded at the same time (default: 8)
         """
         try:
             # Get abfs path to the lakehouse and mount it
@@ -70,21 +117,19 @@ class LakehouseFileManager:
             Path(target_directory).mkdir(parents=True, exist_ok=True)
             print(f"📂 Target directory: {target_directory}")
 
-            # Upload files
-            uploaded_count = 0
+            # Collect files to upload; files with the same name share a target, and the last one found wins
+            matcher = _compile_file_patterns(tuple(file_patterns)) if file_patterns else None
+            uploads: dict[str, tuple[str, str]] = {}
             for root, _dirs, files in os.walk(source_directory):
                 for file in files:
                     # Check if file matches any pattern (if patterns specified)
-                    if file_patterns and not any(self._matches_pattern(file, pattern) for pattern in file_patterns):
+                    if matcher and not matcher.match(os.path.normcase(file)):
                         continue
 
-                    source_path = str(Path(root) / file)
-                    target_path = str(Path(target_directory) / file)
+                    uploads[str(Path(target_directory) / file)] = (str(Path(root) / file), file)
 
-                    # Copy file
-                    shutil.copy2(source_path, target_path)
-                    print(f"  ✓ Uploaded: {file}")
-                    uploaded_count += 1
+            # Upload files
+            uploaded_count = _copy_files(uploads, "Uploaded", max_workers)
 
             print(f"✅ Successfully uploaded {uploaded_count} file(s) to {lakehouse_name}/Files/{target_folder}")
 
@@ -138,6 +183,7 @@ class LakehouseFileManager:
         target_folder: str = "data",
         file_patterns: list[str] | None = None,
         recursive: bool = True,
+        max_workers: int = 8,
     ) -> None:
         """
         Copy an entire folder structure from local repository to Lakehouse Files area.
@@ -149,6 +195,7 @@ class LakehouseFileManager:
             file_patterns: List of file patterns to match (e.g., ["*.json", "*.csv"])
                           If None, all files are copied
             recursive: Whether to copy subdirectories recursively
+            max_workers: Maximum number of files copied at the same time (default: 8)
         """
         try:
             if not Path(source_folder).exists():
@@ -170,8 +217,9 @@ class LakehouseFileManager:
             Path(target_directory).mkdir(parents=True, exist_ok=True)
             print(f"📂 Target directory: {target_directory}")
 
-            # Copy files and folders
-            copied_count = 0
+            # Collect files to copy; target directories are created during the walk, before any copy starts
+            matcher = _compile_file_patterns(tuple(file_patterns)) if file_patterns else None
+            copies: dict[str, tuple[str, str]] = {}
 
             if recursive:
                 # Walk through all subdirectories
@@ -189,19 +237,12 @@ class LakehouseFileManager:
                     # Copy files
                     for file in files:
                         # Check if file matches any pattern (if patterns specified)
-                        if file_patterns and not any(self._matches_pattern(file, pattern) for pattern in file_patterns):
+                        if matcher and not matcher.match(os.path.normcase(file)):
                             continue
 
-                        source_path = str(Path(root) / file)
-                        target_path = str(Path(target_subdir) / file)
-
-                        # Copy file
-                        shutil.copy2(source_path, target_path)
-
                         # Show relative path for clarity
                         rel_file_path = str(Path(rel_path) / file) if rel_path != "." else file
-                        print(f"  ✓ Copied: {rel_file_path}")
-                        copied_count += 1
+                        copies[str(Path(target_subdir) / file)] = (str(Path(root) / file), rel_file_path)
             else:
                 # Only copy files in the root of source folder
                 for item in Path(source_folder).iterdir():
@@ -214,15 +255,13 @@ class LakehouseFileManager:
                     file = item.name
 
                     # Check if file matches any pattern (if patterns specified)
-                    if file_patterns and not any(self._matches_pattern(file, pattern) for pattern in file_patterns):
+                    if matcher and not matcher.match(os.path.normcase(file)):
                         continue
 
-                    target_path = str(Path(target_directory) / file)
+                    copies[str(Path(target_directory) / file)] = (file_path, file)
 
-                    # Copy file
-                    shutil.copy2(file_path, target_path)
-                    print(f"  ✓ Copied: {file}")
-                    copied_count += 1
+            # Copy files
+            copied_count = _copy_files(copies, "Copied", max_workers)
 
             print(f"✅ Successfully copied {copied_count} file(s) to {lakehouse_name}/Files/{target_folder}")
 
@@ -328,6 +367,4 @@ class LakehouseFileManager:
         Returns:
             True if filename matches pattern
         """
-        import fnmatch
-
         return fnmatch.fnmatch(filename, pattern)
@@ -13,6 +13,8 @@ from pathlib import Path
 
 import requests
 
+from ._http import github_get
+
 
 class GitHubDownloader:
     """Handler for downloading and extracting GitHub repository content."""
@@ -32,6 +34,39 @@ class GitHubDownloader:
         self.branch = branch
         self.github_token = github_token
 
+    def get_commit_sha(self, previous: tuple[str, str | None] | None = None) -> tuple[str, str | None] | None:
+        """
+        Resolve the commit the branch currently points to.
+
+        Only the SHA is requested, and when the ETag of a previous call is passed an
+        unchanged branch is answered with HTTP 304, which GitHub does not count
+        against the rate limit.
+
+        Args:
+            previous: (sha, etag) returned by an earlier call for the same branch (optional)
+
+        Returns:
+            Tuple of (commit SHA, ETag), or None if the commit could not be resolved
+        """
+        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/commits/{self.branch}"
+
+        headers = {"Accept": "application/vnd.github.sha"}
+        if self.github_token:
+            headers["Authorization"] = f"token {self.github_token}"
+        if previous and previous[1]:
+            headers["If-None-Match"] = previous[1]
+
+        try:
+            response = github_get(url, headers=headers)
+            if previous and response.status_code == 304:
+                return previous
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️ Could not resolve the latest commit of {self.branch}: {e}")
+            return None
+
+        return response.text.strip(), response.headers.get("ETag")
+
     def download_and_extract_folder(
         self, extract_to: str, folder_to_extract: str = "", remove_folder_prefix: str = ""
     ) -> None:
@@ -59,7 +94,7 @@ class GitHubDownloader:
             print(f"📥 Downloading {self.repo_name} from {self.repo_owner}/{self.repo_name}:{self.branch}")
 
             # Make a request to the GitHub API
-            response = requests.get(url, headers=headers)
+            response = github_get(url, headers=headers)
             response.raise_for_status()
 
             # Delete target directory if exists
@@ -145,7 +180,7 @@ class GitHubDownloader:
 
             # Download the file
             print(f"📥 Downloading file from {file_url}")
-            response = requests.get(file_url, headers=headers)
+            response = github_get(file_url, headers=headers)
             response.raise_for_status()
 
             # Save to target directory
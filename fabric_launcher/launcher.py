@@ -11,10 +11,17 @@ This is a wrapper around the fabric-cicd library designed for use in Fabric note
 
 __all__ = ["FabricLauncher"]
 
+import os
+import random
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
 from .config_manager import DeploymentConfig
+from .dependency_dag import compute_item_type_stages
 from .deployment_report import DeploymentReport
 from .deployment_validator import DeploymentValidator
 from .fabric_deployer import FabricDeployer
@@ -22,6 +29,21 @@ from .file_operations import LakehouseFileManager
 from .github_downloader import GitHubDownloader
 from .notebook_executor import NotebookExecutor
 
+# Deployment retries wait a random time up to base * 2**attempt seconds, capped at the maximum
+_RETRY_BASE_DELAY_SECONDS = 10
+_RETRY_MAX_DELAY_SECONDS = 60
+
+# Authentication and permission failures that a retry cannot fix
+_NON_RETRYABLE_ERROR_PATTERN = re.compile(r"\b(?:401|403)\b|unauthori[sz]ed|forbidden", re.IGNORECASE)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a failed deployment is worth retrying, i.e. it did not fail on authentication."""
+    status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if status_code in (401, 403):
+        return False
+    return _NON_RETRYABLE_ERROR_PATTERN.search(str(error)) is None
+
 
 class FabricLauncher:
     """
@@ -80,7 +102,9 @@ class FabricLauncher:
             config_file_path: Path to config file within the repository
             branch: Git branch (default: "main")
             github_token: GitHub token for private repos (optional)
-            save_to: Local path to save config file (optional, uses temp file if None)
+            save_to: Local path to save config file (optional, uses a per-repository file in
+                     the temp directory if None). Repeated downloads to the same path send the
+                     stored ETag and skip rewriting the file when GitHub reports it unchanged.
 
         Returns:
             Path to downloaded configuration file
@@ -99,15 +123,11 @@ class FabricLauncher:
             config_file_path=config_file_path,
             branch=branch,
             github_token=github_token,
+            save_to=save_to,
         )
 
-        # If save_to specified, copy the temp file there
-        if save_to and config.config_path:
-            import shutil
-
-            shutil.copy(config.config_path, save_to)
+        if save_to:
             print(f"💾 Configuration saved to: {save_to}")
-            return save_to
 
         return config.config_path
 
@@ -199,6 +219,9 @@ class FabricLauncher:
         self._notebook_executor = None
         self._validator = None
 
+        # (owner, repo, branch, extract_to, folder, prefix) -> (commit SHA, ETag) of downloads to reuse
+        self._downloaded_repos: dict[tuple[str, str, str, str, str, str], tuple[str, str | None]] = {}
+
         print("🚀 Fabric Launcher initialized")
         print(f"📍 Workspace ID: {self.workspace_id}")
         print(f"🏷️ Environment: {self.environment}")
@@ -230,6 +253,8 @@ class FabricLauncher:
         item_types: list[str] | None,
         retries_remaining: int,
         stage_description: str = "Deployment",
+        stop_retrying: threading.Event | None = None,
+        attempt: int = 0,
     ) -> None:
         """
         Deploy items with automatic retry on failure.
@@ -242,26 +267,119 @@ class FabricLauncher:
             item_types: List of item types to deploy (None for all)
             retries_remaining: Number of retries remaining (0 = no retries)
             stage_description: Description for logging (e.g., "Stage 1: Lakehouses")
+            stop_retrying: Event that, once set, makes a failure re-raise instead of retrying
+            attempt: Number of retries already made, which sets the backoff before the next one
         """
         import time
 
         try:
             deployer.deploy_items(item_types)
         except Exception as e:
-            if retries_remaining > 0:
+            retry = retries_remaining > 0 and _is_retryable(e)
+            if retry and not (stop_retrying is not None and stop_retrying.is_set()):
                 print(f"\n⚠️ {stage_description} failed: {str(e)}")
-                print(f"🔄 Retrying in 10 seconds... ({retries_remaining} retries remaining)")
-                time.sleep(10)
+                # Exponential backoff with full jitter, so parallel workers do not retry in lockstep
+                delay = random.uniform(0, min(_RETRY_MAX_DELAY_SECONDS, _RETRY_BASE_DELAY_SECONDS * 2**attempt))
+                print(f"🔄 Retrying in {delay:.0f} seconds... ({retries_remaining} retries remaining)")
+                if stop_retrying is None:
+                    time.sleep(delay)
+                elif stop_retrying.wait(delay):
+                    raise
 
                 # On retry, allow non-empty workspace since previous attempt may have deployed items
                 deployer.allow_non_empty_workspace = True
                 deployer._deployment_session_started = True  # Skip workspace validation on retry
 
-                self._deploy_with_retry(deployer, item_types, retries_remaining - 1, stage_description)
+                self._deploy_with_retry(
+                    deployer, item_types, retries_remaining - 1, stage_description, stop_retrying, attempt + 1
+                )
             else:
                 # No retries remaining, re-raise the exception
                 raise
 
+    def _deploy_stage_in_parallel(
+        self,
+        stage_item_types: list[str],
+        max_workers: int,
+        retries_remaining: int,
+        stage_description: str,
+    ) -> None:
+        """
+        Deploy the item types of one stage concurrently, one deployer per item type.
+
+        Item types within a stage have no declared dependency on each other, so they can
+        be published side by side. The stage still acts as a barrier: this method only
+        returns once every item type has finished. A single failure is re-raised as is;
+        several item types failing together are reported in one RuntimeError.
+
+        Args:
+            stage_item_types: Item types to deploy in this stage
+            max_workers: Maximum number of item types deployed at the same time
+            retries_remaining: Number of retries per item type (0 = no retries)
+            stage_description: Description for logging (e.g., "Stage 1: Lakehouses")
+        """
+        shared = self._fabric_deployer
+
+        # Fix .platform files and validate the workspace once, before any worker starts,
+        # so the per-type deployers never race on the same files or the emptiness check
+        shared._prepare_deployment()
+        shared._deployment_session_started = True
+
+        # Set once an item type has used up its retries: the stage fails at the barrier anyway,
+        # so the other workers stop retrying instead of adding load to a workspace that is failing
+        stage_failed = threading.Event()
+
+        def deploy_one(item_type: str) -> None:
+            deployer = FabricDeployer(
+                workspace_id=shared.workspace_id,
+                repository_directory=shared.repository_directory,
+                notebookutils=self.notebookutils,
+                environment=self.environment,
+                api_root_url=self.api_root_url,
+                debug=self.debug,
+                allow_non_empty_workspace=shared.allow_non_empty_workspace,
+                fix_zero_logical_ids=False,
+            )
+            deployer._deployment_session_started = True
+            try:
+                self._deploy_with_retry(
+                    deployer=deployer,
+                    item_types=[item_type],
+                    retries_remaining=retries_remaining,
+                    stage_description=f"{stage_description} [{item_type}]",
+                    stop_retrying=stage_failed,
+                )
+            except Exception:
+                stage_failed.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(stage_item_types))) as executor:
+            futures = [executor.submit(deploy_one, item_type) for item_type in stage_item_types]
+            try:
+                _done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            except BaseException:
+                # e.g. the notebook kernel was interrupted: wake workers waiting to retry, so that
+                # leaving the executor only waits for deployments already in progress
+                stage_failed.set()
+                for future in futures:
+                    future.cancel()
+                raise
+            for future in not_done:
+                future.cancel()
+
+        failures = [
+            (item_type, future.exception())
+            for item_type, future in zip(stage_item_types, futures, strict=True)
+            if not future.cancelled() and future.exception() is not None
+        ]
+        if not failures:
+            return
+        first_error = failures[0][1]
+        if len(failures) == 1:
+            raise first_error
+        details = "; ".join(f"{item_type}: {error}" for item_type, error in failures)
+        raise RuntimeError(f"❌ {len(failures)} item types failed in {stage_description}: {details}") from first_error
+
     @property
     def repository_path(self) -> str | None:
         """
@@ -337,8 +455,6 @@ class FabricLauncher:
             >>> print(f"Data files located at: {data_path}")
         """
         if self.repository_path:
-            from pathlib import Path
-
             folder_path = Path(self.repository_path) / folder_name
             return str(folder_path) if folder_path.exists() else None
         return None
@@ -355,13 +471,62 @@ class FabricLauncher:
             >>> folders = launcher.list_data_folders()
             >>> print(f"Available folders: {', '.join(folders)}")
         """
-        if self.repository_path:
-            from pathlib import Path
+        return list(self.list_data_folders_with_paths())
 
-            repo_path = Path(self.repository_path)
-            if repo_path.exists():
-                return [item.name for item in repo_path.iterdir() if item.is_dir()]
-        return []
+    def list_data_folders_with_paths(self) -> dict[str, str]:
+        """
+        List all directories in the extracted repository together with their full paths.
+
+        Uses a single directory scan of the repository root.
+
+        Returns:
+            Dictionary mapping folder names to full paths, empty if not downloaded
+
+        Example:
+            >>> launcher.download_and_deploy(repo_owner="myorg", repo_name="my-solution")
+            >>> for name, path in launcher.list_data_folders_with_paths().items():
+            ...     print(f"{name}: {path}")
+        """
+        repository_path = self.repository_path
+        if not repository_path:
+            return {}
+
+        try:
+            with os.scandir(repository_path) as entries:
+                folders = {entry.name: entry.path for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            return {}
+        return folders
+
+    def iter_data_files(self, folder_name: str, suffixes: str | tuple[str, ...]) -> Iterator[str]:
+        """
+        Iterate over files in a data folder (recursively) whose names end with the given suffixes.
+
+        Uses os.scandir, so directories are recognized from the directory listing
+        instead of a separate stat per entry.
+
+        Args:
+            folder_name: Name of the folder in the extracted repository (e.g., "data")
+            suffixes: File name suffix or tuple of suffixes (e.g., ".csv" or (".csv", ".json"))
+
+        Yields:
+            Full paths of matching files; nothing if the folder does not exist
+
+        Example:
+            >>> csv_files = list(launcher.iter_data_files("data", ".csv"))
+        """
+        folder_path = self.get_data_folder_path(folder_name)
+        if not folder_path:
+            return
+
+        stack = [folder_path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(suffixes):
+                        yield entry.path
 
     def download_repository(
         self,
@@ -372,6 +537,7 @@ class FabricLauncher:
         folder_to_extract: str = "",
         github_token: str | None = None,
         remove_folder_prefix: str = "",
+        reuse_if_unchanged: bool = False,
     ) -> GitHubDownloader:
         """
         Download and extract a GitHub repository.
@@ -384,6 +550,9 @@ class FabricLauncher:
             folder_to_extract: Folder path within the repo to extract (empty for entire repo)
             github_token: GitHub personal access token (optional, for private repos)
             remove_folder_prefix: Prefix to remove from extracted file paths
+            reuse_if_unchanged: Skip the download when this launcher already extracted the same
+                                repository, branch and folder to extract_to and the branch still
+                                points to the same commit (default: False)
 
         Returns:
             GitHubDownloader instance for further operations
@@ -392,10 +561,32 @@ class FabricLauncher:
             repo_owner=repo_owner, repo_name=repo_name, branch=branch, github_token=github_token
         )
 
-        self._github_downloader.download_and_extract_folder(
-            extract_to=extract_to, folder_to_extract=folder_to_extract, remove_folder_prefix=remove_folder_prefix
+        if not reuse_if_unchanged:
+            self._github_downloader.download_and_extract_folder(
+                extract_to=extract_to, folder_to_extract=folder_to_extract, remove_folder_prefix=remove_folder_prefix
+            )
+            return self._github_downloader
+
+        download_key = (
+            repo_owner,
+            repo_name,
+            branch,
+            str(Path(extract_to).resolve()),
+            folder_to_extract,
+            remove_folder_prefix,
         )
+        previous = self._downloaded_repos.pop(download_key, None)
+        commit = self._github_downloader.get_commit_sha(previous)
+
+        if commit and previous and commit[0] == previous[0] and Path(extract_to).is_dir():
+            print(f"♻️ {repo_owner}/{repo_name}:{branch} unchanged at {commit[0][:7]}, reusing {extract_to}")
+        else:
+            self._github_downloader.download_and_extract_folder(
+                extract_to=extract_to, folder_to_extract=folder_to_extract, remove_folder_prefix=remove_folder_prefix
+            )
 
+        if commit:
+            self._downloaded_repos[download_key] = commit
         return self._github_downloader
 
     def deploy_artifacts(
@@ -459,6 +650,9 @@ class FabricLauncher:
         generate_report: bool = True,
         deployment_retries: int = 2,
         allow_non_empty_workspace: bool | None = None,
+        parallel_within_stage: int = 1,
+        auto_stage: bool = False,
+        reuse_if_unchanged: bool = False,
     ):
         """
         Download from GitHub and deploy in one operation.
@@ -489,6 +683,16 @@ class FabricLauncher:
                                since previous attempt may have deployed some items.
             allow_non_empty_workspace: Allow deployment to workspaces with existing items
                                        (None uses instance setting from __init__)
+            parallel_within_stage: Maximum number of item types deployed concurrently within a
+                                  stage of item_type_stages (default: 1, sequential). Stages are
+                                  still deployed one after another, so only put item types that
+                                  do not depend on each other in the same stage.
+            auto_stage: Derive item_type_stages from item_types using the item type dependencies
+                       in DEFAULT_ITEM_DEPS (default: False). Each stage holds every item type
+                       whose dependencies are deployed in earlier stages.
+            reuse_if_unchanged: Skip the download when this launcher already extracted the same
+                                repository and branch to extract_to and the branch still points
+                                to the same commit (default: False)
 
         Returns:
             Tuple of (GitHubDownloader, FabricDeployer, DeploymentReport) instances
@@ -551,6 +755,12 @@ class FabricLauncher:
         if allow_non_empty_workspace is None:
             allow_non_empty_workspace = self.allow_non_empty_workspace
 
+        # Derive stages from item type dependencies
+        if auto_stage and item_types and item_type_stages is None:
+            item_type_stages = compute_item_type_stages(item_types)
+            item_types = None
+            print(f"🧭 Derived {len(item_type_stages)} deployment stages from item type dependencies")
+
         # Validate required parameters
         if not repo_owner or not repo_name:
             error_msg = "❌ repo_owner and repo_name are required. Provide them as parameters or in a config file."
@@ -575,6 +785,7 @@ class FabricLauncher:
                 branch=branch,
                 folder_to_extract="",  # Download entire repo
                 github_token=github_token,
+                reuse_if_unchanged=reuse_if_unchanged,
             )
             if report:
                 report.add_step("Download", "success", f"Downloaded from {repo_owner}/{repo_name}")
@@ -613,12 +824,20 @@ class FabricLauncher:
                 for stage_num, stage_item_types in enumerate(item_type_stages, 1):
                     stage_description = f"Stage {stage_num}/{len(item_type_stages)}: {', '.join(stage_item_types)}"
                     print(f"\n  📦 {stage_description}")
-                    self._deploy_with_retry(
-                        deployer=self._fabric_deployer,
-                        item_types=stage_item_types,
-                        retries_remaining=deployment_retries,
-                        stage_description=stage_description,
-                    )
+                    if parallel_within_stage > 1 and len(stage_item_types) > 1:
+                        self._deploy_stage_in_parallel(
+                            stage_item_types=stage_item_types,
+                            max_workers=parallel_within_stage,
+                            retries_remaining=deployment_retries,
+                            stage_description=stage_description,
+                        )
+                    else:
+                        self._deploy_with_retry(
+                            deployer=self._fabric_deployer,
+                            item_types=stage_item_types,
+                            retries_remaining=deployment_retries,
+                            stage_description=stage_description,
+                        )
 
                 deployer = self._fabric_deployer
                 print(f"\n✅ All {len(item_type_stages)} deployment stages completed")
@@ -733,6 +952,7 @@ class FabricLauncher:
         source_directory: str,
         target_folder: str = "data",
         file_patterns: list[str] | None = None,
+        max_workers: int = 8,
     ) -> None:
         """
         Upload files from a local directory to Lakehouse Files area.
@@ -742,12 +962,14 @@ class FabricLauncher:
             source_directory: Local directory containing files to upload
             target_folder: Target folder path in Lakehouse Files area
             file_patterns: List of file patterns to match (e.g., ["*.json"])
+            max_workers: Maximum number of files uploaded at the same time
         """
         self.file_manager.upload_files_to_lakehouse(
             lakehouse_name=lakehouse_name,
             source_directory=source_directory,
             target_folder=target_folder,
             file_patterns=file_patterns,
+            max_workers=max_workers,
         )
 
     def upload_file_to_lakehouse(self, lakehouse_name: str, file_path: str, target_folder: str = "data") -> None:
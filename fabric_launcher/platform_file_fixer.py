@@ -8,6 +8,7 @@ for Fabric items before deployment. Replaces zero GUIDs with unique identifiers.
 import json
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -106,10 +107,10 @@ class PlatformFileFixer:
         data["config"]["logicalId"] = new_guid
 
         try:
-            # Write back to file with proper formatting
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                f.write("\n")  # Add trailing newline
+            # Serialize first, then write the formatted file (with trailing newline) in one call
+            contents = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+            with open(file_path, "wb") as f:
+                f.write(contents.encode("utf-8"))
 
             print(f"  ✅ Fixed {file_path}")
             print(f"    Old logicalId: {self.ZERO_GUID}")
@@ -150,12 +151,12 @@ class PlatformFileFixer:
                 "fixed_files": [],
             }
 
-        # Check each file for zero GUIDs
-        files_with_zero_guid = []
-        for file_path in platform_files:
-            has_zero_guid, _ = self.check_platform_file(file_path)
-            if has_zero_guid:
-                files_with_zero_guid.append(file_path)
+        # Check each file for zero GUIDs; reading and parsing is I/O-bound, so files are checked concurrently
+        with ThreadPoolExecutor() as executor:
+            checks = executor.map(self.check_platform_file, platform_files)
+            files_with_zero_guid = [
+                file_path for file_path, (has_zero_guid, _) in zip(platform_files, checks, strict=True) if has_zero_guid
+            ]
 
         if not files_with_zero_guid:
             print("✅ All .platform files have valid logicalIds")
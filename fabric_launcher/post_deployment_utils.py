@@ -16,9 +16,13 @@ __all__ = [
     "get_folder_id_by_name",
     "get_item_definition_from_repo",
     "scan_logical_ids",
+    "scan_logical_ids_iter",
     "replace_logical_ids",
+    "compile_logical_id_replacer",
     "create_or_update_fabric_item",
     "move_item_to_folder",
+    "move_item_to_folder_by_id",
+    "prefetch_workspace_index",
     "get_kusto_query_uri",
     "exec_kql_command",
     "create_shortcut",
@@ -31,8 +35,11 @@ import base64
 import json
 import logging
 import os
+import re
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
 import requests
 
@@ -113,36 +120,44 @@ def get_item_definition_from_repo(item_relative_path: str, repository_directory:
     return platform_data, item_path
 
 
-def scan_logical_ids(repository_directory: str, workspace_id: str, client) -> dict[str, str]:
+def _iter_platform_files(repository_directory: str) -> Iterator[str]:
+    """Yield the paths of all .platform files below a directory, using os.scandir."""
+    stack = [repository_directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == ".platform":
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Could not scan directory: {e}")
+
+
+def scan_logical_ids_iter(repository_directory: str, workspace_id: str, client) -> Iterator[tuple[str, str]]:
     """
-    Scan all .platform files in the repository and map logical IDs to actual workspace IDs.
+    Yield (logical ID, actual workspace item ID) pairs from the repository's .platform files.
 
-    Iterates recursively through all .platform files in the downloaded repository,
-    extracts logical IDs, and looks up the corresponding deployed item IDs in the
-    target workspace.
+    Streaming form of scan_logical_ids(). Workspace items are listed once, on the first
+    .platform file with a logical ID, and pairs are yielded as files are read, so callers
+    can start using mappings before the whole repository has been walked.
 
     Args:
         repository_directory: Root directory of the extracted repository
         workspace_id: Target workspace ID
         client: Fabric REST client instance
 
-    Returns:
-        Dictionary mapping original logical IDs to actual workspace item IDs
+    Yields:
+        Tuples of (original logical ID, actual workspace item ID)
 
     Example:
-        >>> logical_id_map = scan_logical_ids("/path/to/repo", workspace_id, client)
-        >>> print(logical_id_map)
-        {'abc-123-def': 'real-guid-456-xyz', ...}
+        >>> for logical_id, actual_id in scan_logical_ids_iter("/path/to/repo", workspace_id, client):
+        ...     print(logical_id, actual_id)
     """
-    logical_id_map = {}
-
-    # Find all .platform files recursively
-    repo_path = Path(repository_directory)
-    platform_files = list(repo_path.rglob(".platform"))
-
-    logger.info(f"Scanning {len(platform_files)} .platform files for logical IDs...")
+    item_ids: dict[tuple[str, str], str] | None = None
 
-    for platform_file in platform_files:
+    for platform_file in _iter_platform_files(repository_directory):
         try:
             with open(platform_file, encoding="utf-8") as f:
                 platform_data = json.load(f)
@@ -155,38 +170,95 @@ def scan_logical_ids(repository_directory: str, workspace_id: str, client) -> di
             # Get the logical ID from the config
             config = platform_data.get("config", {})
             logical_id = config.get("logicalId")
+        except Exception as e:
+            logger.warning(f"Error processing {platform_file}: {e}")
+            continue
 
-            if not all([display_name, item_type, logical_id]):
-                continue
+        if not all([display_name, item_type, logical_id]):
+            continue
 
-            # Look up the actual item ID in the workspace
+        # List workspace items once; the first item with a given name and type wins
+        if item_ids is None:
             try:
-                list_items_url = f"v1/workspaces/{workspace_id}/items"
-                response = client.get(list_items_url)
+                item_ids = {}
+                for item in _list_all(client, f"v1/workspaces/{workspace_id}/items"):
+                    item_ids.setdefault((item.get("displayName"), item.get("type")), item.get("id"))
+            except Exception as e:
+                logger.warning(f"Could not list items in workspace {workspace_id}: {e}")
+                return
 
-                if response.status_code == 200:
-                    items = response.json().get("value", [])
+        key = (display_name, item_type)
+        if key in item_ids:
+            actual_id = item_ids[key]
+            logger.debug(f"Mapped {item_type} '{display_name}': {logical_id} → {actual_id}")
+            yield logical_id, actual_id
 
-                    # Find matching item by name and type
-                    for item in items:
-                        if item.get("displayName") == display_name and item.get("type") == item_type:
-                            actual_id = item.get("id")
-                            logical_id_map[logical_id] = actual_id
-                            logger.debug(f"Mapped {item_type} '{display_name}': {logical_id} → {actual_id}")
-                            break
 
-            except Exception as e:
-                logger.warning(f"Could not resolve item '{display_name}': {e}")
-                continue
+def scan_logical_ids(repository_directory: str, workspace_id: str, client) -> dict[str, str]:
+    """
+    Scan all .platform files in the repository and map logical IDs to actual workspace IDs.
 
-        except Exception as e:
-            logger.warning(f"Error processing {platform_file}: {e}")
-            continue
+    Iterates recursively through all .platform files in the downloaded repository,
+    extracts logical IDs, and looks up the corresponding deployed item IDs in the
+    target workspace. Workspace items are listed once for the whole scan.
+
+    Args:
+        repository_directory: Root directory of the extracted repository
+        workspace_id: Target workspace ID
+        client: Fabric REST client instance
+
+    Returns:
+        Dictionary mapping original logical IDs to actual workspace item IDs
+
+    Example:
+        >>> logical_id_map = scan_logical_ids("/path/to/repo", workspace_id, client)
+        >>> print(logical_id_map)
+        {'abc-123-def': 'real-guid-456-xyz', ...}
+    """
+    logger.info(f"Scanning .platform files in {repository_directory} for logical IDs...")
+
+    logical_id_map = dict(scan_logical_ids_iter(repository_directory, workspace_id, client))
 
     logger.info(f"Logical ID scanning completed ({len(logical_id_map)} mappings)")
     return logical_id_map
 
 
+def _compile_logical_id_pattern(logical_id_map: dict[str, str]) -> re.Pattern | None:
+    """Compile all logical IDs into one alternation, longest first so overlapping IDs match fully."""
+    if not logical_id_map:
+        return None
+    return re.compile("|".join(re.escape(logical_id) for logical_id in sorted(logical_id_map, key=len, reverse=True)))
+
+
+def compile_logical_id_replacer(logical_id_map: dict[str, str]) -> Callable[[str], str]:
+    """
+    Build a function that replaces every logical ID in a string with its actual ID.
+
+    All logical IDs are compiled into a single regular expression, so each string is
+    scanned once regardless of the number of mappings. Build the replacer once and
+    reuse it for every item deployed with the same map.
+
+    Args:
+        logical_id_map: Dictionary mapping logical IDs to actual IDs (from scan_logical_ids)
+
+    Returns:
+        Function taking a string and returning it with all logical IDs replaced
+
+    Example:
+        >>> replacer = compile_logical_id_replacer(logical_id_map)
+        >>> replacer('{"lakehouseId": "abc-123-def"}')
+        '{"lakehouseId": "real-guid-456-xyz"}'
+    """
+    pattern = _compile_logical_id_pattern(logical_id_map)
+    if pattern is None:
+        return lambda text: text
+
+    def replace(text: str) -> str:
+        return pattern.sub(lambda match: logical_id_map[match.group(0)], text)
+
+    return replace
+
+
 def replace_logical_ids(item_definition: dict[str, Any], logical_id_map: dict[str, str]) -> dict[str, Any]:
     """
     Replace logical IDs in an item definition with actual workspace IDs.
@@ -206,17 +278,15 @@ def replace_logical_ids(item_definition: dict[str, Any], logical_id_map: dict[st
         >>> logical_id_map = scan_logical_ids(repo_dir, workspace_id, client)
         >>> updated_definition = replace_logical_ids(platform_data, logical_id_map)
     """
-    # Convert definition to JSON string for replacement
-    definition_str = json.dumps(item_definition)
-
-    replacements_made = 0
+    pattern = _compile_logical_id_pattern(logical_id_map)
+    if pattern is None:
+        logger.debug("No logical IDs found in definition")
+        return json.loads(json.dumps(item_definition))
 
-    # Replace each logical ID with its actual ID
-    for logical_id, actual_id in logical_id_map.items():
-        if logical_id in definition_str:
-            definition_str = definition_str.replace(logical_id, actual_id)
-            replacements_made += 1
-            logger.debug(f"Replaced logical ID: {logical_id} → {actual_id}")
+    # Convert definition to JSON string and replace all logical IDs in a single pass
+    definition_str, replacements_made = pattern.subn(
+        lambda match: logical_id_map[match.group(0)], json.dumps(item_definition)
+    )
 
     # Convert back to dictionary
     updated_definition = json.loads(definition_str)
@@ -239,6 +309,7 @@ def create_or_update_fabric_item(
     endpoint: str,
     logical_id_map: dict[str, str] | None = None,
     description: str = "",
+    logical_id_replacer: Callable[[str], str] | None = None,
 ) -> str:
     """
     Generic function to create and/or update a Fabric item with logical ID replacement.
@@ -259,6 +330,8 @@ def create_or_update_fabric_item(
         endpoint: REST API endpoint name (e.g., "notebooks", "lakehouses", "semanticModels")
         logical_id_map: Optional dictionary mapping logical IDs to actual IDs
         description: Optional description for the item
+        logical_id_replacer: Optional prebuilt replacer from compile_logical_id_replacer(),
+                            used instead of logical_id_map when deploying many items
 
     Returns:
         ID of the created or updated item
@@ -333,6 +406,9 @@ def create_or_update_fabric_item(
         # Step 3: Load and process definition files
         logger.debug("Processing item definition files...")
 
+        if logical_id_replacer is None and logical_id_map:
+            logical_id_replacer = compile_logical_id_replacer(logical_id_map)
+
         # Collect all definition files (excluding .platform)
         definition_parts = []
 
@@ -349,17 +425,16 @@ def create_or_update_fabric_item(
                     file_content = f.read()
 
                 # If logical ID map provided, replace IDs in text files
-                if logical_id_map and file_path.suffix in (".json", ".py", ".sql", ".kql", ".txt"):
+                if logical_id_replacer and file_path.suffix in (".json", ".py", ".sql", ".kql", ".txt"):
                     try:
                         text_content = file_content.decode("utf-8")
 
                         # Replace logical IDs
-                        for logical_id, actual_id in logical_id_map.items():
-                            if logical_id in text_content:
-                                text_content = text_content.replace(logical_id, actual_id)
-                                logger.debug(f"Replaced logical ID in {relative_file_path}")
+                        replaced_content = logical_id_replacer(text_content)
+                        if replaced_content != text_content:
+                            logger.debug(f"Replaced logical IDs in {relative_file_path}")
 
-                        file_content = text_content.encode("utf-8")
+                        file_content = replaced_content.encode("utf-8")
                     except UnicodeDecodeError:
                         # Not a text file, skip replacement
                         pass
@@ -462,13 +537,44 @@ def move_item_to_folder(item_name: str, item_type: str, folder_name: str, worksp
 
         # Step 3: Move the item
         logger.info(f"Moving {item_type} to folder '{folder_name}'...")
-        move_url = f"v1/workspaces/{workspace_id}/items/{item_id}/move"
-        move_payload = {"targetFolderId": target_folder_id}
+        if move_item_to_folder_by_id(item_id, target_folder_id, workspace_id, client):
+            logger.info(f"{item_type} '{item_name}' moved to folder '{folder_name}' successfully")
+            return True
+        return False
+
+    except Exception as e:
+        logger.error(f"Error moving item: {e}")
+        return False
+
+
+def move_item_to_folder_by_id(item_id: str, folder_id: str, workspace_id: str, client) -> bool:
+    """
+    Move a Fabric item to a folder when both IDs are already known.
+
+    Unlike move_item_to_folder, this makes a single API call and no lookups, which
+    suits loops over many items combined with prefetch_workspace_index.
+
+    Args:
+        item_id: ID of the item to move
+        folder_id: ID of the destination folder
+        workspace_id: Target workspace ID
+        client: Fabric REST client instance
 
-        move_response = client.post(move_url, json=move_payload)
+    Returns:
+        True if successful, False otherwise
+
+    Example:
+        >>> folders, items = prefetch_workspace_index(workspace_id, client)
+        >>> move_item_to_folder_by_id(
+        ...     items[("My Notebook", "Notebook")], folders["Analysis"], workspace_id, client
+        ... )
+    """
+    try:
+        move_url = f"v1/workspaces/{workspace_id}/items/{item_id}/move"
+        move_response = client.post(move_url, json={"targetFolderId": folder_id})
 
         if move_response.status_code == 200:
-            logger.info(f"{item_type} '{item_name}' moved to folder '{folder_name}' successfully")
+            logger.debug(f"Item {item_id} moved to folder {folder_id}")
             return True
         logger.error(f"Failed to move item: {move_response.status_code} - {move_response.text}")
         return False
@@ -478,6 +584,59 @@ def move_item_to_folder(item_name: str, item_type: str, folder_name: str, worksp
         return False
 
 
+def _list_all(client, url: str) -> list[dict[str, Any]]:
+    """List all entries of a paginated Fabric collection, following continuation tokens."""
+    entries: list[dict[str, Any]] = []
+    next_url = url
+
+    while next_url:
+        response = client.get(next_url)
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to list {url}: HTTP {response.status_code}")
+
+        body = response.json()
+        entries.extend(body.get("value", []))
+        continuation_token = body.get("continuationToken")
+        # Tokens are opaque and may contain "+", "/", "=" or "&", so they are percent-encoded
+        next_url = f"{url}?continuationToken={quote(continuation_token, safe='')}" if continuation_token else None
+
+    return entries
+
+
+def prefetch_workspace_index(workspace_id: str, client) -> tuple[dict[str, str], dict[tuple[str, str], str]]:
+    """
+    List a workspace's folders and items once for local name-to-ID lookups.
+
+    Use this instead of repeated get_folder_id_by_name/move_item_to_folder calls
+    when handling many items, which would each list the workspace again.
+
+    Args:
+        workspace_id: Target workspace ID
+        client: Fabric REST client instance
+
+    Returns:
+        Tuple of ({folder display name: folder ID}, {(item display name, item type): item ID}).
+        If several entries share a key, the first one listed is kept.
+
+    Raises:
+        RuntimeError: If listing folders or items fails
+
+    Example:
+        >>> folders, items = prefetch_workspace_index(workspace_id, client)
+        >>> folder_id = folders["Analysis"]
+        >>> notebook_id = items[("My Notebook", "Notebook")]
+    """
+    folders_by_name: dict[str, str] = {}
+    for folder in _list_all(client, f"v1/workspaces/{workspace_id}/folders"):
+        folders_by_name.setdefault(folder["displayName"], folder["id"])
+
+    items_by_name_type: dict[tuple[str, str], str] = {}
+    for item in _list_all(client, f"v1/workspaces/{workspace_id}/items"):
+        items_by_name_type.setdefault((item.get("displayName"), item.get("type")), item.get("id"))
+
+    return folders_by_name, items_by_name_type
+
+
 def get_kusto_query_uri(workspace_id: str, eventhouse_name: str, client) -> str:
     """
     Retrieve the Kusto query service URI for a given Eventhouse.
@@ -1001,7 +1160,8 @@ def exec_sql_query(sql_endpoint: str, database_name: str, sql_query: str, notebo
         >>> sql_endpoint = get_sql_endpoint(workspace_id, "MyLakehouse", "Lakehouse", client)
         >>>
         >>> # Execute query
-        >>> sql_query = "SELECT TOP 10 * FROM meters WHERE meter_type = 'residential'"
+        >>> # Name the needed columns; SELECT * reads every column of the underlying Delta table
+        >>> sql_query = "SELECT TOP 10 meter_id, meter_type FROM meters WHERE meter_type = 'residential'"
         >>> results = exec_sql_query(sql_endpoint, "MyLakehouse", sql_query, notebookutils)
         >>>
         >>> if results:
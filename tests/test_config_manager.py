@@ -3,6 +3,7 @@ Unit tests for DeploymentConfig module.
 """
 
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -10,7 +11,8 @@ from unittest.mock import Mock, patch
 
 import yaml
 
-from fabric_launcher.config_manager import DeploymentConfig
+from fabric_launcher import config_manager
+from fabric_launcher.config_manager import CACHE_FILE_SUFFIX, DeploymentConfig
 
 
 class TestDeploymentConfig(unittest.TestCase):
@@ -30,6 +32,15 @@ class TestDeploymentConfig(unittest.TestCase):
             "environments": {"DEV": {"github": {"branch": "dev"}}, "PROD": {"deployment": {"deployment_retries": 5}}},
         }
 
+        # Keep configs downloaded without save_to out of the shared temp directory
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache_dir_patcher = patch(
+            "fabric_launcher.config_manager.GITHUB_CONFIG_CACHE_DIR", Path(cache_dir.name) / "cfgcache"
+        )
+        cache_dir_patcher.start()
+        self.addCleanup(cache_dir_patcher.stop)
+
     def test_load_yaml_config(self):
         """Test loading YAML configuration file."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
@@ -79,6 +90,150 @@ class TestDeploymentConfig(unittest.TestCase):
         finally:
             Path(config_path).unlink()
 
+    def test_load_config_reuses_cached_parse(self):
+        """Test that loading an unchanged file again does not re-parse it."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = str(Path(temp_dir) / "config.yaml")
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.dump(self.sample_config, f)
+
+            first = DeploymentConfig(config_path=config_path)
+
+            with patch("fabric_launcher.config_manager.yaml", wraps=yaml) as mock_yaml:
+                second = DeploymentConfig(config_path=config_path)
+                self.assertEqual(mock_yaml.method_calls, [])
+
+            self.assertEqual(first.config, second.config)
+            # Each instance gets its own copy of the cached data
+            second.config["github"]["repo_owner"] = "changed"
+            self.assertEqual(first.config["github"]["repo_owner"], "test-org")
+            self.assertEqual(DeploymentConfig(config_path=config_path).get("github.repo_owner"), "test-org")
+
+    def test_load_config_cache_invalidated_on_change(self):
+        """Test that a modified file is parsed again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = str(Path(temp_dir) / "config.yaml")
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.dump(self.sample_config, f)
+
+            DeploymentConfig(config_path=config_path)
+
+            self.sample_config["github"]["repo_owner"] = "another-org"
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.dump(self.sample_config, f)
+
+            config = DeploymentConfig(config_path=config_path)
+            self.assertEqual(config.get("github.repo_owner"), "another-org")
+
+    def test_load_config_writes_and_reuses_cache_file(self):
+        """Test that a YAML config gets a JSON cache file that is reused by a fresh process."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = str(Path(temp_dir) / "config.yaml")
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.dump(self.sample_config, f)
+
+            DeploymentConfig(config_path=config_path, use_cache_file=True)
+            cache_file = Path(temp_dir) / f"config.yaml{CACHE_FILE_SUFFIX}"
+            self.assertTrue(cache_file.exists())
+
+            # Simulate a new process: the in-memory cache is empty
+            with (
+                patch.dict(config_manager._CONFIG_CACHE, clear=True),
+                patch("fabric_launcher.config_manager.yaml", wraps=yaml) as mock_yaml,
+            ):
+                config = DeploymentConfig(config_path=config_path, use_cache_file=True)
+                self.assertEqual(mock_yaml.method_calls, [])
+
+            self.assertEqual(config.config, self.sample_config)
+
+    def test_load_config_ignores_stale_cache_file(self):
+        """Test that a cache file not matching the YAML's mtime and size is ignored."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = str(Path(temp_dir) / "config.yaml")
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.dump(self.sample_config, f)
+            cache_file = Path(temp_dir) / f"config.yaml{CACHE_FILE_SUFFIX}"
+            cache_file.write_text(
+                json.dumps({"source_mtime_ns": 0, "source_size": 0, "config": {"github": {"repo_owner": "stale"}}}),
+                encoding="utf-8",
+            )
+
+            with patch.dict(config_manager._CONFIG_CACHE, clear=True):
+                config = DeploymentConfig(config_path=config_path, use_cache_file=True)
+
+            self.assertEqual(config.get("github.repo_owner"), "test-org")
+            self.assertEqual(json.loads(cache_file.read_text(encoding="utf-8"))["config"], self.sample_config)
+
+    def test_load_config_without_cache_file(self):
+        """Test that no cache file is written next to the config by default."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = str(Path(temp_dir) / "config.yaml")
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.dump(self.sample_config, f)
+
+            DeploymentConfig(config_path=config_path)
+
+            self.assertEqual([p.name for p in Path(temp_dir).iterdir()], ["config.yaml"])
+
+    def test_get_environment_override(self):
+        """Test environment-specific overrides and fallback to general config."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = str(Path(temp_dir) / "config.yaml")
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.dump(self.sample_config, f)
+
+            config = DeploymentConfig(config_path=config_path)
+
+            self.assertEqual(config.get("github.branch", environment="DEV"), "dev")
+            self.assertEqual(config.get("github.branch", environment="PROD"), "main")
+            self.assertEqual(config.get("deployment.deployment_retries", environment="PROD"), 5)
+            self.assertEqual(config.get("deployment.deployment_retries", environment="TEST"), 3)
+
+            # Reloading replaces the config, so previously resolved environments are not reused
+            self.sample_config["environments"]["DEV"]["github"]["branch"] = "feature"
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.dump(self.sample_config, f)
+            config.load_config(config_path)
+
+            self.assertEqual(config.get("github.branch", environment="DEV"), "feature")
+
+    def test_get_sees_in_place_edits_and_applies_defaults_per_call(self):
+        """Test that lookups follow in-place config edits and defaults are applied per call."""
+        config = DeploymentConfig()
+        config.config = self.sample_config
+
+        self.assertEqual(config.get("github.repo_owner"), "test-org")
+        self.assertEqual(config.get("github.missing", "first"), "first")
+        self.assertEqual(config.get("github.missing", "second"), "second")
+
+        config.config["github"]["branch"] = "dev"
+        config.config.update({"data": {"lakehouse_name": "OtherLH"}})
+        self.assertEqual(config.get("github.branch"), "dev")
+        self.assertEqual(config.get("data.lakehouse_name"), "OtherLH")
+
+        config.config = {"github": {"repo_owner": "other-org"}}
+        self.assertEqual(config.get("github.repo_owner"), "other-org")
+
+    def test_get_with_non_dict_config_returns_default(self):
+        """Test that a config file whose root is not a mapping yields defaults instead of errors."""
+        config = DeploymentConfig()
+        config.config = ["not", "a", "mapping"]
+
+        self.assertEqual(config.get("github.branch", "main"), "main")
+        self.assertEqual(config.validate_required_fields(["github.branch"]), ["github.branch"])
+
+    def test_validate_required_fields(self):
+        """Test that fields are found in the base config or the environment overrides."""
+        config = DeploymentConfig()
+        config.config = {
+            "github": {"repo_owner": "test-org", "token": None},
+            "environments": {"PROD": {"github": {"token": "secret"}}},
+        }
+
+        required = ["github.repo_owner", "github.token", "data.lakehouse_name"]
+        self.assertEqual(config.validate_required_fields(required), ["github.token", "data.lakehouse_name"])
+        self.assertEqual(config.validate_required_fields(required, environment="PROD"), ["data.lakehouse_name"])
+
     def test_get_github_config(self):
         """Test getting GitHub configuration."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
@@ -129,14 +284,15 @@ class TestDeploymentConfig(unittest.TestCase):
         finally:
             Path(config_path).unlink()
 
-    @patch("fabric_launcher.config_manager.requests.get")
+    @patch("fabric_launcher.config_manager.github_get")
     def test_download_config_from_github_success(self, mock_get):
         """Test downloading configuration from GitHub."""
         yaml_content = yaml.dump(self.sample_config)
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = yaml_content
+        mock_response.content = yaml_content.encode()
+        mock_response.headers = {}
         mock_get.return_value = mock_response
 
         config = DeploymentConfig(
@@ -150,7 +306,26 @@ class TestDeploymentConfig(unittest.TestCase):
         github_config = config.get_github_config()
         self.assertEqual(github_config["repo_owner"], "test-org")
 
-    @patch("fabric_launcher.config_manager.requests.get")
+    @patch("fabric_launcher.config_manager.github_get")
+    def test_download_config_from_github_parses_response_in_memory(self, mock_get):
+        """Test that a downloaded config is parsed from the response, not re-read from disk."""
+        yaml_content = yaml.dump(self.sample_config)
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = yaml_content.encode()
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        with patch.object(config_manager, "_parse_config", wraps=config_manager._parse_config) as mock_parse:
+            config = DeploymentConfig(
+                repo_owner="test-org", repo_name="test-repo", config_file_path="config/deployment.yaml"
+            )
+
+        mock_parse.assert_called_once_with(yaml_content.encode(), ".yaml")
+        self.assertEqual(config.get("github.repo_owner"), "test-org")
+
+    @patch("fabric_launcher.config_manager.github_get")
     def test_download_config_from_github_404(self, mock_get):
         """Test downloading config with 404 error."""
         mock_response = Mock()
@@ -167,14 +342,15 @@ class TestDeploymentConfig(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             DeploymentConfig(repo_owner="test-org", repo_name="test-repo", config_file_path="config/nonexistent.yaml")
 
-    @patch("fabric_launcher.config_manager.requests.get")
+    @patch("fabric_launcher.config_manager.github_get")
     def test_download_config_with_token(self, mock_get):
         """Test downloading config with GitHub token."""
         yaml_content = yaml.dump(self.sample_config)
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = yaml_content
+        mock_response.content = yaml_content.encode()
+        mock_response.headers = {}
         mock_get.return_value = mock_response
 
         github_token = "test-token-123"
@@ -190,6 +366,132 @@ class TestDeploymentConfig(unittest.TestCase):
         self.assertIn("headers", call_kwargs)
         self.assertEqual(call_kwargs["headers"]["Authorization"], f"token {github_token}")
 
+    @patch("fabric_launcher.config_manager.github_get")
+    def test_download_config_to_save_to_revalidates_with_etag(self, mock_get):
+        """Test that a saved config is revalidated with its ETag and kept on HTTP 304."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_to = str(Path(temp_dir) / "deployment.yaml")
+
+            mock_get.return_value = Mock(
+                status_code=200, content=yaml.dump(self.sample_config).encode(), headers={"ETag": '"v1"'}
+            )
+            DeploymentConfig(
+                repo_owner="test-org", repo_name="test-repo", config_file_path="config/deployment.yaml", save_to=save_to
+            )
+
+            self.assertEqual(json.loads(Path(f"{save_to}.meta").read_text(encoding="utf-8")), {"etag": '"v1"'})
+            self.assertNotIn("If-None-Match", mock_get.call_args.kwargs["headers"])
+            mtime_ns = Path(save_to).stat().st_mtime_ns
+
+            mock_get.return_value = Mock(status_code=304, content=b"", headers={})
+            config = DeploymentConfig(
+                repo_owner="test-org", repo_name="test-repo", config_file_path="config/deployment.yaml", save_to=save_to
+            )
+
+            self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+            self.assertEqual(config.config_path, save_to)
+            self.assertEqual(Path(save_to).stat().st_mtime_ns, mtime_ns)
+            self.assertEqual(config.get("github.repo_owner"), "test-org")
+
+    @patch("fabric_launcher.config_manager.github_get")
+    def test_download_config_without_save_to_is_cached_per_repository(self, mock_get):
+        """Test that configs downloaded without save_to are cached and revalidated on the next download."""
+        mock_get.return_value = Mock(
+            status_code=200,
+            content=yaml.dump(self.sample_config).encode(),
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+        first = DeploymentConfig(
+            repo_owner="test-org", repo_name="test-repo", config_file_path="config/deployment.yaml"
+        )
+
+        self.assertEqual(Path(first.config_path).parent, config_manager.GITHUB_CONFIG_CACHE_DIR)
+
+        mock_get.return_value = Mock(status_code=304, content=b"", headers={})
+        second = DeploymentConfig(
+            repo_owner="test-org", repo_name="test-repo", config_file_path="config/deployment.yaml"
+        )
+
+        headers = mock_get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.assertEqual(second.config_path, first.config_path)
+        self.assertEqual(second.get("github.repo_owner"), "test-org")
+
+        # A different branch is cached separately
+        mock_get.return_value = Mock(status_code=200, content=yaml.dump(self.sample_config).encode(), headers={})
+        other = DeploymentConfig(
+            repo_owner="test-org", repo_name="test-repo", config_file_path="config/deployment.yaml", branch="dev"
+        )
+        self.assertNotEqual(other.config_path, first.config_path)
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions only")
+    def test_write_file_atomically_keeps_file_permissions(self):
+        """Test that atomic writes use umask permissions for new files and keep those of replaced files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            new_file = Path(temp_dir) / "new.yaml"
+            config_manager._write_file_atomically(new_file, "a: 1")
+            self.assertEqual(new_file.stat().st_mode & 0o777, 0o666 & ~config_manager._UMASK)
+
+            existing_file = Path(temp_dir) / "existing.yaml"
+            existing_file.write_text("a: 1", encoding="utf-8")
+            existing_file.chmod(0o640)
+            config_manager._write_file_atomically(existing_file, "a: 2")
+            self.assertEqual(existing_file.stat().st_mode & 0o777, 0o640)
+            self.assertEqual(existing_file.read_text(encoding="utf-8"), "a: 2")
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions only")
+    @patch("fabric_launcher.config_manager.github_get")
+    def test_download_config_ignores_cache_dir_open_to_other_users(self, mock_get):
+        """Test that a cache directory writable by others is neither revalidated nor written to."""
+        cache_dir = config_manager.GITHUB_CONFIG_CACHE_DIR
+        cache_dir.mkdir(mode=0o700)
+        cache_path = config_manager._github_config_cache_path("test-org", "test-repo", "main", "config/deployment.yaml")
+        cache_path.write_text(yaml.dump({"github": {"repo_owner": "planted"}}), encoding="utf-8")
+        Path(f"{cache_path}.meta").write_text(json.dumps({"etag": '"planted"'}), encoding="utf-8")
+        cache_dir.chmod(0o777)
+
+        mock_get.return_value = Mock(status_code=200, content=yaml.dump(self.sample_config).encode(), headers={})
+        config = DeploymentConfig(
+            repo_owner="test-org", repo_name="test-repo", config_file_path="config/deployment.yaml"
+        )
+        self.addCleanup(Path(config.config_path).unlink, missing_ok=True)
+
+        self.assertNotIn("If-None-Match", mock_get.call_args.kwargs["headers"])
+        self.assertNotEqual(Path(config.config_path).parent, cache_dir)
+        self.assertEqual(config.get("github.repo_owner"), "test-org")
+
+    def test_save_and_load_json_config_with_and_without_orjson(self):
+        """Test that JSON configs round-trip through orjson and the standard library fallback."""
+        for orjson_module in (config_manager.orjson, None):
+            with (
+                self.subTest(orjson=orjson_module is not None),
+                patch("fabric_launcher.config_manager.orjson", orjson_module),
+                tempfile.TemporaryDirectory() as temp_dir,
+            ):
+                config_path = str(Path(temp_dir) / "config.json")
+                config = DeploymentConfig()
+                config.config = self.sample_config
+                config.save_config(config_path, format="json")
+
+                with open(config_path, encoding="utf-8") as f:
+                    self.assertEqual(json.load(f), self.sample_config)
+                self.assertEqual(DeploymentConfig(config_path=config_path).config, self.sample_config)
+
+    def test_load_json_config_matches_standard_library(self):
+        """Test that JSON configs parse like json.loads whether or not orjson is installed."""
+        content = '{"deployment": {"big": 123456789012345678901234567890, "nan": NaN, "huge": 1e400}}'
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+            config_path.write_text(content, encoding="utf-8")
+
+            config = DeploymentConfig(config_path=str(config_path))
+
+        self.assertEqual(config.get("deployment.big"), 123456789012345678901234567890)
+        self.assertIsInstance(config.get("deployment.big"), int)
+        self.assertNotEqual(config.get("deployment.nan"), config.get("deployment.nan"))
+        self.assertEqual(config.get("deployment.huge"), float("inf"))
+
     def test_create_template(self):
         """Test creating configuration template."""
         with tempfile.TemporaryDirectory() as temp_dir:
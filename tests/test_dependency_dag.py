@@ -0,0 +1,56 @@
+"""
+Unit tests for dependency_dag module.
+"""
+
+import pytest
+
+from fabric_launcher.dependency_dag import DEFAULT_ITEM_DEPS, compute_item_type_stages
+
+
+class TestComputeItemTypeStages:
+    """Tests for compute_item_type_stages function."""
+
+    def test_default_dependencies(self):
+        """Test staging with the built-in item type dependencies."""
+        stages = compute_item_type_stages(["Report", "Lakehouse", "SemanticModel", "Eventhouse", "KQLDashboard"])
+
+        assert stages == [["Lakehouse", "Eventhouse", "KQLDashboard"], ["SemanticModel"], ["Report"]]
+
+    def test_independent_types_share_a_stage(self):
+        """Test that item types without dependencies between them are deployed together."""
+        assert compute_item_type_stages(["Lakehouse", "Eventhouse", "Environment"]) == [
+            ["Lakehouse", "Eventhouse", "Environment"]
+        ]
+
+    def test_dependencies_outside_scope_are_ignored(self):
+        """Test that dependencies on item types not being deployed do not block a type."""
+        assert compute_item_type_stages(["Report", "Notebook"]) == [["Report", "Notebook"]]
+
+    def test_duplicates_are_removed(self):
+        """Test that an item type listed twice is deployed once."""
+        assert compute_item_type_stages(["Lakehouse", "Notebook", "Lakehouse"]) == [["Lakehouse"], ["Notebook"]]
+
+    def test_stage_order_follows_input_order(self):
+        """Test that types becoming ready in the same round keep their position from item_types."""
+        stages = compute_item_type_stages(["Notebook", "Report", "Lakehouse", "SemanticModel"])
+
+        assert stages == [["Lakehouse"], ["Notebook", "SemanticModel"], ["Report"]]
+
+    def test_custom_dependencies(self):
+        """Test staging with caller-provided dependencies."""
+        dependencies = {"B": {"A"}, "C": {"B"}}
+
+        assert compute_item_type_stages(["C", "B", "A"], dependencies) == [["A"], ["B"], ["C"]]
+
+    def test_cycle_raises(self):
+        """Test that circular dependencies are rejected."""
+        with pytest.raises(ValueError, match="Circular dependency"):
+            compute_item_type_stages(["A", "B", "C"], {"A": {"B"}, "B": {"A"}})
+
+    def test_default_dependencies_are_acyclic(self):
+        """Test that all item types in the default dependencies can be staged."""
+        item_types = sorted(set(DEFAULT_ITEM_DEPS) | set().union(*DEFAULT_ITEM_DEPS.values()))
+
+        stages = compute_item_type_stages(item_types)
+
+        assert sorted(item_type for stage in stages for item_type in stage) == item_types
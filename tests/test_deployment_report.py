@@ -3,10 +3,12 @@ Unit tests for DeploymentReport module.
 """
 
 import json
+import shutil
 import tempfile
 import unittest
+from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from fabric_launcher.deployment_report import DeploymentReport
 
@@ -53,6 +55,29 @@ class TestDeploymentReport(unittest.TestCase):
         self.assertEqual(self.report.steps[1]["step_name"], "Step 2")
         self.assertEqual(self.report.steps[2]["step_name"], "Step 3")
 
+    def test_event_timestamps_formatted_once_per_millisecond(self):
+        """Test that events within the same millisecond share one formatted timestamp."""
+        with patch("fabric_launcher.deployment_report.time.monotonic_ns", return_value=10**15):
+            self.report.add_step("Step 1", "success")
+            self.report.add_warning("Warning")
+            self.assertIs(self.report.steps[0]["timestamp"], self.report.report_data["warnings"][0]["timestamp"])
+
+        with patch("fabric_launcher.deployment_report.time.monotonic_ns", return_value=10**15 + 1_000_000):
+            self.report.add_step("Step 2", "success")
+
+        self.assertGreaterEqual(self.report.steps[1]["timestamp"], self.report.steps[0]["timestamp"])
+        self.assertIsNot(self.report.steps[1]["timestamp"], self.report.steps[0]["timestamp"])
+
+    def test_report_data_shares_step_and_item_lists(self):
+        """Test that steps and deployed items appear in report_data without copying."""
+        self.report.add_step("Download", "success")
+        self.report.add_deployed_item("TestLH", "Lakehouse")
+
+        self.assertIs(self.report.report_data["steps"], self.report.steps)
+        self.assertIs(self.report.report_data["items_deployed"], self.report.deployed_items)
+        self.assertEqual(self.report.report_data["steps"][0]["name"], "Download")
+        self.assertEqual(self.report.report_data["items_deployed"][0]["name"], "TestLH")
+
     def test_add_deployed_item(self):
         """Test adding a deployed item to the report."""
         self.report.add_deployed_item(item_name="TestLakehouse", item_type="Lakehouse", status="Success")
@@ -73,6 +98,23 @@ class TestDeploymentReport(unittest.TestCase):
         item = self.report.deployed_items[0]
         self.assertEqual(item["details"], "Connection timeout")
 
+    def test_summary_counts_items_and_files(self):
+        """Test that the summary totals follow add_deployed_item and add_uploaded_files."""
+        self.report.add_deployed_item("LH1", "Lakehouse")
+        self.report.add_deployed_item("NB1", "Notebook")
+        self.report.add_deployed_item("LH2", "Lakehouse")
+        self.report.add_uploaded_files("LH1", "data", 3)
+        self.report.add_uploaded_files("LH1", "samples", 4)
+
+        summary = self.report.get_summary()
+        self.assertEqual(summary["total_items_deployed"], 3)
+        self.assertEqual(summary["items_by_type"], {"Lakehouse": 2, "Notebook": 1})
+        self.assertEqual(summary["total_files_uploaded"], 7)
+
+        # The summary is a snapshot, not a view of the running totals
+        summary["items_by_type"]["Lakehouse"] = 0
+        self.assertEqual(self.report.get_summary()["items_by_type"]["Lakehouse"], 2)
+
     def test_duration_seconds(self):
         """Test duration calculation."""
         import time
@@ -84,6 +126,17 @@ class TestDeploymentReport(unittest.TestCase):
         self.assertGreater(duration, 0)
         self.assertIsInstance(duration, float)
 
+    def test_summary_duration_before_and_after_end(self):
+        """Test that the summary reports elapsed time until the deployment ends, then the final duration."""
+        self.report.start_time = datetime.now() - timedelta(seconds=5)
+        self.assertGreaterEqual(self.report.get_summary()["duration_seconds"], 5)
+
+        self.report.end_deployment()
+        final = self.report.report_data["deployment_duration_seconds"]
+        with patch("fabric_launcher.deployment_report.datetime") as mock_datetime:
+            self.assertEqual(self.report.get_summary()["duration_seconds"], final)
+            mock_datetime.now.assert_not_called()
+
     def test_save_report(self):
         """Test saving report to JSON file."""
         self.report.add_step("Test Step", "Completed", "Test details")
@@ -104,6 +157,38 @@ class TestDeploymentReport(unittest.TestCase):
             self.assertEqual(len(saved_data["steps"]), 1)
             self.assertEqual(len(saved_data["items_deployed"]), 1)
 
+    def test_save_report_without_orjson(self):
+        """Test that JSON reports are written with the standard library when orjson is unavailable."""
+        self.report.add_step("Test Step", "Completed", "Ünïcode details")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = str(Path(temp_dir) / "test_report.json")
+            with patch("fabric_launcher.deployment_report.orjson", None):
+                self.report.save_report(report_path)
+
+            with open(report_path, encoding="utf-8") as f:
+                saved_data = json.load(f)
+
+            self.assertEqual(saved_data["steps"][0]["details"], "Ünïcode details")
+
+    def test_save_text_report(self):
+        """Test saving the plain text report."""
+        self.report.add_deployed_item("TestLH", "Lakehouse")
+        self.report.add_deployed_item("TestNB", "Notebook")
+        self.report.end_deployment(success=True)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = Path(temp_dir) / "report.txt"
+            self.report.save_report(str(report_path), format="text")
+
+            text = report_path.read_text(encoding="utf-8")
+
+        self.assertTrue(text.startswith("=" * 60 + "\nDEPLOYMENT REPORT\n"))
+        self.assertIn("Status: SUCCESS\n", text)
+        self.assertIn("Items Deployed: 2\n", text)
+        self.assertIn("Items by Type:\n  Lakehouse: 1\n  Notebook: 1\n", text)
+        self.assertTrue(text.endswith("\n" + "=" * 60 + "\n"))
+
     def test_save_report_creates_directory(self):
         """Test that save_report creates parent directories."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -113,6 +198,16 @@ class TestDeploymentReport(unittest.TestCase):
             # Verify file was created in nested directory
             self.assertTrue(Path(nested_path).exists())
 
+    def test_save_report_recreates_removed_directory(self):
+        """Test that saving again recreates a report directory removed in between."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            nested_dir = Path(temp_dir) / "subdir"
+            self.report.save_report(str(nested_dir / "report.json"))
+            shutil.rmtree(nested_dir)
+            self.report.save_report(str(nested_dir / "report.txt"), format="text")
+
+            self.assertTrue((nested_dir / "report.txt").exists())
+
     @patch("builtins.print")
     def test_print_report(self, mock_print):
         """Test printing report summary."""
@@ -130,6 +225,44 @@ class TestDeploymentReport(unittest.TestCase):
         self.assertIn("DEPLOYMENT REPORT", printed_text)
         # Note: session_id is not printed in the current implementation
 
+    @patch("builtins.print")
+    def test_print_report_writes_once(self, mock_print):
+        """Test that the whole report is printed with a single call."""
+        for index in range(20):
+            self.report.add_deployed_item(f"Item{index}", "Notebook")
+            self.report.add_step(f"Step {index}", "success", "details")
+
+        self.report.print_report()
+
+        mock_print.assert_called_once()
+        printed_text = mock_print.call_args.args[0]
+        self.assertIn("📦 Items Deployed: 20", printed_text)
+        self.assertIn("  ✅ Step 19", printed_text)
+
+    @patch("builtins.print")
+    def test_print_report_plain_text(self, mock_print):
+        """Test that plain_text reports replace emoji with ASCII markers."""
+        report = DeploymentReport(plain_text=True)
+        report.add_step("Download", "success")
+        report.add_step("Validation", "warning")
+        report.add_deployed_item("TestLH", "Lakehouse")
+        report.end_deployment(success=True)
+
+        report.print_report()
+
+        printed_text = mock_print.call_args.args[0]
+        printed_text.encode("ascii")  # raises if any emoji is left
+        self.assertIn("[OK] Status: SUCCESS", printed_text)
+        self.assertIn("  [WARNING] Validation", printed_text)
+        self.assertIn("  - Lakehouse: 1", printed_text)
+
+    def test_plain_text_follows_stdout_encoding(self):
+        """Test that plain_text defaults to whether stdout can print emoji."""
+        with patch("fabric_launcher.deployment_report.sys.stdout", Mock(encoding="cp1252")):
+            self.assertTrue(DeploymentReport().plain_text)
+        with patch("fabric_launcher.deployment_report.sys.stdout", Mock(encoding="UTF-8")):
+            self.assertFalse(DeploymentReport().plain_text)
+
     def test_report_to_dict(self):
         """Test converting report to dictionary."""
         self.report.add_step("Test Step", "Completed", "Details")
@@ -145,6 +278,21 @@ class TestDeploymentReport(unittest.TestCase):
         self.assertEqual(len(report_dict["steps"]), 1)
         self.assertEqual(len(report_dict["items_deployed"]), 1)
 
+    def test_report_to_dict_copy_and_view(self):
+        """Test that to_dict returns a JSON-serializable copy unless a view is requested."""
+        copied = self.report.to_dict()
+        self.assertIsInstance(copied, dict)
+        json.dumps(copied)
+        copied["session_id"] = "changed"
+        self.assertNotEqual(self.report.report_data["session_id"], "changed")
+
+        view = self.report.to_dict(view=True)
+        with self.assertRaises(TypeError):
+            view["session_id"] = "changed"
+
+        self.report.add_step("Later Step", "Completed")
+        self.assertEqual(view["steps"][-1]["step_name"], "Later Step")
+
 
 class TestDeploymentReportEdgeCases(unittest.TestCase):
     """Test edge cases for DeploymentReport."""
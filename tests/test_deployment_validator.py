@@ -4,7 +4,10 @@ Tests for the DeploymentValidator class in deployment_validator module.
 
 import json
 import sys
-from unittest.mock import MagicMock
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 # Import the mock DataFrame from conftest (loaded via sys.modules)
 pd = sys.modules["pandas"]
@@ -25,6 +28,152 @@ class TestDeploymentValidatorInit:
         assert validator.validation_results == {}
 
 
+class TestValidateDeployment:
+    """Tests for validate_deployment method."""
+
+    @patch("sempy.fabric")
+    def test_collects_items_and_checks_accessibility(self, mock_fabric):
+        """Test that workspace items are collected per column and every item is tested."""
+        mock_fabric.list_items.return_value = pd.DataFrame(
+            {
+                "Display Name": ["SalesLH", "LoadData", "SalesReport"],
+                "Type": ["Lakehouse", "Notebook", "Report"],
+                "Id": ["id-1", "id-2", "id-3"],
+            }
+        )
+        validator = DeploymentValidator(workspace_id="test-workspace-id", notebookutils=MagicMock())
+
+        results = validator.validate_deployment()
+
+        assert results["validation_passed"] is True
+        assert results["items"] == [
+            {"name": "SalesLH", "type": "Lakehouse", "id": "id-1"},
+            {"name": "LoadData", "type": "Notebook", "id": "id-2"},
+            {"name": "SalesReport", "type": "Report", "id": "id-3"},
+        ]
+        assert results["checks"]["accessibility"]["tested"] == 3
+        mock_fabric.resolve_item_id.assert_not_called()
+        assert [item["name"] for item in results["checks"]["accessibility"]["items"]] == [
+            "SalesLH",
+            "LoadData",
+            "SalesReport",
+        ]
+
+    @patch("sempy.fabric")
+    def test_failed_probe_still_counts_item_as_accessible(self, mock_fabric):
+        """Test that items that fail a deeper probe are accessible and keep the error."""
+        mock_fabric.list_items.return_value = pd.DataFrame(
+            {"Display Name": ["SalesLH", "LoadData"], "Type": ["Lakehouse", "Notebook"], "Id": ["id-1", "id-2"]}
+        )
+        notebookutils = MagicMock()
+        notebookutils.lakehouse.getWithProperties.side_effect = RuntimeError("not found")
+        validator = DeploymentValidator(workspace_id="test-workspace-id", notebookutils=notebookutils)
+
+        accessibility = validator.validate_deployment()["checks"]["accessibility"]
+
+        assert accessibility["accessible"] == 2
+        assert accessibility["items"][0]["error"] == "not found"
+        assert accessibility["items"][1]["error"] is None
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    @patch("sempy.fabric")
+    def test_only_lakehouses_are_probed(self, mock_fabric, max_workers):
+        """Test that probes keep listing order for any max_workers and notebooks are reported as not probed."""
+        mock_fabric.list_items.return_value = pd.DataFrame(
+            {
+                "Display Name": ["SalesLH", "LoadData", "RawLH"],
+                "Type": ["Lakehouse", "Notebook", "Lakehouse"],
+                "Id": ["id-1", "id-2", "id-3"],
+            }
+        )
+        validator = DeploymentValidator(workspace_id="test-workspace-id", notebookutils=MagicMock())
+
+        results = validator.validate_deployment(max_workers=max_workers)
+
+        items = results["checks"]["accessibility"]["items"]
+        assert [(item["name"], item["probed"]) for item in items] == [
+            ("SalesLH", True),
+            ("LoadData", False),
+            ("RawLH", True),
+        ]
+        mock_fabric.resolve_item_id.assert_not_called()
+
+    @patch("sempy.fabric")
+    def test_accessibility_plain_text(self, mock_fabric, capsys):
+        """Test that accessibility lines use ASCII markers in plain-text mode."""
+        mock_fabric.list_items.return_value = pd.DataFrame(
+            {"Display Name": ["SalesLH"], "Type": ["Lakehouse"], "Id": ["id-1"]}
+        )
+        validator = DeploymentValidator(workspace_id="test-workspace-id", notebookutils=MagicMock(), plain_text=True)
+
+        validator.validate_deployment()
+
+        output = capsys.readouterr().out
+        assert "  [OK] Lakehouse 'SalesLH' is accessible" in output
+        assert "✅ Lakehouse" not in output
+
+    @patch("sempy.fabric")
+    def test_reports_missing_expected_items(self, mock_fabric):
+        """Test that expected items must match both name and type."""
+        mock_fabric.list_items.return_value = pd.DataFrame(
+            {"Display Name": ["SalesLH", "Sales"], "Type": ["Lakehouse", "Notebook"], "Id": ["id-1", "id-2"]}
+        )
+        validator = DeploymentValidator(workspace_id="test-workspace-id", notebookutils=MagicMock())
+
+        results = validator.validate_deployment(
+            expected_items=[{"name": "SalesLH", "type": "Lakehouse"}, {"name": "Sales", "type": "Report"}],
+            check_accessibility=False,
+        )
+
+        assert results["validation_passed"] is False
+        assert results["checks"]["expected_items"] is False
+        assert results["errors"] == ["Missing items: Sales (Report)"]
+
+    @patch("sempy.fabric")
+    def test_reuses_results_within_cache_ttl(self, mock_fabric):
+        """Test that identical validations within the TTL reuse results until invalidated."""
+        mock_fabric.list_items.return_value = pd.DataFrame(
+            {"Display Name": ["SalesLH"], "Type": ["Lakehouse"], "Id": ["id-1"]}
+        )
+        validator = DeploymentValidator(
+            workspace_id="test-workspace-id", notebookutils=MagicMock(), cache_ttl_seconds=300
+        )
+
+        first = validator.validate_deployment(check_accessibility=False)
+        assert validator.validate_deployment(check_accessibility=False) is first
+        assert mock_fabric.list_items.call_count == 1
+
+        # Different arguments or an explicit invalidation validate again
+        validator.validate_deployment(check_accessibility=True)
+        assert mock_fabric.list_items.call_count == 2
+        validator.invalidate()
+        validator.validate_deployment(check_accessibility=True)
+        assert mock_fabric.list_items.call_count == 3
+
+    @patch("sempy.fabric")
+    def test_item_details_on_demand(self, mock_fabric):
+        """Test that item details can be skipped and built later from the listed items."""
+        mock_fabric.list_items.return_value = pd.DataFrame(
+            {"Display Name": ["SalesLH", "Sales"], "Type": ["Lakehouse", "Report"], "Id": ["id-1", "id-2"]}
+        )
+        validator = DeploymentValidator(workspace_id="test-workspace-id", notebookutils=MagicMock())
+        assert validator.get_item_details() == []
+
+        results = validator.validate_deployment(
+            expected_items=[{"name": "Sales", "type": "Report"}],
+            check_accessibility=False,
+            include_item_details=False,
+        )
+
+        assert "items" not in results
+        assert results["checks"]["expected_items"] is True
+        assert results["items_by_type"] == {"Lakehouse": 1, "Report": 1}
+        assert validator.get_item_details() == [
+            {"name": "SalesLH", "type": "Lakehouse", "id": "id-1"},
+            {"name": "Sales", "type": "Report", "id": "id-2"},
+        ]
+
+
 class TestSaveValidationReport:
     """Tests for save_validation_report method."""
 
@@ -47,6 +196,33 @@ class TestSaveValidationReport:
         assert saved_data["validation_passed"] is True
         assert saved_data["timestamp"] == "2024-01-01T00:00:00"
 
+    def test_save_report_without_orjson(self, tmp_path):
+        """Test that the report is written with the standard library when orjson is unavailable."""
+        validator = DeploymentValidator(workspace_id="test-workspace-id", notebookutils=MagicMock())
+        validator.validation_results = {"validation_passed": False, "errors": ["Missing items: Sales (Report)"]}
+
+        output_path = tmp_path / "validation_report.json"
+        with patch("fabric_launcher.deployment_validator.orjson", None):
+            validator.save_validation_report(str(output_path))
+
+        assert json.loads(output_path.read_text(encoding="utf-8")) == validator.validation_results
+
+    @patch("sempy.fabric")
+    def test_item_counts_saved_as_numbers(self, mock_fabric, tmp_path):
+        """Test that non-int counts from pandas (e.g. numpy scalars) are saved as JSON numbers."""
+        items = pd.DataFrame({"Display Name": ["SalesLH"], "Type": ["Lakehouse"], "Id": ["id-1"]})
+        items.groupby = MagicMock()
+        items.groupby.return_value.size.return_value.to_dict.return_value = {"Lakehouse": Decimal(1)}
+        mock_fabric.list_items.return_value = items
+        validator = DeploymentValidator(workspace_id="test-workspace-id", notebookutils=MagicMock())
+        validator.validate_deployment(check_accessibility=False, include_item_details=False)
+
+        output_path = tmp_path / "validation_report.json"
+        with patch("fabric_launcher.deployment_validator.orjson", None):
+            validator.save_validation_report(str(output_path))
+
+        assert json.loads(output_path.read_text(encoding="utf-8"))["items_by_type"] == {"Lakehouse": 1}
+
     def test_save_report_error_handling(self):
         """Test save report handles errors gracefully."""
         mock_notebookutils = MagicMock()
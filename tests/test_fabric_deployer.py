@@ -12,6 +12,7 @@ import pytest
 # Import the mock DataFrame from conftest (loaded via sys.modules)
 pd = sys.modules["pandas"]
 
+from fabric_launcher import fabric_deployer  # noqa: E402
 from fabric_launcher.fabric_deployer import (  # noqa: E402
     FabricDeployer,
     FabricNotebookTokenCredential,
@@ -45,6 +46,91 @@ class TestFabricNotebookTokenCredential:
         assert token.expires_on == 1700000000
         mock_notebookutils.credentials.getToken.assert_called_once_with("pbi")
 
+    def test_get_token_reuses_cached_token_until_near_expiry(self):
+        """Test that a token is reused until it is about to expire."""
+        mock_notebookutils = MagicMock()
+        tokens = []
+        for exp in (1_700_003_600, 1_700_007_200):
+            payload_b64 = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+            tokens.append(f"header.{payload_b64}.signature")
+        mock_notebookutils.credentials.getToken.side_effect = tokens
+
+        credential = FabricNotebookTokenCredential(mock_notebookutils)
+        with patch("fabric_launcher.fabric_deployer.time.time", return_value=1_700_000_000):
+            first = credential.get_token("scope")
+            assert credential.get_token("scope") is first
+        with patch("fabric_launcher.fabric_deployer.time.time", return_value=1_700_003_580):
+            assert credential.get_token("scope").token == tokens[1]
+
+        assert mock_notebookutils.credentials.getToken.call_count == 2
+
+    def test_get_token_refreshes_in_background_within_margin(self):
+        """Test that a token inside the refresh margin is returned while a new one is fetched."""
+        mock_notebookutils = MagicMock()
+        tokens = []
+        for exp in (1_700_003_600, 1_700_007_200):
+            payload_b64 = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+            tokens.append(f"header.{payload_b64}.signature")
+        mock_notebookutils.credentials.getToken.side_effect = tokens
+
+        credential = FabricNotebookTokenCredential(mock_notebookutils)
+        with patch("fabric_launcher.fabric_deployer.time.time", return_value=1_700_000_000):
+            first = credential.get_token("scope")
+
+        with (
+            patch("fabric_launcher.fabric_deployer.time.time", return_value=1_700_003_400),
+            patch("fabric_launcher.fabric_deployer.threading.Thread") as mock_thread,
+        ):
+            assert credential.get_token("scope") is first
+            assert credential.get_token("scope") is first
+            mock_thread.assert_called_once()
+            mock_thread.call_args.kwargs["target"]()
+            assert credential.get_token("scope").token == tokens[1]
+
+    def test_background_refresh_backs_off_when_token_is_not_renewed(self):
+        """Test that a refresh returning the same near-expiry token is not retried on every call."""
+        mock_notebookutils = MagicMock()
+        payload_b64 = base64.urlsafe_b64encode(json.dumps({"exp": 1_700_003_600}).encode()).decode().rstrip("=")
+        mock_notebookutils.credentials.getToken.return_value = f"header.{payload_b64}.signature"
+
+        credential = FabricNotebookTokenCredential(mock_notebookutils)
+        with patch("fabric_launcher.fabric_deployer.time.time", return_value=1_700_000_000):
+            first = credential.get_token("scope")
+
+        with patch("fabric_launcher.fabric_deployer.threading.Thread") as mock_thread:
+            with patch("fabric_launcher.fabric_deployer.time.time", return_value=1_700_003_400):
+                assert credential.get_token("scope") is first
+                mock_thread.call_args.kwargs["target"]()
+                # The refreshed token still expires within the margin, so it is not used or retried yet
+                assert credential.get_token("scope") is first
+                assert credential.get_token("scope") is first
+            assert mock_thread.call_count == 1
+
+            with patch("fabric_launcher.fabric_deployer.time.time", return_value=1_700_003_440):
+                credential.get_token("scope")
+            assert mock_thread.call_count == 2
+
+    def test_extract_jwt_expiration_among_other_claims(self):
+        """Test that the expiration claim is found between other claims."""
+        payload = json.dumps({"aud": "https://analysis.windows.net/powerbi/api", "exp": 1700000000, "iat": 1699996400})
+        payload_b64 = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+        credential = FabricNotebookTokenCredential(MagicMock())
+
+        assert credential._extract_jwt_expiration(f"header.{payload_b64}.signature") == 1700000000
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_extract_jwt_expiration_ignores_nested_exp(self, use_orjson):
+        """Test that only the top-level expiration claim is used, with and without orjson."""
+        payload = json.dumps({"cnf": {"exp": 1}, "exp": 1700000000})
+        payload_b64 = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+        credential = FabricNotebookTokenCredential(MagicMock())
+
+        orjson_module = fabric_deployer.orjson if use_orjson else None
+        with patch("fabric_launcher.fabric_deployer.orjson", orjson_module):
+            assert credential._extract_jwt_expiration(f"header.{payload_b64}.signature") == 1700000000
+
     def test_get_token_invalid_jwt(self):
         """Test handling of invalid JWT token."""
         mock_notebookutils = MagicMock()
@@ -55,6 +141,18 @@ class TestFabricNotebookTokenCredential:
         with pytest.raises(ValueError, match="Invalid JWT token format"):
             credential.get_token("scope")
 
+    @pytest.mark.parametrize("exp", [[1700000000], {"value": 1700000000}, None])
+    def test_get_token_non_numeric_exp_claim(self, exp):
+        """Test that a non-numeric expiration claim is reported as an invalid token."""
+        mock_notebookutils = MagicMock()
+        payload_b64 = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+        mock_notebookutils.credentials.getToken.return_value = f"header.{payload_b64}.signature"
+
+        credential = FabricNotebookTokenCredential(mock_notebookutils)
+
+        with pytest.raises(ValueError, match="Invalid JWT token format"):
+            credential.get_token("scope")
+
     def test_get_token_missing_exp_claim(self):
         """Test handling of JWT without expiration claim."""
         mock_notebookutils = MagicMock()
@@ -78,7 +176,7 @@ class TestFabricDeployerInit:
         """Test default initialization."""
         mock_notebookutils = MagicMock()
 
-        with patch("fabric_launcher.fabric_deployer.FabricWorkspace"):
+        with patch("fabric_cicd.FabricWorkspace"):
             deployer = FabricDeployer(
                 workspace_id="test-workspace-id", repository_directory="/repo/path", notebookutils=mock_notebookutils
             )
@@ -94,7 +192,7 @@ class TestFabricDeployerInit:
         """Test initialization with custom parameters."""
         mock_notebookutils = MagicMock()
 
-        with patch("fabric_launcher.fabric_deployer.FabricWorkspace"):
+        with patch("fabric_cicd.FabricWorkspace"):
             deployer = FabricDeployer(
                 workspace_id="test-workspace-id",
                 repository_directory="/repo/path",
@@ -108,6 +206,59 @@ class TestFabricDeployerInit:
             assert deployer.allow_non_empty_workspace is True
             assert deployer.fix_zero_logical_ids is False
 
+    def test_warns_when_api_root_url_changes(self, capsys):
+        """Test that a deployer with a different API root URL warns that the setting is shared."""
+        with (
+            patch("fabric_launcher.fabric_deployer._configured_api_root_url", None),
+            patch("fabric_cicd.FabricWorkspace"),
+        ):
+            for api_root_url in ("https://api.fabric.microsoft.com", "https://api.fabric.microsoft.com"):
+                FabricDeployer("ws", "/repo/path", MagicMock(), api_root_url=api_root_url)
+            assert "API root URL changed" not in capsys.readouterr().out
+
+            FabricDeployer("ws", "/repo/path", MagicMock(), api_root_url="https://msitapi.fabric.microsoft.com")
+            assert "API root URL changed" in capsys.readouterr().out
+
+    def test_sets_api_root_url_changed_elsewhere(self):
+        """Test that the API root URL is set again even if it matches the last configured one."""
+        import fabric_cicd.constants
+
+        with (
+            patch("fabric_launcher.fabric_deployer._configured_api_root_url", None),
+            patch("fabric_cicd.FabricWorkspace"),
+            patch.object(fabric_cicd.constants, "DEFAULT_API_ROOT_URL", None),
+        ):
+            FabricDeployer("ws", "/repo/path", MagicMock(), api_root_url="https://api.fabric.microsoft.com")
+            fabric_cicd.constants.DEFAULT_API_ROOT_URL = "https://other.example.com"
+            FabricDeployer("ws", "/repo/path", MagicMock(), api_root_url="https://api.fabric.microsoft.com")
+
+            assert fabric_cicd.constants.DEFAULT_API_ROOT_URL == "https://api.fabric.microsoft.com"
+
+
+class TestValidateWorkspaceIsEmpty:
+    """Tests for _validate_workspace_is_empty method."""
+
+    @patch("sempy.fabric")
+    def test_lists_other_items_and_blocks_deployment(self, mock_fabric, capsys):
+        """Test that items besides the current notebook are listed and block the deployment."""
+        mock_notebookutils = MagicMock()
+        mock_notebookutils.runtime.context = {"currentNotebookName": "Deploy"}
+        other_items = pd.DataFrame({"Display Name": ["SalesLH", "LoadData"], "Type": ["Lakehouse", "Notebook"]})
+        all_items = MagicMock(empty=False)
+        all_items.__getitem__.side_effect = lambda key: ["Deploy"] if key == "Display Name" else other_items
+        mock_fabric.list_items.return_value = all_items
+
+        with patch("fabric_cicd.FabricWorkspace"):
+            deployer = FabricDeployer(
+                workspace_id="test-workspace-id", repository_directory="/repo/path", notebookutils=mock_notebookutils
+            )
+
+        with pytest.raises(RuntimeError, match="2 existing item"):
+            deployer._validate_workspace_is_empty()
+
+        output = capsys.readouterr().out
+        assert "  • SalesLH (Lakehouse)\n  • LoadData (Notebook)\n" in output
+
 
 class TestDeployItems:
     """Tests for deploy_items method."""
@@ -117,8 +268,8 @@ class TestDeployItems:
         mock_notebookutils = MagicMock()
 
         with (
-            patch("fabric_launcher.fabric_deployer.FabricWorkspace"),
-            patch("fabric_launcher.fabric_deployer.publish_all_items"),
+            patch("fabric_cicd.FabricWorkspace"),
+            patch("fabric_cicd.publish_all_items"),
             patch("fabric_launcher.fabric_deployer.PlatformFileFixer") as mock_fixer,
         ):
             mock_fixer_instance = MagicMock()
@@ -138,13 +289,34 @@ class TestDeployItems:
             # fixer should be called
             mock_fixer_instance.scan_and_fix_all.assert_called_once()
 
+    def test_deploy_items_runs_fixer_once_per_deployer(self):
+        """Test that staged deployments check .platform files only on the first stage."""
+        with (
+            patch("fabric_cicd.FabricWorkspace"),
+            patch("fabric_cicd.publish_all_items"),
+            patch("fabric_launcher.fabric_deployer.PlatformFileFixer") as mock_fixer,
+        ):
+            mock_fixer.return_value.scan_and_fix_all.return_value = {"files_fixed": 0, "files_with_zero_guid": 0}
+
+            deployer = FabricDeployer(
+                workspace_id="test-workspace-id",
+                repository_directory="/repo/path",
+                notebookutils=MagicMock(),
+                allow_non_empty_workspace=True,
+            )
+
+            deployer.deploy_items(item_types=["Lakehouse"])
+            deployer.deploy_items(item_types=["Notebook"])
+
+            mock_fixer.return_value.scan_and_fix_all.assert_called_once()
+
     def test_deploy_items_skip_fixer(self):
         """Test deployment skips fixer when disabled."""
         mock_notebookutils = MagicMock()
 
         with (
-            patch("fabric_launcher.fabric_deployer.FabricWorkspace"),
-            patch("fabric_launcher.fabric_deployer.publish_all_items"),
+            patch("fabric_cicd.FabricWorkspace"),
+            patch("fabric_cicd.publish_all_items"),
             patch("fabric_launcher.fabric_deployer.PlatformFileFixer") as mock_fixer,
         ):
             deployer = FabricDeployer(
@@ -165,8 +337,8 @@ class TestDeployItems:
         mock_notebookutils = MagicMock()
 
         with (
-            patch("fabric_launcher.fabric_deployer.FabricWorkspace"),
-            patch("fabric_launcher.fabric_deployer.publish_all_items"),
+            patch("fabric_cicd.FabricWorkspace"),
+            patch("fabric_cicd.publish_all_items"),
             patch("fabric_launcher.fabric_deployer.PlatformFileFixer") as mock_fixer,
         ):
             mock_fixer_instance = MagicMock()
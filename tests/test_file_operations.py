@@ -8,7 +8,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from fabric_launcher.file_operations import LakehouseFileManager
+from fabric_launcher.file_operations import LakehouseFileManager, _compile_file_patterns
 
 
 class TestLakehouseFileManagerInit:
@@ -46,6 +46,55 @@ class TestMatchesPattern:
         assert LakehouseFileManager._matches_pattern("other.yaml", "config.yaml") is False
 
 
+class TestCompileFilePatterns:
+    """Tests for the combined file pattern regex."""
+
+    def test_matches_any_pattern(self):
+        """Test that a filename matching any pattern is accepted."""
+        matcher = _compile_file_patterns(("*.json", "*.csv", "config.yaml"))
+
+        assert matcher.match("data.json")
+        assert matcher.match("report.csv")
+        assert matcher.match("config.yaml")
+        assert not matcher.match("other.yaml")
+        assert not matcher.match("data.json.bak")
+
+    def test_agrees_with_matches_pattern(self):
+        """Test that the combined regex gives the same answers as fnmatch per pattern."""
+        patterns = ("test_*", "*.[ch]", "file?.txt")
+        matcher = _compile_file_patterns(patterns)
+
+        for name in ["test_a.py", "main.c", "main.h", "main.cpp", "file1.txt", "file10.txt", "xtest_"]:
+            expected = any(LakehouseFileManager._matches_pattern(name, p) for p in patterns)
+            assert bool(matcher.match(name)) is expected
+
+    def test_copy_folder_filters_with_patterns(self):
+        """Test that copy_folder_to_lakehouse only copies files matching the patterns."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir) / "source"
+            (source_dir / "subdir").mkdir(parents=True)
+            (source_dir / "root.json").write_text("{}")
+            (source_dir / "root.txt").write_text("skip")
+            (source_dir / "subdir" / "nested.csv").write_text("a,b")
+
+            mock_notebookutils = MagicMock()
+            mock_notebookutils.lakehouse.getWithProperties.return_value.properties = {"abfsPath": "abfss://x/"}
+            mock_notebookutils.fs.getMountPath.return_value = temp_dir
+
+            manager = LakehouseFileManager(mock_notebookutils)
+            manager.copy_folder_to_lakehouse(
+                lakehouse_name="TestLakehouse",
+                source_folder=str(source_dir),
+                target_folder="data",
+                file_patterns=["*.json", "*.csv"],
+            )
+
+            target_dir = Path(temp_dir) / "Files" / "data"
+            assert (target_dir / "root.json").exists()
+            assert (target_dir / "subdir" / "nested.csv").exists()
+            assert not (target_dir / "root.txt").exists()
+
+
 class TestUploadFilesToLakehouse:
     """Tests for upload_files_to_lakehouse method."""
 
@@ -61,6 +110,34 @@ class TestUploadFilesToLakehouse:
                 lakehouse_name="NonExistent", source_directory="/fake/path", target_folder="data"
             )
 
+    def test_upload_files_copies_matching_files_concurrently(self):
+        """Test that matching files from all subfolders are uploaded with several workers."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir) / "source"
+            (source_dir / "nested").mkdir(parents=True)
+            for name in ("a.json", "b.json", "skip.txt"):
+                (source_dir / name).write_text(name)
+            (source_dir / "nested" / "c.json").write_text("c.json")
+
+            mock_notebookutils = MagicMock()
+            mock_notebookutils.lakehouse.getWithProperties.return_value.properties = {
+                "abfsPath": "abfss://container@storage.dfs.core.windows.net/"
+            }
+            mock_notebookutils.fs.getMountPath.return_value = temp_dir
+
+            manager = LakehouseFileManager(mock_notebookutils)
+            manager.upload_files_to_lakehouse(
+                lakehouse_name="TestLakehouse",
+                source_directory=str(source_dir),
+                target_folder="data",
+                file_patterns=["*.json"],
+                max_workers=2,
+            )
+
+            target_dir = Path(temp_dir) / "Files" / "data"
+            assert sorted(path.name for path in target_dir.iterdir()) == ["a.json", "b.json", "c.json"]
+            assert (target_dir / "c.json").read_text() == "c.json"
+
 
 class TestUploadFileToLakehouse:
     """Tests for upload_file_to_lakehouse method."""
@@ -9,6 +9,8 @@ from io import BytesIO
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+import requests
+
 from fabric_launcher.github_downloader import GitHubDownloader
 
 
@@ -42,7 +44,7 @@ class TestGitHubDownloader(unittest.TestCase):
         self.assertEqual(downloader.branch, "main")
         self.assertIsNone(downloader.github_token)
 
-    @patch("fabric_launcher.github_downloader.requests.get")
+    @patch("fabric_launcher.github_downloader.github_get")
     def test_download_repository_success(self, mock_get):
         """Test successful repository download."""
         # Create a valid zip file in memory
@@ -72,7 +74,7 @@ class TestGitHubDownloader(unittest.TestCase):
             self.assertTrue(Path(temp_dir).exists())
             self.assertTrue((Path(temp_dir) / "test_file.txt").exists())
 
-    @patch("fabric_launcher.github_downloader.requests.get")
+    @patch("fabric_launcher.github_downloader.github_get")
     def test_download_repository_with_token(self, mock_get):
         """Test repository download with authentication token."""
         # Create a valid zip file in memory
@@ -97,7 +99,7 @@ class TestGitHubDownloader(unittest.TestCase):
             self.assertIn("headers", call_kwargs)
             self.assertEqual(call_kwargs["headers"]["Authorization"], f"token {self.github_token}")
 
-    @patch("fabric_launcher.github_downloader.requests.get")
+    @patch("fabric_launcher.github_downloader.github_get")
     def test_download_repository_404_error(self, mock_get):
         """Test repository download with 404 error."""
         mock_response = Mock()
@@ -113,7 +115,32 @@ class TestGitHubDownloader(unittest.TestCase):
 
             self.assertIn("404", str(context.exception))
 
-    @patch("fabric_launcher.github_downloader.requests.get")
+    @patch("fabric_launcher.github_downloader.github_get")
+    def test_get_commit_sha_revalidates_with_etag(self, mock_get):
+        """Test that the branch commit is resolved and revalidated with its ETag."""
+        mock_get.return_value = Mock(status_code=200, text="abc1234\n", headers={"ETag": '"etag-1"'})
+
+        downloader = GitHubDownloader(repo_owner=self.repo_owner, repo_name=self.repo_name)
+        commit = downloader.get_commit_sha()
+
+        self.assertEqual(commit, ("abc1234", '"etag-1"'))
+        self.assertIn("/commits/main", mock_get.call_args.args[0])
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["Accept"], "application/vnd.github.sha")
+
+        mock_get.return_value = Mock(status_code=304, headers={})
+        self.assertEqual(downloader.get_commit_sha(commit), commit)
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"etag-1"')
+
+    @patch("fabric_launcher.github_downloader.github_get")
+    def test_get_commit_sha_returns_none_on_error(self, mock_get):
+        """Test that a failed commit lookup returns None instead of raising."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("offline")
+
+        downloader = GitHubDownloader(repo_owner=self.repo_owner, repo_name=self.repo_name)
+
+        self.assertIsNone(downloader.get_commit_sha())
+
+    @patch("fabric_launcher.github_downloader.github_get")
     def test_extract_folder_path_filtering(self, mock_get):
         """Test extraction with folder path filtering."""
         downloader = GitHubDownloader(repo_owner=self.repo_owner, repo_name=self.repo_name)
@@ -145,7 +172,7 @@ class TestGitHubDownloader(unittest.TestCase):
 class TestGitHubDownloaderIntegration(unittest.TestCase):
     """Integration tests for GitHubDownloader."""
 
-    @patch("fabric_launcher.github_downloader.requests.get")
+    @patch("fabric_launcher.github_downloader.github_get")
     @patch("fabric_launcher.github_downloader.zipfile.ZipFile")
     def test_download_and_extract_workflow(self, mock_zipfile, mock_get):
         """Test complete download and extract workflow."""
@@ -0,0 +1,31 @@
+"""
+Unit tests for the shared GitHub HTTP session.
+"""
+
+from unittest.mock import patch
+
+from fabric_launcher import _http
+
+
+class TestGithubGet:
+    """Tests for github_get function."""
+
+    def test_session_is_reused(self):
+        """Test that every call goes through the same session."""
+        assert _http._get_session() is _http._get_session()
+
+    def test_session_retries_transient_errors(self):
+        """Test that HTTPS requests are retried on throttling and server errors."""
+        adapter = _http._get_session().get_adapter("https://raw.githubusercontent.com/")
+
+        assert adapter.max_retries.total == 3
+        assert {429, 500, 502, 503, 504} <= set(adapter.max_retries.status_forcelist)
+
+    def test_passes_headers_and_timeout(self):
+        """Test that headers, timeout and extra arguments are forwarded to the session."""
+        with patch.object(_http._get_session(), "get") as mock_get:
+            _http.github_get("https://example.com/file", headers={"Authorization": "token x"}, stream=True)
+
+        mock_get.assert_called_once_with(
+            "https://example.com/file", headers={"Authorization": "token x"}, timeout=30, stream=True
+        )
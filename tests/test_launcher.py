@@ -6,6 +6,8 @@ only available in Fabric notebook environment.
 """
 
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -185,6 +187,35 @@ class TestFabricLauncherMethods(unittest.TestCase):
             # Verify extraction was called
             mock_downloader_instance.download_and_extract_folder.assert_called_once()
 
+    @patch("sempy.fabric")
+    @patch("fabric_launcher.launcher.GitHubDownloader")
+    def test_download_repository_reuses_unchanged_commit(self, mock_downloader_class, mock_fabric):
+        """Test that a repeated download is skipped while the branch points to the same commit."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        mock_downloader_instance = Mock()
+        mock_downloader_instance.get_commit_sha.return_value = ("abc1234", '"etag-1"')
+        mock_downloader_class.return_value = mock_downloader_instance
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for _ in range(2):
+                launcher.download_repository(
+                    repo_owner="test-org", repo_name="test-repo", extract_to=temp_dir, reuse_if_unchanged=True
+                )
+
+            mock_downloader_instance.download_and_extract_folder.assert_called_once()
+            mock_downloader_instance.get_commit_sha.assert_called_with(("abc1234", '"etag-1"'))
+
+            # A new commit on the branch is downloaded again
+            mock_downloader_instance.get_commit_sha.return_value = ("def5678", '"etag-2"')
+            launcher.download_repository(
+                repo_owner="test-org", repo_name="test-repo", extract_to=temp_dir, reuse_if_unchanged=True
+            )
+
+            self.assertEqual(mock_downloader_instance.download_and_extract_folder.call_count, 2)
+
     @patch("sempy.fabric")
     @patch("fabric_launcher.launcher.FabricDeployer")
     def test_deploy_artifacts(self, mock_deployer_class, mock_fabric):
@@ -205,6 +236,60 @@ class TestFabricLauncherMethods(unittest.TestCase):
             # Verify deploy_items was called with item types
             mock_deployer_instance.deploy_items.assert_called_once_with(["Lakehouse", "Notebook"])
 
+    @patch("sempy.fabric")
+    def test_deploy_with_retry_stops_once_stage_failed(self, mock_fabric):
+        """Test that a failure is re-raised without retrying once the stage has failed elsewhere."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        deployer = Mock()
+        deployer.deploy_items.side_effect = RuntimeError("Workspace unavailable")
+        stage_failed = threading.Event()
+        stage_failed.set()
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+
+        with patch("time.sleep") as mock_sleep, self.assertRaises(RuntimeError):
+            launcher._deploy_with_retry(deployer, ["Lakehouse"], retries_remaining=2, stop_retrying=stage_failed)
+
+        deployer.deploy_items.assert_called_once_with(["Lakehouse"])
+        mock_sleep.assert_not_called()
+
+    @patch("sempy.fabric")
+    def test_deploy_with_retry_backs_off_with_jitter(self, mock_fabric):
+        """Test that retries wait a random, exponentially growing and capped time."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        deployer = Mock()
+        deployer.deploy_items.side_effect = [RuntimeError("Busy")] * 4 + [None]
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+
+        with (
+            patch("time.sleep"),
+            patch("fabric_launcher.launcher.random.uniform", side_effect=lambda _low, high: high) as mock_uniform,
+        ):
+            launcher._deploy_with_retry(deployer, ["Lakehouse"], retries_remaining=4)
+
+        self.assertEqual([call.args for call in mock_uniform.call_args_list], [(0, 10), (0, 20), (0, 40), (0, 60)])
+        self.assertTrue(deployer.allow_non_empty_workspace)
+
+    @patch("sempy.fabric")
+    def test_deploy_with_retry_does_not_retry_authentication_errors(self, mock_fabric):
+        """Test that authentication and permission failures are re-raised without retrying."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+
+        for error in (RuntimeError("401 Unauthorized"), PermissionError("Forbidden: insufficient privileges")):
+            deployer = Mock()
+            deployer.deploy_items.side_effect = error
+
+            with patch("time.sleep") as mock_sleep, self.assertRaises(type(error)):
+                launcher._deploy_with_retry(deployer, ["Lakehouse"], retries_remaining=2)
+
+            deployer.deploy_items.assert_called_once()
+            mock_sleep.assert_not_called()
+
     @patch("sempy.fabric")
     def test_download_config_from_github_static_method(self, mock_fabric):
         """Test download_config_from_github static method."""
@@ -222,6 +307,34 @@ class TestFabricLauncherMethods(unittest.TestCase):
             self.assertEqual(result, "/tmp/config.yaml")
 
 
+class TestFabricLauncherDeploymentConfig(unittest.TestCase):
+    """Test cases for the deployment_config property."""
+
+    @patch("sempy.fabric")
+    def test_deployment_config_built_fresh_on_each_access(self, mock_fabric):
+        """Test that deployment_config follows the current config and environment on every access."""
+        launcher = FabricLauncher(Mock())
+        launcher.config = Mock(config={"github": {}})
+        launcher.config.get_github_config.return_value = {"repo_owner": "test-org"}
+
+        first = launcher.deployment_config
+        first["github"]["repo_owner"] = "changed-by-caller"
+        launcher.config.get_github_config.return_value = {"repo_owner": "test-org"}
+        self.assertEqual(launcher.deployment_config["github"]["repo_owner"], "test-org")
+
+        launcher.environment = "PROD"
+        self.assertIsNotNone(launcher.deployment_config)
+        launcher.config.get_github_config.assert_called_with(environment="PROD")
+        self.assertEqual(launcher.config.get_github_config.call_count, 3)
+
+    @patch("sempy.fabric")
+    def test_deployment_config_without_config(self, mock_fabric):
+        """Test that deployment_config is None when no config was loaded."""
+        launcher = FabricLauncher(Mock())
+
+        self.assertIsNone(launcher.deployment_config)
+
+
 class TestFabricLauncherDownloadAndDeploy(unittest.TestCase):
     """Test download_and_deploy workflow."""
 
@@ -267,6 +380,10 @@ class TestFabricLauncherDownloadAndDeploy(unittest.TestCase):
             # Verify report steps were added
             self.assertTrue(mock_report_instance.add_step.called)
 
+            # The repository is downloaded again unless reuse_if_unchanged is set
+            mock_downloader_instance.get_commit_sha.assert_not_called()
+            mock_downloader_instance.download_and_extract_folder.assert_called_once()
+
     @patch("sempy.fabric")
     def test_download_and_deploy_missing_params(self, mock_fabric):
         """Test download_and_deploy with missing required parameters."""
@@ -389,6 +506,234 @@ class TestFabricLauncherDownloadAndDeploy(unittest.TestCase):
             # Verify deploy_items was called once with the single stage
             mock_deployer_instance.deploy_items.assert_called_once_with(["Lakehouse", "Notebook"])
 
+    @patch("sempy.fabric")
+    @patch("fabric_launcher.launcher.GitHubDownloader")
+    @patch("fabric_launcher.launcher.FabricDeployer")
+    @patch("fabric_launcher.launcher.DeploymentReport")
+    def test_download_and_deploy_parallel_within_stage(
+        self, mock_report_class, mock_deployer_class, mock_downloader_class, mock_fabric
+    ):
+        """Test that parallel_within_stage deploys each item type of a stage with its own deployer."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        mock_deployer_instance = Mock()
+        mock_deployer_class.return_value = mock_deployer_instance
+        mock_report_class.return_value = Mock(session_id="20241122_120000")
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            launcher.download_and_deploy(
+                repo_owner="test-org",
+                repo_name="test-repo",
+                extract_to=temp_dir,
+                item_type_stages=[["Lakehouse", "Eventhouse", "KQLDatabase"], ["Notebook"]],
+                validate_after_deployment=False,
+                parallel_within_stage=4,
+            )
+
+        # One shared deployer plus one per item type in the parallel stage
+        self.assertEqual(mock_deployer_class.call_count, 4)
+        mock_deployer_instance._prepare_deployment.assert_called_once()
+        deployed = sorted(call[0][0][0] for call in mock_deployer_instance.deploy_items.call_args_list)
+        self.assertEqual(deployed, ["Eventhouse", "KQLDatabase", "Lakehouse", "Notebook"])
+        # The single-type stage runs on the shared deployer after the parallel stage
+        self.assertEqual(mock_deployer_instance.deploy_items.call_args_list[-1][0][0], ["Notebook"])
+
+    @patch("sempy.fabric")
+    @patch("fabric_launcher.launcher.GitHubDownloader")
+    @patch("fabric_launcher.launcher.FabricDeployer")
+    @patch("fabric_launcher.launcher.DeploymentReport")
+    def test_download_and_deploy_parallel_stage_failure_stops_later_stages(
+        self, mock_report_class, mock_deployer_class, mock_downloader_class, mock_fabric
+    ):
+        """Test that a failing item type in a parallel stage stops the deployment at the stage barrier."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        def deploy_items(item_types):
+            if item_types == ["Eventhouse"]:
+                raise RuntimeError("Eventhouse deployment failed")
+
+        mock_deployer_instance = Mock()
+        mock_deployer_instance.deploy_items.side_effect = deploy_items
+        mock_deployer_class.return_value = mock_deployer_instance
+        mock_report_class.return_value = Mock(session_id="20241122_120000")
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+
+        with tempfile.TemporaryDirectory() as temp_dir, self.assertRaises(RuntimeError):
+            launcher.download_and_deploy(
+                repo_owner="test-org",
+                repo_name="test-repo",
+                extract_to=temp_dir,
+                item_type_stages=[["Lakehouse", "Eventhouse"], ["Notebook"]],
+                deployment_retries=0,
+                parallel_within_stage=2,
+            )
+
+        deployed = [call[0][0] for call in mock_deployer_instance.deploy_items.call_args_list]
+        self.assertNotIn(["Notebook"], deployed)
+
+    @patch("sempy.fabric")
+    @patch("fabric_launcher.launcher.GitHubDownloader")
+    @patch("fabric_launcher.launcher.FabricDeployer")
+    @patch("fabric_launcher.launcher.DeploymentReport")
+    def test_download_and_deploy_parallel_stage_reports_all_failures(
+        self, mock_report_class, mock_deployer_class, mock_downloader_class, mock_fabric
+    ):
+        """Test that several failing item types in one parallel stage are reported together."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def deploy_items(item_types):
+            # Both item types start before either fails, so neither is cancelled
+            barrier.wait()
+            raise RuntimeError(f"{item_types[0]} deployment failed")
+
+        mock_deployer_instance = Mock()
+        mock_deployer_instance.deploy_items.side_effect = deploy_items
+        mock_deployer_class.return_value = mock_deployer_instance
+        mock_report_class.return_value = Mock(session_id="20241122_120000")
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+
+        with tempfile.TemporaryDirectory() as temp_dir, self.assertRaises(RuntimeError) as context:
+            launcher.download_and_deploy(
+                repo_owner="test-org",
+                repo_name="test-repo",
+                extract_to=temp_dir,
+                item_type_stages=[["Lakehouse", "Eventhouse"]],
+                deployment_retries=0,
+                parallel_within_stage=2,
+            )
+
+        self.assertIn("2 item types failed", str(context.exception))
+        self.assertIn("Lakehouse deployment failed", str(context.exception))
+        self.assertIn("Eventhouse deployment failed", str(context.exception))
+
+    @patch("sempy.fabric")
+    @patch("fabric_launcher.launcher.FabricDeployer")
+    def test_parallel_stage_interrupt_wakes_workers_waiting_to_retry(self, mock_deployer_class, mock_fabric):
+        """Test that interrupting a parallel stage does not wait for pending retry backoffs."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        mock_deployer_instance = Mock()
+        mock_deployer_instance.deploy_items.side_effect = RuntimeError("Busy")
+        mock_deployer_class.return_value = mock_deployer_instance
+
+        retry_scheduled = threading.Event()
+
+        def uniform(_low, _high):
+            retry_scheduled.set()
+            return 30
+
+        def interrupted_wait(*_args, **_kwargs):
+            retry_scheduled.wait(timeout=5)
+            raise KeyboardInterrupt
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+        launcher._fabric_deployer = mock_deployer_instance
+
+        started = time.monotonic()
+        with (
+            patch("fabric_launcher.launcher.random.uniform", side_effect=uniform),
+            patch("fabric_launcher.launcher.wait", side_effect=interrupted_wait),
+            self.assertRaises(KeyboardInterrupt),
+        ):
+            launcher._deploy_stage_in_parallel(["Lakehouse"], 1, retries_remaining=2, stage_description="Stage 1")
+
+        self.assertLess(time.monotonic() - started, 5)
+        mock_deployer_instance.deploy_items.assert_called_once_with(["Lakehouse"])
+
+    @patch("sempy.fabric")
+    @patch("fabric_launcher.launcher.GitHubDownloader")
+    @patch("fabric_launcher.launcher.FabricDeployer")
+    @patch("fabric_launcher.launcher.DeploymentReport")
+    def test_download_and_deploy_auto_stage(
+        self, mock_report_class, mock_deployer_class, mock_downloader_class, mock_fabric
+    ):
+        """Test that auto_stage derives item_type_stages from item type dependencies."""
+        mock_fabric.get_workspace_id.return_value = "test-workspace-id"
+
+        mock_deployer_instance = Mock()
+        mock_deployer_class.return_value = mock_deployer_instance
+        mock_report_class.return_value = Mock(session_id="20241122_120000")
+
+        launcher = FabricLauncher(self.mock_notebookutils)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            launcher.download_and_deploy(
+                repo_owner="test-org",
+                repo_name="test-repo",
+                extract_to=temp_dir,
+                item_types=["Report", "Lakehouse", "SemanticModel"],
+                validate_after_deployment=False,
+                auto_stage=True,
+            )
+
+        calls = mock_deployer_instance.deploy_items.call_args_list
+        self.assertEqual([call[0][0] for call in calls], [["Lakehouse"], ["SemanticModel"], ["Report"]])
+
+
+class TestFabricLauncherDataFolders(unittest.TestCase):
+    """Test cases for data folder discovery in the extracted repository."""
+
+    @patch("sempy.fabric")
+    def test_list_data_folders_with_paths(self, mock_fabric):
+        """Test that folders are listed with paths and resolved by get_data_folder_path."""
+        launcher = FabricLauncher(Mock())
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "data").mkdir()
+            (Path(temp_dir) / "samples").mkdir()
+            (Path(temp_dir) / "README.md").write_text("readme")
+            launcher._fabric_deployer = Mock(repository_directory=temp_dir)
+
+            folders = launcher.list_data_folders_with_paths()
+
+            self.assertEqual(
+                folders, {"data": str(Path(temp_dir) / "data"), "samples": str(Path(temp_dir) / "samples")}
+            )
+            self.assertEqual(sorted(launcher.list_data_folders()), ["data", "samples"])
+
+            self.assertEqual(launcher.get_data_folder_path("data"), str(Path(temp_dir) / "data"))
+            self.assertEqual(launcher.get_data_folder_path("README.md"), str(Path(temp_dir) / "README.md"))
+            self.assertIsNone(launcher.get_data_folder_path("missing"))
+
+            # Folders removed after listing are no longer reported
+            (Path(temp_dir) / "samples").rmdir()
+            self.assertIsNone(launcher.get_data_folder_path("samples"))
+
+    @patch("sempy.fabric")
+    def test_iter_data_files(self, mock_fabric):
+        """Test recursive listing of data files by suffix."""
+        launcher = FabricLauncher(Mock())
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir) / "data"
+            (data_dir / "nested").mkdir(parents=True)
+            (data_dir / "a.csv").write_text("a")
+            (data_dir / "b.json").write_text("{}")
+            (data_dir / "nested" / "c.csv").write_text("c")
+            launcher._fabric_deployer = Mock(repository_directory=temp_dir)
+
+            self.assertEqual(
+                sorted(launcher.iter_data_files("data", ".csv")),
+                [str(data_dir / "a.csv"), str(data_dir / "nested" / "c.csv")],
+            )
+            self.assertEqual(len(list(launcher.iter_data_files("data", (".csv", ".json")))), 3)
+            self.assertEqual(list(launcher.iter_data_files("missing", ".csv")), [])
+
+    @patch("sempy.fabric")
+    def test_list_data_folders_not_downloaded(self, mock_fabric):
+        """Test folder listing before any repository was downloaded."""
+        launcher = FabricLauncher(Mock())
+
+        self.assertEqual(launcher.list_data_folders_with_paths(), {})
+        self.assertEqual(launcher.list_data_folders(), [])
+        self.assertIsNone(launcher.get_data_folder_path("data"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,42 @@
+"""
+Unit tests for the fabric_launcher package exports.
+"""
+
+import sys
+import unittest
+
+import fabric_launcher
+
+
+class TestPackageExports(unittest.TestCase):
+    """Test cases for the lazily imported package exports."""
+
+    def test_all_exports_resolve_to_their_submodule(self):
+        """Test that every name in __all__ is importable from the package."""
+        for name in fabric_launcher.__all__:
+            with self.subTest(name=name):
+                value = getattr(fabric_launcher, name)
+                module_name = fabric_launcher._LAZY_EXPORTS[name]
+                self.assertIs(value, getattr(getattr(fabric_launcher, module_name), name))
+
+    def test_submodules_are_reachable_as_attributes(self):
+        """Test that submodules resolve as package attributes, e.g. fabric_launcher.post_deployment_utils."""
+        for module_name in sorted(fabric_launcher._SUBMODULES):
+            with self.subTest(module=module_name):
+                # Drop the attribute the import system sets, so __getattr__ has to resolve it
+                module = vars(fabric_launcher).pop(module_name, None)
+                if module is not None:
+                    self.addCleanup(setattr, fabric_launcher, module_name, module)
+
+                value = getattr(fabric_launcher, module_name)
+
+                self.assertIs(value, sys.modules[f"fabric_launcher.{module_name}"])
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """Test that names outside the public API are not resolved."""
+        with self.assertRaises(AttributeError):
+            fabric_launcher.not_a_real_export  # noqa: B018
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,7 @@ from unittest.mock import Mock
 import pytest
 
 from fabric_launcher.post_deployment_utils import (
+    compile_logical_id_replacer,
     create_accelerated_shortcut_in_kql_db,
     create_or_update_fabric_item,
     create_shortcut,
@@ -23,8 +24,11 @@ from fabric_launcher.post_deployment_utils import (
     get_kusto_query_uri,
     get_sql_endpoint,
     move_item_to_folder,
+    move_item_to_folder_by_id,
+    prefetch_workspace_index,
     replace_logical_ids,
     scan_logical_ids,
+    scan_logical_ids_iter,
 )
 
 
@@ -175,6 +179,50 @@ class TestScanLogicalIds:
 
         assert len(result) == 0
 
+    def test_scan_logical_ids_lists_workspace_once(self, temp_repo_dir, mock_client, workspace_id):
+        """Test that workspace items are listed once for all .platform files."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "value": [{"displayName": "Test Notebook", "type": "Notebook", "id": "actual-notebook-id-789"}]
+        }
+        mock_client.get.return_value = mock_response
+
+        result = scan_logical_ids(temp_repo_dir, workspace_id, mock_client)
+
+        assert result == {"logical-id-123": "actual-notebook-id-789"}
+        mock_client.get.assert_called_once_with(f"v1/workspaces/{workspace_id}/items")
+
+    def test_scan_logical_ids_iter_yields_pairs(self, temp_repo_dir, mock_client, workspace_id):
+        """Test that the streaming form yields (logical ID, actual ID) pairs."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "value": [
+                {"displayName": "Test Notebook", "type": "Notebook", "id": "actual-notebook-id-789"},
+                {"displayName": "Test Lakehouse", "type": "Lakehouse", "id": "actual-lakehouse-id-012"},
+            ]
+        }
+        mock_client.get.return_value = mock_response
+
+        pairs = scan_logical_ids_iter(temp_repo_dir, workspace_id, mock_client)
+
+        mock_client.get.assert_not_called()
+        assert sorted(pairs) == [
+            ("lakehouse-logical-456", "actual-lakehouse-id-012"),
+            ("logical-id-123", "actual-notebook-id-789"),
+        ]
+
+    def test_scan_logical_ids_listing_failure(self, temp_repo_dir, mock_client, workspace_id):
+        """Test that a failed workspace listing results in no mappings."""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_client.get.return_value = mock_response
+
+        result = scan_logical_ids(temp_repo_dir, workspace_id, mock_client)
+
+        assert result == {}
+
 
 class TestReplaceLogicalIds:
     """Tests for replace_logical_ids function."""
@@ -205,6 +253,26 @@ class TestReplaceLogicalIds:
         assert result == definition
 
 
+class TestCompileLogicalIdReplacer:
+    """Tests for compile_logical_id_replacer function."""
+
+    def test_replaces_all_ids_in_one_pass(self):
+        """Test that every logical ID is replaced and replacements are not re-scanned."""
+        replacer = compile_logical_id_replacer({"id-a": "id-b", "id-b": "id-c"})
+
+        assert replacer("id-a and id-b") == "id-b and id-c"
+
+    def test_prefers_longest_overlapping_id(self):
+        """Test that an ID which is a prefix of another does not split the longer match."""
+        replacer = compile_logical_id_replacer({"abc": "short", "abc-def": "long"})
+
+        assert replacer("abc-def abc") == "long short"
+
+    def test_empty_map_returns_text_unchanged(self):
+        """Test that an empty map yields an identity replacer."""
+        assert compile_logical_id_replacer({})("logical-id-123") == "logical-id-123"
+
+
 class TestCreateOrUpdateFabricItem:
     """Tests for create_or_update_fabric_item function."""
 
@@ -345,6 +413,51 @@ class TestMoveItemToFolder:
         assert result is False
 
 
+class TestPrefetchWorkspaceIndex:
+    """Tests for prefetch_workspace_index and move_item_to_folder_by_id."""
+
+    def test_prefetch_follows_continuation_token(self, mock_client, workspace_id):
+        """Test that folders and items are listed once each, across pages."""
+        folders_page = Mock(status_code=200)
+        folders_page.json.return_value = {"value": [{"displayName": "Analytics", "id": "folder-1"}]}
+        items_page_1 = Mock(status_code=200)
+        items_page_1.json.return_value = {
+            "value": [{"displayName": "Sales", "type": "Report", "id": "item-1"}],
+            "continuationToken": "a+b/c=&d",
+        }
+        items_page_2 = Mock(status_code=200)
+        items_page_2.json.return_value = {"value": [{"displayName": "ETL", "type": "Notebook", "id": "item-2"}]}
+        mock_client.get.side_effect = [folders_page, items_page_1, items_page_2]
+
+        folders, items = prefetch_workspace_index(workspace_id, mock_client)
+
+        assert folders == {"Analytics": "folder-1"}
+        assert items == {("Sales", "Report"): "item-1", ("ETL", "Notebook"): "item-2"}
+        assert mock_client.get.call_args_list[2].args[0] == (
+            f"v1/workspaces/{workspace_id}/items?continuationToken=a%2Bb%2Fc%3D%26d"
+        )
+
+    def test_prefetch_list_failure(self, mock_client, workspace_id):
+        """Test that a failed listing raises RuntimeError."""
+        mock_client.get.return_value = Mock(status_code=500)
+
+        with pytest.raises(RuntimeError, match="HTTP 500"):
+            prefetch_workspace_index(workspace_id, mock_client)
+
+    def test_move_item_to_folder_by_id(self, mock_client, workspace_id):
+        """Test moving an item by ID without any lookups."""
+        mock_client.post.return_value = Mock(status_code=200)
+
+        assert move_item_to_folder_by_id("item-1", "folder-1", workspace_id, mock_client) is True
+        mock_client.get.assert_not_called()
+        mock_client.post.assert_called_once_with(
+            f"v1/workspaces/{workspace_id}/items/item-1/move", json={"targetFolderId": "folder-1"}
+        )
+
+        mock_client.post.return_value = Mock(status_code=400, text="Bad request")
+        assert move_item_to_folder_by_id("item-1", "folder-1", workspace_id, mock_client) is False
+
+
 class TestGetKustoQueryUri:
     """Tests for get_kusto_query_uri function."""
 